@@ -10,6 +10,8 @@ from langchain_google_community import (
 from langchain_google_community.calendar.utils import build_resource_service, get_google_credentials
 
 from app.utils.env_constants import GOOGLE_CREDENTIALS_PATH
+from app.utils.rate_limit_constants import GOOGLE_CALENDAR_PROVIDER
+from app.utils.rate_limiter import rate_limit_tool
 
 google_credentials = get_google_credentials(
     client_secrets_file=GOOGLE_CREDENTIALS_PATH,
@@ -18,19 +20,29 @@ google_credentials = get_google_credentials(
 api_resource = build_resource_service(google_credentials, service_name="calendar", service_version="v3")
 
 def get_calendar_create_event_tool() -> BaseTool:
-    return CalendarCreateEvent.from_api_resource(api_resource)
+    return rate_limit_tool(
+        CalendarCreateEvent.from_api_resource(api_resource), GOOGLE_CALENDAR_PROVIDER
+    )
 
 def get_calendar_delete_event_tool() -> BaseTool:
-    return CalendarDeleteEvent.from_api_resource(api_resource)
+    return rate_limit_tool(
+        CalendarDeleteEvent.from_api_resource(api_resource), GOOGLE_CALENDAR_PROVIDER
+    )
 
 def get_calendar_update_event_tool() -> BaseTool:
-    return CalendarUpdateEvent.from_api_resource(api_resource)
+    return rate_limit_tool(
+        CalendarUpdateEvent.from_api_resource(api_resource), GOOGLE_CALENDAR_PROVIDER
+    )
 
 def get_calendar_search_events_tool() -> BaseTool:
-    return CalendarSearchEvents.from_api_resource(api_resource)
+    return rate_limit_tool(
+        CalendarSearchEvents.from_api_resource(api_resource), GOOGLE_CALENDAR_PROVIDER
+    )
 
 def get_calendars_info_tool() -> BaseTool:
-    return GetCalendarsInfo.from_api_resource(api_resource)
+    return rate_limit_tool(
+        GetCalendarsInfo.from_api_resource(api_resource), GOOGLE_CALENDAR_PROVIDER
+    )
 
 def get_current_datetime_tool() -> BaseTool:
     return GetCurrentDatetime.from_api_resource(api_resource)
\ No newline at end of file
@@ -10,8 +10,52 @@ NAVER_CAFE_SEARCH_TOOL_NAME = "naver_cafe_search"
 NAVER_CAFE_SEARCH_TOOL_DESCRIPTION = "Search Naver cafe for a query."
 
 NAVER_SEARCH_DISPLAY_COUNT = 10
+NAVER_SEARCH_CACHE_TTL = 60 * 60 * 6
 
 WEB_LOADER_TOOL_NAME = "web_loader"
 WEB_LOADER_TOOL_DESCRIPTION = """
 Load page contents from max 3 URLs which is retrieved from Naver Blog Search or Naver Cafe Search.
-"""
\ No newline at end of file
+Pass what you are looking for as query to get only the relevant parts of the pages.
+"""
+WEB_LOADER_BROWSER_CONTEXTS = 2
+WEB_LOADER_MAX_CONCURRENT_PAGES = 3
+WEB_LOADER_RECYCLE_AFTER_PAGES = 50
+WEB_LOADER_PAGE_TIMEOUT_MS = 30000
+
+WEB_LOADER_CACHE_FILE = "web_loader_pages.sqlite3"
+WEB_LOADER_CACHE_TTL = 60 * 60 * 24
+WEB_LOADER_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+WEB_LOADER_STATIC_MIN_CHARS = 200
+WEB_LOADER_CONTENT_SELECTORS = (
+    "div.se-main-container",
+    "div#viewTypeSelector",
+    "div#postViewArea",
+    "div.post_ct",
+)
+WEB_LOADER_SCRIPT_GATE_MARKERS = (
+    "자바스크립트를 활성화",
+    "JavaScript를 사용",
+    "enable JavaScript",
+)
+WEB_LOADER_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+)
+
+WEB_LOADER_CHUNK_CHARS = 600
+WEB_LOADER_TOP_K_CHUNKS = 8
+WEB_LOADER_TOKEN_BUDGET = 3000
+WEB_LOADER_BOILERPLATE_PATTERNS = (
+    r"공감(\s*\d+)?",
+    r"댓글(\s*\d+)?",
+    r"이웃추가",
+    r"URL 복사",
+    r"본문 기타 기능",
+    r"신고하기",
+    r"(블로그|카페) 앱으로 보기",
+    r"카테고리 이동",
+    r"맨 위로",
+    r"(이전|다음)\s*글",
+    r"(광고|AD|Sponsored)",
+)
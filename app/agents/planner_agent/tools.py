@@ -1,10 +1,8 @@
-from typing import Annotated, Dict, List, Union
+from pathlib import Path
+from typing import Annotated, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-import aiohttp
-import requests
-from langchain_community.document_loaders import PlaywrightURLLoader
-from langchain_core.tools import Tool
+from langchain_core.tools import BaseTool, StructuredTool, Tool
 
 from app.agents.planner_agent.constants import (
     NAVER_BLOG_SEARCH_TOOL_DESCRIPTION,
@@ -13,11 +11,75 @@ from app.agents.planner_agent.constants import (
     NAVER_CAFE_SEARCH_TOOL_DESCRIPTION,
     NAVER_CAFE_SEARCH_TOOL_NAME,
     NAVER_CAFE_SEARCH_URL,
+    NAVER_SEARCH_CACHE_TTL,
     NAVER_SEARCH_DISPLAY_COUNT,
+    WEB_LOADER_BOILERPLATE_PATTERNS,
+    WEB_LOADER_BROWSER_CONTEXTS,
+    WEB_LOADER_CACHE_FILE,
+    WEB_LOADER_CACHE_MAX_BYTES,
+    WEB_LOADER_CACHE_TTL,
+    WEB_LOADER_CHUNK_CHARS,
+    WEB_LOADER_CONTENT_SELECTORS,
+    WEB_LOADER_MAX_CONCURRENT_PAGES,
+    WEB_LOADER_PAGE_TIMEOUT_MS,
+    WEB_LOADER_RECYCLE_AFTER_PAGES,
+    WEB_LOADER_SCRIPT_GATE_MARKERS,
+    WEB_LOADER_STATIC_MIN_CHARS,
+    WEB_LOADER_TOKEN_BUDGET,
     WEB_LOADER_TOOL_DESCRIPTION,
     WEB_LOADER_TOOL_NAME,
+    WEB_LOADER_TOP_K_CHUNKS,
+    WEB_LOADER_USER_AGENT,
+)
+from app.utils.browser_pool import LoadedPage, create_browser_pool
+from app.utils.chunk_ranker import RelevantChunkExtractor
+from app.utils.env_constants import CACHE_DIR, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from app.utils.http_client import get_async_http_session, get_http_session
+from app.utils.page_cache import PageCache
+from app.utils.page_loader import TieredPageLoader
+from app.utils.rate_limit_constants import NAVER_PROVIDER, NAVER_WEB_PROVIDER
+from app.utils.rate_limiter import get_rate_limiter, rate_limited
+from app.utils.tool_cache import cache_tool
+
+_browser_pool = create_browser_pool(
+    size=WEB_LOADER_BROWSER_CONTEXTS,
+    max_concurrent_pages=WEB_LOADER_MAX_CONCURRENT_PAGES,
+    recycle_after_pages=WEB_LOADER_RECYCLE_AFTER_PAGES,
+    page_timeout_ms=WEB_LOADER_PAGE_TIMEOUT_MS,
+)
+_page_loader = TieredPageLoader(
+    browser_pool=_browser_pool,
+    content_selectors=WEB_LOADER_CONTENT_SELECTORS,
+    min_static_chars=WEB_LOADER_STATIC_MIN_CHARS,
+    script_gate_markers=WEB_LOADER_SCRIPT_GATE_MARKERS,
+    user_agent=WEB_LOADER_USER_AGENT,
+)
+
+
+def _revalidate_page(url: str, headers: Dict[str, str]) -> Tuple[int, Optional[LoadedPage]]:
+    """Send the conditional request of a cached page under the web rate limit"""
+    get_rate_limiter().acquire(NAVER_WEB_PROVIDER)
+    return _page_loader.revalidate(url, headers)
+
+
+async def _arevalidate_page(url: str, headers: Dict[str, str]) -> Tuple[int, Optional[LoadedPage]]:
+    await get_rate_limiter().aacquire(NAVER_WEB_PROVIDER)
+    return await _page_loader.arevalidate(url, headers)
+
+
+_page_cache = PageCache(
+    path=Path(CACHE_DIR) / WEB_LOADER_CACHE_FILE,
+    ttl_seconds=WEB_LOADER_CACHE_TTL,
+    max_bytes=WEB_LOADER_CACHE_MAX_BYTES,
+    revalidate=_revalidate_page,
+    arevalidate=_arevalidate_page,
+)
+_chunk_extractor = RelevantChunkExtractor(
+    chunk_chars=WEB_LOADER_CHUNK_CHARS,
+    top_k=WEB_LOADER_TOP_K_CHUNKS,
+    token_budget=WEB_LOADER_TOKEN_BUDGET,
+    boilerplate_patterns=WEB_LOADER_BOILERPLATE_PATTERNS,
 )
-from app.utils.env_constants import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
 
 
 def _validate_naver_api_key():
@@ -49,6 +111,7 @@ def _get_naver_request_params(query: str) -> tuple[Dict, Dict]:
     return headers, params
 
 
+@rate_limited(NAVER_PROVIDER)
 def naver_blog_search_sync(query: Annotated[str, "query for naver blog search"]) -> List[Dict]:
     """Naver blog search (synchronous)
 
@@ -62,13 +125,14 @@ def naver_blog_search_sync(query: Annotated[str, "query for naver blog search"])
     headers, params = _get_naver_request_params(query)
 
     try:
-        response = requests.get(NAVER_BLOG_SEARCH_URL, headers=headers, params=params, timeout=10)
+        response = get_http_session().get(NAVER_BLOG_SEARCH_URL, headers=headers, params=params)
         response.raise_for_status()
         return _process_naver_blog_cafe_response(response.json())
     except Exception as e:
         return [{"error": f"Naver blog search error: {str(e)}"}]
 
 
+@rate_limited(NAVER_PROVIDER)
 def naver_cafe_search_sync(query: Annotated[str, "query for naver cafe search"]) -> List[Dict]:
     """Naver cafe search (synchronous)
 
@@ -82,13 +146,14 @@ def naver_cafe_search_sync(query: Annotated[str, "query for naver cafe search"])
     headers, params = _get_naver_request_params(query)
 
     try:
-        response = requests.get(NAVER_CAFE_SEARCH_URL, headers=headers, params=params, timeout=10)
+        response = get_http_session().get(NAVER_CAFE_SEARCH_URL, headers=headers, params=params)
         response.raise_for_status()
         return _process_naver_blog_cafe_response(response.json())
     except Exception as e:
         return [{"error": f"Naver cafe search error: {str(e)}"}]
 
 
+@rate_limited(NAVER_PROVIDER)
 async def naver_blog_search_async(query: Annotated[str, "query for naver blog search"]) -> List[Dict]:
     """Naver blog search (asynchronous)
 
@@ -102,17 +167,16 @@ async def naver_blog_search_async(query: Annotated[str, "query for naver blog se
     headers, params = _get_naver_request_params(query)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                NAVER_BLOG_SEARCH_URL, headers=headers, params=params, timeout=10
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return _process_naver_blog_cafe_response(data)
+        session = get_async_http_session()
+        async with session.get(NAVER_BLOG_SEARCH_URL, headers=headers, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+            return _process_naver_blog_cafe_response(data)
     except Exception as e:
         return [{"error": f"Naver blog search error: {str(e)}"}]
 
 
+@rate_limited(NAVER_PROVIDER)
 async def naver_cafe_search_async(query: Annotated[str, "query for naver cafe search"]) -> List[Dict]:
     """Naver cafe search (asynchronous)
 
@@ -126,13 +190,11 @@ async def naver_cafe_search_async(query: Annotated[str, "query for naver cafe se
     headers, params = _get_naver_request_params(query)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                NAVER_CAFE_SEARCH_URL, headers=headers, params=params, timeout=10
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return _process_naver_blog_cafe_response(data)
+        session = get_async_http_session()
+        async with session.get(NAVER_CAFE_SEARCH_URL, headers=headers, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+            return _process_naver_blog_cafe_response(data)
     except Exception as e:
         return [{"error": f"Naver cafe search error: {str(e)}"}]
 
@@ -150,74 +212,112 @@ def to_mobile_view(url: str) -> str:
     return url
 
 
-def _load_page_content_sync(urls: Annotated[Union[List[str], str], "list of URLs"]) -> List[str]:
+def _get_mobile_urls(urls: Union[List[str], str]) -> List[str]:
+    """Normalize the tool input into a list of mobile view URLs"""
+    if isinstance(urls, str):
+        return [to_mobile_view(urls)]
+    return [to_mobile_view(url) for url in urls]
+
+
+def _load_page_content_sync(
+    urls: Annotated[Union[List[str], str], "list of URLs"],
+    query: Annotated[Optional[str], "what to look for in the pages"] = None,
+) -> List[str]:
     """Load page content from URL (synchronous)
 
     Args:
         urls (List[str]): list of URLs
+        query (Optional[str]): what to look for, used to keep only the relevant chunks
 
     Returns:
         List[str]: list of page contents
     """
     try:
-        if isinstance(urls, str):
-            mobile_urls = [to_mobile_view(urls)]
-        elif isinstance(urls, list):
-            mobile_urls = [to_mobile_view(url) for url in urls]
-        loader = PlaywrightURLLoader(mobile_urls, continue_on_failure=True)
-        docs = loader.load()
-        return [doc.page_content for doc in docs]
+        mobile_urls = _get_mobile_urls(urls)
+        contents: Dict[str, Optional[str]] = {url: _page_cache.get(url) for url in mobile_urls}
+
+        missed_urls = [url for url, content in contents.items() if content is None]
+        if missed_urls:
+            get_rate_limiter().acquire(NAVER_WEB_PROVIDER, tokens=len(missed_urls))
+            for page in _page_loader.load(missed_urls):
+                if page is not None:
+                    _page_cache.put(page.url, page.content, page.etag, page.last_modified)
+                    contents[page.url] = page.content
+
+        pages = [contents[url] for url in mobile_urls if contents[url] is not None]
+        return _chunk_extractor.extract(pages, query)
     except Exception as e:
         return [{"error": f"Web Loader error: {str(e)}"}]
 
 
-async def _load_page_content_async(urls: Annotated[Union[List[str], str], "list of URLs"]) -> List[str]:
+async def _load_page_content_async(
+    urls: Annotated[Union[List[str], str], "list of URLs"],
+    query: Annotated[Optional[str], "what to look for in the pages"] = None,
+) -> List[str]:
     """Load page content from URL (asynchronous)
 
     Args:
         urls (List[str]): list of URLs
+        query (Optional[str]): what to look for, used to keep only the relevant chunks
 
     Returns:
         List[str]: list of page contents
     """
-    contents = []
     try:
-        if isinstance(urls, str):
-            mobile_urls = [to_mobile_view(urls)]
-        elif isinstance(urls, list):
-            mobile_urls = [to_mobile_view(url) for url in urls]
-        mobile_urls = [to_mobile_view(url) for url in urls]
-        loader = PlaywrightURLLoader(mobile_urls, continue_on_failure=True)
-        async for doc in loader.aload():
-            contents.append(doc.page_content)
-        return contents
+        mobile_urls = _get_mobile_urls(urls)
+        contents: Dict[str, Optional[str]] = {}
+        for url in mobile_urls:
+            contents[url] = await _page_cache.aget(url)
+
+        missed_urls = [url for url, content in contents.items() if content is None]
+        if missed_urls:
+            await get_rate_limiter().aacquire(NAVER_WEB_PROVIDER, tokens=len(missed_urls))
+            for page in await _page_loader.aload(missed_urls):
+                if page is not None:
+                    await _page_cache.aput(page.url, page.content, page.etag, page.last_modified)
+                    contents[page.url] = page.content
+
+        pages = [contents[url] for url in mobile_urls if contents[url] is not None]
+        return _chunk_extractor.extract(pages, query)
     except Exception as e:
         return [{"error": f"Web Loader error: {str(e)}"}]
 
 
-def get_naver_blog_search_tool() -> Tool:
+def get_web_loader_stats() -> Dict:
+    """Return the cache, tier, chunk extraction and browser pool stats of the web loader"""
+    return {
+        "cache": _page_cache.get_stats(),
+        "tiers": _page_loader.get_stats(),
+        "chunks": _chunk_extractor.get_stats(),
+        "browser_pool": _browser_pool.get_stats(),
+    }
+
+
+def get_naver_blog_search_tool() -> BaseTool:
     """Return Naver blog search tool"""
-    return Tool.from_function(
+    tool = Tool.from_function(
         name=NAVER_BLOG_SEARCH_TOOL_NAME,
         func=naver_blog_search_sync,
         coroutine=naver_blog_search_async,
         description=NAVER_BLOG_SEARCH_TOOL_DESCRIPTION,
     )
+    return cache_tool(tool, ttl_seconds=NAVER_SEARCH_CACHE_TTL)
 
 
-def get_naver_cafe_search_tool() -> Tool:
+def get_naver_cafe_search_tool() -> BaseTool:
     """Return Naver cafe search tool"""
-    return Tool.from_function(
+    tool = Tool.from_function(
         name=NAVER_CAFE_SEARCH_TOOL_NAME,
         func=naver_cafe_search_sync,
         coroutine=naver_cafe_search_async,
         description=NAVER_CAFE_SEARCH_TOOL_DESCRIPTION,
     )
+    return cache_tool(tool, ttl_seconds=NAVER_SEARCH_CACHE_TTL)
 
 
-def get_web_loader_tool() -> Tool:
+def get_web_loader_tool() -> StructuredTool:
     """Return Web loader tool"""
-    return Tool.from_function(
+    return StructuredTool.from_function(
         name=WEB_LOADER_TOOL_NAME,
         func=_load_page_content_sync,
         coroutine=_load_page_content_async,
@@ -230,4 +330,9 @@ if __name__ == "__main__":
     #tool = get_naver_cafe_search_tool()
     #print(tool.invoke("로마 6월 여행 계획"))
     tool = get_web_loader_tool()
-    print(tool.invoke({"urls": ["https://blog.naver.com/mjkwon7471/223904255047"]} ))
\ No newline at end of file
+    print(
+        tool.invoke(
+            {"urls": ["https://blog.naver.com/mjkwon7471/223904255047"], "query": "파리 맛집"}
+        )
+    )
+    print(get_web_loader_stats())
\ No newline at end of file
@@ -1,6 +1,5 @@
 from langchain_core.language_models import BaseChatModel
 from langgraph.graph.graph import CompiledGraph
-from langgraph.prebuilt import create_react_agent
 
 from app.agents.research_agent.constants import AGENT_NAME, AGENT_PROMPT_NAME
 from app.agents.research_agent.tools import (
@@ -9,7 +8,10 @@ from app.agents.research_agent.tools import (
     get_tavily_search_tool,
     get_wikipedia_tool,
 )
+from app.utils.create_react_agent import create_react_agent
+from app.utils.env_constants import TOOL_HISTORY_DIGEST
 from app.utils.langsmith_manger import LangSmithManager
+from app.utils.tool_history import get_tool_history_policy
 
 _langsmith_manager = LangSmithManager()
 
@@ -26,6 +28,7 @@ def get_research_agent(
             get_gplaces_search_tool(),
         ],
         prompt=_langsmith_manager.get_agent_prompt(AGENT_PROMPT_NAME),
+        tool_history_policy=get_tool_history_policy() if TOOL_HISTORY_DIGEST else None,
         name=AGENT_NAME,
     )
 
@@ -4,10 +4,11 @@ AGENT_NAME = "research_agent"
 KAKAO_LOCAL_SEARCH_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
 KAKAO_LOCAL_SEARCH_TOOL_NAME = "kakao_local_search"
 KAKAO_LOCAL_SEARCH_TOOL_DESCRIPTION = "국내 장소를 검색하고 상세 정보를 조회합니다."
+KAKAO_LOCAL_SEARCH_CACHE_TTL = 60 * 60 * 24
 
 WIKIPEDIA_SEARCH_TOOL_NAME = "wikipedia_search"
 WIKIPEDIA_SEARCH_TOOL_DESCRIPTION = "위키피디아에서 장소의 역사적, 문화적 배경 정보를 검색합니다."
+WIKIPEDIA_SEARCH_CACHE_TTL = 60 * 60 * 24 * 7
 
-
-
-
+TAVILY_SEARCH_CACHE_TTL = 60 * 60
+GPLACES_SEARCH_CACHE_TTL = 60 * 60 * 24
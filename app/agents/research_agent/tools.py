@@ -1,7 +1,5 @@
 from typing import Annotated, Dict, List
 
-import aiohttp
-import requests
 from langchain_community.retrievers import WikipediaRetriever
 from langchain_core.documents import Document
 from langchain_core.tools import BaseTool, Tool
@@ -9,13 +7,26 @@ from langchain_google_community import GooglePlacesTool
 from langchain_tavily import TavilySearch
 
 from app.agents.research_agent.constants import (
+    GPLACES_SEARCH_CACHE_TTL,
+    KAKAO_LOCAL_SEARCH_CACHE_TTL,
     KAKAO_LOCAL_SEARCH_TOOL_DESCRIPTION,
     KAKAO_LOCAL_SEARCH_TOOL_NAME,
     KAKAO_LOCAL_SEARCH_URL,
+    TAVILY_SEARCH_CACHE_TTL,
+    WIKIPEDIA_SEARCH_CACHE_TTL,
     WIKIPEDIA_SEARCH_TOOL_DESCRIPTION,
     WIKIPEDIA_SEARCH_TOOL_NAME,
 )
 from app.utils.env_constants import KAKAO_REST_API_KEY
+from app.utils.http_client import get_async_http_session, get_http_session
+from app.utils.rate_limit_constants import (
+    GOOGLE_PLACES_PROVIDER,
+    KAKAO_PROVIDER,
+    TAVILY_PROVIDER,
+    WIKIPEDIA_PROVIDER,
+)
+from app.utils.rate_limiter import rate_limit_tool, rate_limited
+from app.utils.tool_cache import cache_tool
 
 
 def _validate_api_key():
@@ -47,6 +58,7 @@ def _get_request_params(query: str) -> tuple[Dict, Dict]:
     return headers, params
 
 
+@rate_limited(KAKAO_PROVIDER)
 def kakao_search_sync(query: Annotated[str, "query for kakao search"]) -> List[Dict]:
     """Search points‑of‑interest via Kakao Local keyword search API (Synchronous).
 
@@ -60,13 +72,14 @@ def kakao_search_sync(query: Annotated[str, "query for kakao search"]) -> List[D
     headers, params = _get_request_params(query)
 
     try:
-        resp = requests.get(KAKAO_LOCAL_SEARCH_URL, headers=headers, params=params, timeout=10)
+        resp = get_http_session().get(KAKAO_LOCAL_SEARCH_URL, headers=headers, params=params)
         resp.raise_for_status()
         return _process_kakao_response(resp.json())
     except Exception as e:
         return [{"error": f"Kakao search error: {str(e)}"}]
 
 
+@rate_limited(KAKAO_PROVIDER)
 async def kakao_search_async(query: Annotated[str, "query for kakao search"]) -> List[Dict]:
     """Search points‑of‑interest via Kakao Local keyword search API (Asynchronous).
 
@@ -80,26 +93,26 @@ async def kakao_search_async(query: Annotated[str, "query for kakao search"]) ->
     headers, params = _get_request_params(query)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                KAKAO_LOCAL_SEARCH_URL, headers=headers, params=params, timeout=10
-            ) as resp:
-                resp.raise_for_status()
-                return _process_kakao_response(await resp.json())
+        session = get_async_http_session()
+        async with session.get(KAKAO_LOCAL_SEARCH_URL, headers=headers, params=params) as resp:
+            resp.raise_for_status()
+            return _process_kakao_response(await resp.json())
     except Exception as e:
         return [{"error": f"Kakao search error: {str(e)}"}]
 
 
-def get_kakao_search_tool() -> Tool:
+def get_kakao_search_tool() -> BaseTool:
     """Return Kakao search tool"""
-    return Tool.from_function(
+    tool = Tool.from_function(
         name=KAKAO_LOCAL_SEARCH_TOOL_NAME,
         func=kakao_search_sync,
         coroutine=kakao_search_async,
         description=KAKAO_LOCAL_SEARCH_TOOL_DESCRIPTION,
     )
+    return cache_tool(tool, ttl_seconds=KAKAO_LOCAL_SEARCH_CACHE_TTL)
 
 
+@rate_limited(WIKIPEDIA_PROVIDER)
 def wikipedia_search_sync(query: Annotated[str, "query for wikipedia search"]) -> List[Document]:
     try:
         retriever = WikipediaRetriever(top_k_results=3, lang="ko")
@@ -108,23 +121,26 @@ def wikipedia_search_sync(query: Annotated[str, "query for wikipedia search"]) -
         return [{"error": f"Wikipedia search error: {str(e)}"}]
 
 
-def get_wikipedia_tool() -> Tool:
+def get_wikipedia_tool() -> BaseTool:
     """Return Wikipedia search tool"""
-    return Tool.from_function(
+    tool = Tool.from_function(
         name=WIKIPEDIA_SEARCH_TOOL_NAME,
         func=wikipedia_search_sync,
         description=WIKIPEDIA_SEARCH_TOOL_DESCRIPTION,
     )
+    return cache_tool(tool, ttl_seconds=WIKIPEDIA_SEARCH_CACHE_TTL)
 
 
 def get_tavily_search_tool() -> BaseTool:
     """Return Tavily search tool"""
-    return TavilySearch(max_results=3, topic="general")
+    tool = rate_limit_tool(TavilySearch(max_results=3, topic="general"), TAVILY_PROVIDER)
+    return cache_tool(tool, ttl_seconds=TAVILY_SEARCH_CACHE_TTL)
 
 
 def get_gplaces_search_tool() -> BaseTool:
     """Return Gplaces search tool"""
-    return GooglePlacesTool()
+    tool = rate_limit_tool(GooglePlacesTool(), GOOGLE_PLACES_PROVIDER)
+    return cache_tool(tool, ttl_seconds=GPLACES_SEARCH_CACHE_TTL)
 
 
 if __name__ == "__main__":
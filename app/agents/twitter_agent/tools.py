@@ -17,6 +17,9 @@ from app.utils.env_constants import (
     TWITTER_API_KEY_SECRET,
     TWITTER_BEARER_TOKEN,
 )
+from app.utils.http_client import get_async_http_session, get_http_session
+from app.utils.rate_limit_constants import TWITTER_PROVIDER
+from app.utils.rate_limiter import rate_limited
 
 
 def _markdown_to_text(markdown_string: str) -> str:
@@ -44,23 +47,29 @@ def _get_twitter_client_v2(async_client=False) -> BaseClient:
     """Get Twitter API v2 client using tweepy"""
     _validate_twitter_api_keys()
     if async_client:
-        return AsyncClient(
+        client = AsyncClient(
             consumer_key=TWITTER_API_KEY,
             consumer_secret=TWITTER_API_KEY_SECRET,
             access_token=TWITTER_ACCESS_TOKEN,
             access_token_secret=TWITTER_ACCESS_TOKEN_SECRET,
             bearer_token=TWITTER_BEARER_TOKEN,
-            wait_on_rate_limit=True
+            wait_on_rate_limit=False
         )
-    return Client(
+        # Reuse the pooled session of the running loop instead of tweepy's own one
+        client.session = get_async_http_session()
+        return client
+    client = Client(
         consumer_key=TWITTER_API_KEY,
         consumer_secret=TWITTER_API_KEY_SECRET,
         access_token=TWITTER_ACCESS_TOKEN,
         access_token_secret=TWITTER_ACCESS_TOKEN_SECRET,
         bearer_token=TWITTER_BEARER_TOKEN,
-        wait_on_rate_limit=True
+        wait_on_rate_limit=False
     )
+    client.session = get_http_session()
+    return client
 
+@rate_limited(TWITTER_PROVIDER)
 def post_tweet_sync(text: Annotated[str, "tweet text content"]) -> Dict:
     """Post a tweet to Twitter using tweepy (synchronous)
     
@@ -90,6 +99,7 @@ def post_tweet_sync(text: Annotated[str, "tweet text content"]) -> Dict:
         return {"error": f"Failed to post tweet: {str(e)}"}
 
 
+@rate_limited(TWITTER_PROVIDER)
 async def post_tweet_async(text: Annotated[str, "tweet text content"]) -> Dict:
     """Post a tweet to Twitter using tweepy (asynchronous)
     
@@ -115,6 +125,7 @@ async def post_tweet_async(text: Annotated[str, "tweet text content"]) -> Dict:
     except Exception as e:
         return {"error": f"Failed to post tweet: {str(e)}"}
 
+@rate_limited(TWITTER_PROVIDER)
 def get_user_tweets_sync(_input: Annotated[str, "Meaningless input"]) -> Dict:
     """Get recent tweets with tweet id and text from a user using tweepy (synchronous)
         
@@ -157,6 +168,7 @@ def get_user_tweets_sync(_input: Annotated[str, "Meaningless input"]) -> Dict:
         return {"error": f"Failed to get user tweets: {str(e)}"}
 
 
+@rate_limited(TWITTER_PROVIDER)
 async def get_user_tweets_async(_input: Annotated[str, "Meaningless input"]) -> Dict:
     """Get recent tweets with tweet id and text from a user using tweepy (asynchronous)
     
@@ -196,6 +208,7 @@ async def get_user_tweets_async(_input: Annotated[str, "Meaningless input"]) ->
         return {"error": f"Failed to get user tweets: {str(e)}"}
 
 
+@rate_limited(TWITTER_PROVIDER)
 def delete_tweet_sync(tweet_id: Annotated[str, "ID of the tweet to delete"]) -> Dict:
     """Delete a tweet using tweepy (synchronous)
     
@@ -233,6 +246,7 @@ def delete_tweet_sync(tweet_id: Annotated[str, "ID of the tweet to delete"]) ->
         return {"error": f"Failed to delete tweet: {str(e)}"}
 
 
+@rate_limited(TWITTER_PROVIDER)
 async def delete_tweet_async(tweet_id: Annotated[str, "ID of the tweet to delete"]) -> Dict:
     """Delete a tweet using tweepy (asynchronous)
     
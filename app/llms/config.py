@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -73,6 +73,42 @@ AVAILABLE_MODELS: Dict[str, Dict[str, ModelConfig]] = {
     "Google - Gemini": GEMINI_MODELS
 }
 
+# Agent roles whose model can be routed apart from the selected one
+ROLE_SUPERVISOR = "supervisor"
+ROLE_RESEARCH = "research"
+ROLE_PLANNER = "planner"
+ROLE_CALENDAR = "calendar"
+ROLE_TWITTER = "twitter"
+ROLE_SUMMARIZER = "summarizer"
+AGENT_ROLES = [
+    ROLE_SUPERVISOR,
+    ROLE_RESEARCH,
+    ROLE_PLANNER,
+    ROLE_CALENDAR,
+    ROLE_TWITTER,
+    ROLE_SUMMARIZER,
+]
+
+# Per-role model versions of each provider; roles left out use the selected version.
+# Summaries and structured calendar/twitter tool calls run on the fast model of the provider.
+ROLE_MODELS: Dict[str, Dict[str, str]] = {
+    "OpenAI - ChatGPT": {
+        ROLE_CALENDAR: "GPT-4o-mini",
+        ROLE_TWITTER: "GPT-4o-mini",
+        ROLE_SUMMARIZER: "GPT-4o-mini",
+    },
+    "Anthropic - Claude": {
+        ROLE_CALENDAR: "Claude-3-Haiku",
+        ROLE_TWITTER: "Claude-3-Haiku",
+        ROLE_SUMMARIZER: "Claude-3-Haiku",
+    },
+    "Google - Gemini": {
+        ROLE_CALENDAR: "Gemini 1.5 Flash",
+        ROLE_TWITTER: "Gemini 1.5 Flash",
+        ROLE_SUMMARIZER: "Gemini 1.5 Flash",
+    },
+}
+
 def get_model_versions(model_provider: str) -> List[str]:
     """Return all model versions for a given provider"""
     return list(AVAILABLE_MODELS.get(model_provider, {}).keys())
@@ -82,4 +118,10 @@ def get_model_config(model_provider: str, model_version: str) -> ModelConfig:
     provider_models = AVAILABLE_MODELS.get(model_provider, {})
     if model_version not in provider_models:
         raise ValueError(f"Unsupported model: {model_provider}/{model_version}")
-    return provider_models[model_version] 
\ No newline at end of file
+    return provider_models[model_version] 
+
+def get_role_model_version(
+    model_provider: str, model_version: str, role: Optional[str] = None
+) -> str:
+    """Return the model version a role runs on when the user selected `model_version`"""
+    return ROLE_MODELS.get(model_provider, {}).get(role, model_version)
@@ -0,0 +1,14 @@
+# Model instances kept by the LLM factory, least recently used ones are evicted
+LLM_POOL_SIZE = 16
+
+# HTTP connection pool shared by every model instance of a provider
+LLM_HTTP_MAX_CONNECTIONS = 100
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+LLM_HTTP_KEEPALIVE_EXPIRY = 60
+
+# Endpoints requested at warm-up to open the connections of each provider (the status is ignored)
+LLM_WARM_UP_URLS = {
+    "openai": "https://api.openai.com/v1/models",
+    "anthropic": "https://api.anthropic.com/v1/models",
+}
+LLM_WARM_UP_TIMEOUT = 5
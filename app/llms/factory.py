@@ -1,26 +1,138 @@
-from typing import Any, List
-
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
 import streamlit as st
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from app.llms.config import ModelConfig, get_model_config
+from app.llms.constants import (
+    LLM_HTTP_KEEPALIVE_EXPIRY,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_POOL_SIZE,
+    LLM_WARM_UP_TIMEOUT,
+    LLM_WARM_UP_URLS,
+)
+from app.utils.http_constants import HTTP_CONNECT_TIMEOUT
+
+LLMKey = Tuple[str, str, str]
+
+
+class LoopBoundTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping one connection pool per event loop.
+
+    Pooled connections belong to the loop that opened them, while the shared
+    model instances are called from several loops (the server loop and the
+    background loop running summaries). Requests are sent through the pool of
+    the running loop, as `HttpClientManager.get_async_session` does.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._transports: WeakKeyDictionary = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=self._limits)
+                self._transports[loop] = transport
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._get_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the pool of the running loop (the pools of other loops close with them)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.pop(loop, None)
+        if transport is not None:
+            await transport.aclose()
 
 
 class LLMFactory:
-    def __init__(self):
-        self._cache = {}
+    """LRU pool of model instances keyed by their full effective configuration.
+
+    Instances of the same provider share one sync and one async HTTP client, so
+    evicting or creating an instance never opens or drops connections. The async
+    client keeps a connection pool per event loop.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._cache: "OrderedDict[LLMKey, BaseChatModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._http_clients: Dict[str, Tuple[httpx.Client, httpx.AsyncClient]] = {}
+
+    @staticmethod
+    def _make_key(config: ModelConfig, **kwargs) -> LLMKey:
+        """Build the cache key of an instance from its effective parameters"""
+        params = {**kwargs, "temperature": kwargs.get("temperature", config.temperature)}
+        return (
+            config.provider,
+            config.model_name,
+            json.dumps(params, sort_keys=True, default=repr),
+        )
 
     def get_llm(self, provider: str, version: str, **kwargs) -> BaseChatModel:
         """Get an LLM instance from the factory"""
-        cache_key = f"{provider}_{version}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
         config = get_model_config(provider, version)
+        cache_key = self._make_key(config, **kwargs)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
         llm = self._create_llm(config, **kwargs)
-        self._cache[cache_key] = llm
+        with self._lock:
+            self._cache[cache_key] = llm
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
         return llm
 
+    def get_http_clients(self, provider: str) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """Get the HTTP clients shared by every instance of a provider (lazy initialization)"""
+        with self._lock:
+            if provider not in self._http_clients:
+                limits = httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY,
+                )
+                # Read timeouts are set per request by the provider SDKs
+                timeout = httpx.Timeout(None, connect=HTTP_CONNECT_TIMEOUT)
+                self._http_clients[provider] = (
+                    httpx.Client(limits=limits, timeout=timeout),
+                    httpx.AsyncClient(transport=LoopBoundTransport(limits), timeout=timeout),
+                )
+            return self._http_clients[provider]
+
+    def warm_up(self, providers: Optional[List[str]] = None):
+        """Open the pooled connections of each provider (synchronous)"""
+        for provider, url in LLM_WARM_UP_URLS.items():
+            if providers is None or provider in providers:
+                try:
+                    self.get_http_clients(provider)[0].get(url, timeout=LLM_WARM_UP_TIMEOUT)
+                except httpx.HTTPError:
+                    pass
+
+    async def awarm_up(self, providers: Optional[List[str]] = None):
+        """Open the pooled connections of each provider on the running loop (asynchronous)"""
+        for provider, url in LLM_WARM_UP_URLS.items():
+            if providers is None or provider in providers:
+                try:
+                    await self.get_http_clients(provider)[1].get(url, timeout=LLM_WARM_UP_TIMEOUT)
+                except httpx.HTTPError:
+                    pass
+
     def _create_llm(self, config: ModelConfig, **kwargs) -> BaseChatModel:
         """Create an LLM instance from the factory"""
         if config.provider == "openai":
@@ -36,22 +148,26 @@ class LLMFactory:
         """Create an OpenAI LLM instance from the factory"""
         from langchain_openai import ChatOpenAI
 
+        http_client, http_async_client = self.get_http_clients(config.provider)
         return ChatOpenAI(
             model=config.model_name,
             temperature=kwargs.get("temperature", config.temperature),
             streaming=kwargs.get("streaming", True),
+            http_client=kwargs.get("http_client", http_client),
+            http_async_client=kwargs.get("http_async_client", http_async_client),
             **{
                 k: v
                 for k, v in kwargs.items()
-                if k not in ["temperature", "streaming"]
+                if k not in ["temperature", "streaming", "http_client", "http_async_client"]
             },
         )
 
     def _create_anthropic_llm(self, config: ModelConfig, **kwargs):
         """Create an Anthropic LLM instance from the factory"""
+        import anthropic
         from langchain_anthropic import ChatAnthropic
 
-        return ChatAnthropic(
+        llm = ChatAnthropic(
             model=config.model_name,
             temperature=kwargs.get("temperature", config.temperature),
             streaming=kwargs.get("streaming", True),
@@ -61,6 +177,13 @@ class LLMFactory:
                 if k not in ["temperature", "streaming"]
             },
         )
+        # ChatAnthropic takes no HTTP client, so its lazily built SDK clients are set up front
+        http_client, http_async_client = self.get_http_clients(config.provider)
+        llm.__dict__["_client"] = anthropic.Client(**llm._client_params, http_client=http_client)
+        llm.__dict__["_async_client"] = anthropic.AsyncClient(
+            **llm._client_params, http_client=http_async_client
+        )
+        return llm
 
     def _create_google_llm(self, config: ModelConfig, **kwargs):
         """Create a Google LLM instance from the factory"""
@@ -78,19 +201,22 @@ class LLMFactory:
         )
 
     def clear_cache(self):
-        """Clear the cache of the factory"""
-        self._cache.clear()
+        """Clear the cache of the factory (the shared HTTP clients are kept)"""
+        with self._lock:
+            self._cache.clear()
 
-    def get_cache_info(self) -> List[str]:
+    def get_cache_info(self) -> Dict[str, Any]:
         """Get the cache info of the factory"""
-        return {
-            "cached_models": len(self._cache),
-            "cache_keys": list(self._cache.keys()),
-        }
+        with self._lock:
+            return {
+                "cached_models": len(self._cache),
+                "cache_keys": list(self._cache.keys()),
+                "http_clients": list(self._http_clients.keys()),
+            }
 
 
 # Global factory instance
-_factory = LLMFactory()
+_factory = LLMFactory(LLM_POOL_SIZE)
 
 
 def get_llm_instance(log, provider: str, version: str, **kwargs) -> Any:
@@ -111,3 +237,13 @@ def clear_llm_cache():
 def get_cache_info():
     """Get the cache info of the factory"""
     return _factory.get_cache_info()
+
+
+def warm_up_llm_connections(providers: Optional[List[str]] = None):
+    """Open the connections of the model providers ahead of the first turn (synchronous)"""
+    _factory.warm_up(providers)
+
+
+async def awarm_up_llm_connections(providers: Optional[List[str]] = None):
+    """Open the connections of the model providers ahead of the first turn (asynchronous)"""
+    await _factory.awarm_up(providers)
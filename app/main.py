@@ -1,10 +1,22 @@
 import streamlit as st
 
 from app.llms.config import AVAILABLE_MODELS, get_model_config, get_model_versions
-from app.supervisor.constants import SUPERVISOR_NAME
+from app.supervisor.constants import (
+    PROGRESS_AGENT_EVENT,
+    PROGRESS_ANSWER_EVENT,
+    PROGRESS_STREAM_MODES,
+    PROGRESS_TOKEN_EVENT,
+    PROGRESS_TOOL_END_EVENT,
+    PROGRESS_TOOL_START_EVENT,
+)
+from app.supervisor.stream import ProgressStream
+from app.supervisor.summarizer import schedule_summary
+from app.utils.async_runner import get_background_loop
 from app.utils.callbacks import LoggingCallback
+from app.utils.env_constants import ASYNC_EXECUTION
 from app.utils.logger import get_logger
 from app.utils.streamlit_helpers import (
+    create_render_buffer,
     get_chatbot,
     get_session_id,
     print_greeting_message,
@@ -13,7 +25,9 @@ from app.utils.streamlit_helpers import (
     save_message,
 )
 from app.utils.ui_constants import (
+    AGENT_LABELS,
     CHAT_INPUT_PLACEHOLDER,
+    PROGRESS_DONE_MESSAGE,
     PROJECT_ICON,
     PROJECT_LOGO_HTML,
     PROJECT_TITLE,
@@ -50,8 +64,6 @@ with st.sidebar:
             )
 
 # Get Ready for Chat
-if "messages" not in st.session_state:
-    st.session_state.messages = []
 session_id = get_session_id()
 logger = get_logger(session_id)
 
@@ -66,17 +78,56 @@ if chat_input:
     chatbot = get_chatbot(model_provider, model_version, temperature, logger)
 
     # LLM Response
-    with st.spinner(THINKING_MESSAGE):
-        with st.chat_message("assistant"):
-            response = ""
-            message_placeholder = st.empty()
-            for chunk, metadata in chatbot.stream(
-                {"messages": [{"role": "user", "content": chat_input}]},
-                config={"configurable": {"thread_id": session_id},
-                        "callbacks": [LoggingCallback(session_id)]},
-                stream_mode="messages",
-            ):
-                if metadata["langgraph_node"] == SUPERVISOR_NAME:
-                    response += chunk.content
-                    message_placeholder.markdown(response)
-            save_message(response, "assistant")
+    with st.chat_message("assistant"):
+        # Progress of the agents and tools, then the answer
+        status = st.status(THINKING_MESSAGE, expanded=True)
+        answer = create_render_buffer(st.container(), "markdown")
+        partial = None
+        progress = ProgressStream()
+
+        stream_kwargs = {
+            "input": {"messages": [{"role": "user", "content": chat_input}]},
+            "config": {"configurable": {"thread_id": session_id},
+                       "callbacks": [LoggingCallback(session_id)]},
+            "stream_mode": PROGRESS_STREAM_MODES,
+            "subgraphs": True,
+        }
+        if ASYNC_EXECUTION:
+            # Async tools of all sessions overlap on the shared background loop
+            stream = get_background_loop().iterate(chatbot.astream(**stream_kwargs))
+        else:
+            stream = chatbot.stream(**stream_kwargs)
+        for item in stream:
+            for event in progress.feed(item):
+                label = AGENT_LABELS.get(event.agent, event.agent)
+                if event.type == PROGRESS_TOKEN_EVENT:
+                    # Sub-agent tokens streamed since the last agent or tool event
+                    partial = partial or create_render_buffer(status.container(), "caption")
+                    partial.append(event.content)
+                    continue
+                if event.type == PROGRESS_ANSWER_EVENT:
+                    if event.reset:
+                        answer.reset()
+                    answer.append(event.content)
+                    continue
+
+                # Render what is pending before the graph moves on
+                answer.flush()
+                if partial:
+                    partial.flush()
+                    partial = None
+                if event.type == PROGRESS_AGENT_EVENT:
+                    status.update(label=f"{label} 작업 중...")
+                    status.markdown(f"**{label}**")
+                elif event.type == PROGRESS_TOOL_START_EVENT:
+                    status.markdown(f"🔧 `{event.tool}` 실행 중...")
+                elif event.type == PROGRESS_TOOL_END_EVENT:
+                    status.markdown(f"✔️ `{event.tool}` 완료 ({event.elapsed:.1f}초)")
+        if partial:
+            partial.flush()
+        answer.flush()
+        status.update(label=PROGRESS_DONE_MESSAGE, state="complete", expanded=False)
+        save_message(progress.answer.text, "assistant")
+
+    # Compact the history while the user reads the answer
+    schedule_summary(chatbot, {"configurable": {"thread_id": session_id}})
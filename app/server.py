@@ -0,0 +1,213 @@
+"""Headless ASGI service exposing the supervisor chatbot over HTTP.
+
+Run with `uv run uvicorn app.server:app` (or `uv run python -m app.server`).
+
+Endpoints:
+    GET  /health                         liveness and number of running turns
+    POST /threads                        start a conversation, returns its thread_id
+    POST /threads/{thread_id}/runs/stream
+        body: {"message": str, "model_provider"?: str, "model_version"?: str,
+               "temperature"?: float}
+        streams the answer as server-sent events (`reset` drops the tokens streamed so far)
+        and the agent, tool and sub-agent token progress as `progress` events
+
+Conversations only live in the shared checkpointer of the process serving them,
+so replicas behind a load balancer must route a thread_id to the same process.
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import uuid
+from dataclasses import asdict
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from langgraph.graph.graph import CompiledGraph
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from app.llms.config import AVAILABLE_MODELS, get_model_config, get_model_versions
+from app.llms.factory import awarm_up_llm_connections
+from app.supervisor.constants import PROGRESS_ANSWER_EVENT, PROGRESS_STREAM_MODES
+from app.supervisor.registry import get_shared_chatbot
+from app.supervisor.stream import ProgressStream
+from app.supervisor.summarizer import schedule_summary
+from app.utils.callbacks import LoggingCallback
+from app.utils.env_constants import LLM_WARM_UP
+from app.utils.logger import get_logger
+from app.utils.server_constants import (
+    SERVER_HOST,
+    SERVER_MAX_CONCURRENT_RUNS,
+    SERVER_PORT,
+    SERVER_RETRY_AFTER_SECONDS,
+    SSE_END_EVENT,
+    SSE_ERROR_EVENT,
+    SSE_PROGRESS_EVENT,
+    SSE_RESET_EVENT,
+    SSE_TOKEN_EVENT,
+)
+
+_logger = get_logger("server")
+
+_run_slots = asyncio.Semaphore(SERVER_MAX_CONCURRENT_RUNS)
+_running_threads = set()
+
+
+def _get_chatbot(model_provider: str, model_version: str, temperature: float) -> CompiledGraph:
+    """Get the shared chatbot of a model configuration"""
+    chatbot = get_shared_chatbot(_logger, model_provider, model_version, temperature)
+    if not chatbot:
+        raise ValueError(f"Failed to load model: {model_provider}/{model_version}")
+    return chatbot
+
+
+def _release_run(thread_id: str):
+    """Free the run slot and the thread taken by a turn"""
+    _running_threads.discard(thread_id)
+    _run_slots.release()
+
+
+class RunStreamingResponse(StreamingResponse):
+    """Streaming response releasing the run of its turn once the response ends.
+
+    The run is released even when the stream never starts, e.g. when the
+    client disconnects before the first event.
+    """
+
+    def __init__(self, content: AsyncIterator[str], release: Callable[[], None], **kwargs):
+        super().__init__(content, **kwargs)
+        self._release = release
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release()
+
+
+def _format_event(event: str, data: Dict) -> str:
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_answer(
+    chatbot: CompiledGraph, thread_id: str, message: str
+) -> AsyncIterator[str]:
+    """Stream the answer of a turn as server-sent events"""
+    progress = ProgressStream()
+    try:
+        async for item in chatbot.astream(
+            {"messages": [{"role": "user", "content": message}]},
+            config={"configurable": {"thread_id": thread_id},
+                    "callbacks": [LoggingCallback(thread_id)]},
+            stream_mode=PROGRESS_STREAM_MODES,
+            subgraphs=True,
+        ):
+            for event in progress.feed(item):
+                if event.type != PROGRESS_ANSWER_EVENT:
+                    yield _format_event(SSE_PROGRESS_EVENT, asdict(event))
+                    continue
+                if event.reset:
+                    yield _format_event(SSE_RESET_EVENT, {})
+                yield _format_event(SSE_TOKEN_EVENT, {"content": event.content})
+        yield _format_event(SSE_END_EVENT, {"content": progress.answer.text})
+        # Compact the history before the next turn of the thread
+        schedule_summary(chatbot, {"configurable": {"thread_id": thread_id}})
+    except Exception as e:
+        _logger.exception(f"Run error on thread {thread_id}: {e}")
+        yield _format_event(SSE_ERROR_EVENT, {"error": str(e)})
+
+
+async def health(request: Request) -> JSONResponse:
+    return JSONResponse(
+        {
+            "status": "ok",
+            "running": len(_running_threads),
+            "capacity": SERVER_MAX_CONCURRENT_RUNS,
+        }
+    )
+
+
+async def create_thread(request: Request) -> JSONResponse:
+    return JSONResponse({"thread_id": str(uuid.uuid4())}, status_code=201)
+
+
+async def stream_run(request: Request) -> StreamingResponse:
+    thread_id = request.path_params["thread_id"]
+    try:
+        body = await request.json()
+    except json.JSONDecodeError:
+        return JSONResponse({"error": "Request body must be JSON"}, status_code=400)
+
+    if not isinstance(body, dict):
+        return JSONResponse({"error": "Request body must be a JSON object"}, status_code=400)
+
+    message: Optional[str] = body.get("message")
+    if not message or not isinstance(message, str):
+        return JSONResponse({"error": "`message` is required"}, status_code=400)
+
+    model_provider = body.get("model_provider") or next(iter(AVAILABLE_MODELS))
+    try:
+        model_versions = get_model_versions(model_provider)
+        if not model_versions:
+            raise ValueError(f"Unsupported model provider: {model_provider}")
+        model_version = body.get("model_version") or model_versions[0]
+        config = get_model_config(model_provider, model_version)
+    except (TypeError, ValueError) as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    try:
+        temperature = float(body.get("temperature", config.temperature))
+    except (TypeError, ValueError):
+        return JSONResponse({"error": "`temperature` must be a number"}, status_code=400)
+
+    if thread_id in _running_threads:
+        return JSONResponse({"error": "A turn is already running on this thread"}, status_code=409)
+    if _run_slots.locked():
+        return JSONResponse(
+            {"error": "Server is at capacity"},
+            status_code=503,
+            headers={"Retry-After": str(SERVER_RETRY_AFTER_SECONDS)},
+        )
+
+    await _run_slots.acquire()
+    _running_threads.add(thread_id)
+    try:
+        chatbot = await asyncio.to_thread(_get_chatbot, model_provider, model_version, temperature)
+    except Exception as e:
+        _release_run(thread_id)
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+    return RunStreamingResponse(
+        _stream_answer(chatbot, thread_id, message),
+        release=functools.partial(_release_run, thread_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    if LLM_WARM_UP:
+        await awarm_up_llm_connections()
+        _logger.info("Model provider connections warmed up")
+    yield
+
+
+app = Starlette(
+    lifespan=lifespan,
+    routes=[
+        Route("/health", health, methods=["GET"]),
+        Route("/threads", create_thread, methods=["POST"]),
+        Route("/threads/{thread_id}/runs/stream", stream_run, methods=["POST"]),
+    ]
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
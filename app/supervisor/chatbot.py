@@ -1,6 +1,8 @@
-from typing import Annotated
+from typing import Annotated, Dict, Optional
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import InjectedToolCallId, tool
 from langgraph.checkpoint.base import Checkpoint
 from langgraph.graph import END, START
@@ -8,7 +10,6 @@ from langgraph.graph.graph import CompiledGraph
 from langgraph.graph.message import MessagesState, StateGraph
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
-from langmem.short_term import SummarizationNode
 
 from app.agents.calendar_agent.agent import get_calendar_agent
 from app.agents.calendar_agent.constants import AGENT_NAME as CALENDAR_AGENT_NAME
@@ -18,23 +19,51 @@ from app.agents.research_agent.agent import get_research_agent
 from app.agents.research_agent.constants import AGENT_NAME as RESEARCH_AGENT_NAME
 from app.agents.twitter_agent.agent import get_twitter_agent
 from app.agents.twitter_agent.constants import AGENT_NAME as TWITTER_AGENT_NAME
-from app.supervisor.constants import MAX_SUMMARY_TOKENS, SUPERVISOR_NAME, SUPERVISOR_PROMPT_NAME
-from app.supervisor.hooks import guard_using_llamaguard
+from app.llms.config import (
+    ROLE_CALENDAR,
+    ROLE_PLANNER,
+    ROLE_RESEARCH,
+    ROLE_SUMMARIZER,
+    ROLE_SUPERVISOR,
+    ROLE_TWITTER,
+)
+from app.supervisor.constants import (
+    DIRECT_RETURN_AGENTS,
+    HANDOFF_BRIEF_MAX_TOKENS,
+    INTENT_ROUTER_NAME,
+    SUPERVISOR_NAME,
+    SUPERVISOR_PROMPT_NAME,
+)
+from app.supervisor.handoff import create_scoped_agent
+from app.supervisor.hooks import guard_using_llamaguard, is_safe_answer
+from app.supervisor.router import get_handoff_tool_name, get_intent_router
+from app.supervisor.summarizer import get_summarizer
 from app.utils.create_react_agent import create_react_agent
+from app.utils.env_constants import (
+    BACKGROUND_SUMMARY,
+    DIRECT_RETURN,
+    INTENT_ROUTER,
+    SCOPED_HANDOFF,
+)
 from app.utils.langsmith_manger import LangSmithManager
+from app.utils.token_counter import get_model_encoding
 
 _langsmith_manager = LangSmithManager()
 
 
 def create_handoff_tool(*, agent_name: str, description: str | None = None):
-    name = f"transfer_to_{agent_name}"
+    name = get_handoff_tool_name(agent_name)
     description = description or f"Ask {agent_name} for help."
 
     @tool(name, description=description)
     def handoff_tool(
         state: Annotated[MessagesState, InjectedState],
         tool_call_id: Annotated[str, InjectedToolCallId],
+        config: RunnableConfig,
+        # Optional: the task brief falls back to the conversation when the model leaves it out
+        task: Annotated[str, "Self-contained description of what the agent should do"] = "",
     ) -> Command:
+        get_intent_router().record_handoff(config)
         tool_message = {
             "role": "tool",
             "content": f"Successfully transferred to {agent_name}",
@@ -42,9 +71,17 @@ def create_handoff_tool(*, agent_name: str, description: str | None = None):
             "tool_call_id": tool_call_id,
         }
 
+        # Only the messages the chatbot state lacks are sent: the `add_messages` reducer appends
+        # them, where re-sending the whole history would write it again at every handoff
+        ai_message = next(
+            message
+            for message in reversed(state["messages"])
+            if isinstance(message, AIMessage)
+            and any(tool_call["id"] == tool_call_id for tool_call in message.tool_calls)
+        )
         return Command(
             goto=agent_name,
-            update={**state, "messages": state["messages"] + [tool_message]},
+            update={**state, "messages": [ai_message, tool_message]},
             graph=Command.PARENT,
         )
 
@@ -53,26 +90,73 @@ def create_handoff_tool(*, agent_name: str, description: str | None = None):
 
 class State(MessagesState):
     summarized_messages: str
+    # Kept across supervisor visits so each model call only validates the new messages
+    validated_message_id: Optional[str]
+
+
+def create_direct_return_router(agent_name: str):
+    """Route an agent to END when its answer can end the turn, to the supervisor otherwise"""
+
+    def route_after_agent(state: State) -> str:
+        messages = state["messages"]
+        answer = messages[-1]
+        if not isinstance(answer, AIMessage) or answer.tool_calls or not answer.content:
+            return SUPERVISOR_NAME
+
+        # The supervisor still has to route requests that also ask for other agents
+        request = next(
+            (message for message in reversed(messages) if isinstance(message, HumanMessage)), None
+        )
+        if request is not None and get_intent_router().match(request.text()) - {agent_name}:
+            return SUPERVISOR_NAME
+
+        return END if is_safe_answer(answer.text()) else SUPERVISOR_NAME
+
+    return route_after_agent
 
 
 
 def get_supervisor_chatbot(
     llm: BaseChatModel,
     checkpointer: Checkpoint,
+    role_llms: Optional[Dict[str, BaseChatModel]] = None,
+    use_intent_router: bool = INTENT_ROUTER,
+    direct_return: bool = DIRECT_RETURN,
+    background_summary: bool = BACKGROUND_SUMMARY,
+    scoped_handoff: bool = SCOPED_HANDOFF,
 ) -> CompiledGraph:
     """Get a supervisor agent.
 
     Args:
         llm (BaseChatModel): LLM model to use
+        role_llms (Optional[Dict[str, BaseChatModel]]): LLM models of the roles not running on `llm`
+        use_intent_router (bool): dispatch clear-cut requests to agents without the supervisor
+        direct_return (bool): end the turn with the answer of a planning/research agent
+        background_summary (bool): summarize the history after turns instead of inline
+        scoped_handoff (bool): run sub-agents on a task brief and merge back their final answer
 
     Returns:
         CompiledGraph: Generated supervisor agent
     """
+    role_llms = role_llms or {}
+    supervisor_llm = role_llms.get(ROLE_SUPERVISOR, llm)
+    summarizer_llm = role_llms.get(ROLE_SUMMARIZER, llm)
+
     # Agents
-    research_agent = get_research_agent(llm)
-    planner_agent = get_planner_agent(llm)
-    calendar_agent = get_calendar_agent(llm)
-    twitter_agent = get_twitter_agent(llm)
+    research_agent = get_research_agent(role_llms.get(ROLE_RESEARCH, llm))
+    planner_agent = get_planner_agent(role_llms.get(ROLE_PLANNER, llm))
+    calendar_agent = get_calendar_agent(role_llms.get(ROLE_CALENDAR, llm))
+    twitter_agent = get_twitter_agent(role_llms.get(ROLE_TWITTER, llm))
+    if scoped_handoff:
+        research_agent, planner_agent, calendar_agent, twitter_agent = (
+            create_scoped_agent(agent, agent_name, HANDOFF_BRIEF_MAX_TOKENS)
+            for agent, agent_name in (
+                (research_agent, RESEARCH_AGENT_NAME),
+                (planner_agent, PLANNER_AGENT_NAME),
+                (calendar_agent, CALENDAR_AGENT_NAME),
+                (twitter_agent, TWITTER_AGENT_NAME),
+            )
+        )
 
     # Handoffs
     assign_to_research_agent = create_handoff_tool(agent_name=RESEARCH_AGENT_NAME)
@@ -81,14 +165,15 @@ def get_supervisor_chatbot(
     assign_to_twitter_agent = create_handoff_tool(agent_name=TWITTER_AGENT_NAME)
 
     # History Summarization
-    summarization_node = SummarizationNode(
-        model=llm,
-        max_tokens=MAX_SUMMARY_TOKENS,
-        token_counter=llm.get_num_tokens_from_messages,
+    summarization_hook = get_summarizer(background_summary).create_hook(
+        summarizer_llm,
+        get_model_encoding(
+            getattr(summarizer_llm, "model_name", None) or getattr(summarizer_llm, "model", "")
+        ),
     )
 
     supervisor_agent = create_react_agent(
-        model=llm,
+        model=supervisor_llm,
         tools=[
             assign_to_planner_agent,
             assign_to_research_agent,
@@ -97,11 +182,11 @@ def get_supervisor_chatbot(
         ],
         prompt=_langsmith_manager.get_agent_prompt(SUPERVISOR_PROMPT_NAME),
         name=SUPERVISOR_NAME,
-        pre_model_hook=summarization_node,
+        pre_model_hook=summarization_hook,
         post_model_hook=guard_using_llamaguard,
     )
 
-    return (
+    workflow = (
         StateGraph(State)
         .add_node(
             SUPERVISOR_NAME,
@@ -118,14 +203,32 @@ def get_supervisor_chatbot(
         .add_node(PLANNER_AGENT_NAME, planner_agent)
         .add_node(CALENDAR_AGENT_NAME, calendar_agent)
         .add_node(TWITTER_AGENT_NAME, twitter_agent)
-        .add_edge(START, SUPERVISOR_NAME)
-        .add_edge(RESEARCH_AGENT_NAME, SUPERVISOR_NAME)
-        .add_edge(PLANNER_AGENT_NAME, SUPERVISOR_NAME)
-        .add_edge(CALENDAR_AGENT_NAME, SUPERVISOR_NAME)
-        .add_edge(TWITTER_AGENT_NAME, SUPERVISOR_NAME)
-        .compile(checkpointer=checkpointer)
     )
 
+    for agent_name in (
+        RESEARCH_AGENT_NAME,
+        PLANNER_AGENT_NAME,
+        CALENDAR_AGENT_NAME,
+        TWITTER_AGENT_NAME,
+    ):
+        if direct_return and agent_name in DIRECT_RETURN_AGENTS:
+            workflow.add_conditional_edges(
+                agent_name, create_direct_return_router(agent_name), [SUPERVISOR_NAME, END]
+            )
+        else:
+            workflow.add_edge(agent_name, SUPERVISOR_NAME)
+
+    if use_intent_router:
+        workflow.add_node(
+            INTENT_ROUTER_NAME,
+            get_intent_router().route,
+            destinations=(SUPERVISOR_NAME, CALENDAR_AGENT_NAME, TWITTER_AGENT_NAME),
+        )
+        workflow.add_edge(START, INTENT_ROUTER_NAME)
+    else:
+        workflow.add_edge(START, SUPERVISOR_NAME)
+
+    return workflow.compile(checkpointer=checkpointer)
 
 if __name__ == "__main__":
     from IPython.display import Image, display
@@ -1,6 +1,62 @@
+from app.agents.calendar_agent.constants import AGENT_NAME as CALENDAR_AGENT_NAME
+from app.agents.planner_agent.constants import AGENT_NAME as PLANNER_AGENT_NAME
+from app.agents.research_agent.constants import AGENT_NAME as RESEARCH_AGENT_NAME
+from app.agents.twitter_agent.constants import AGENT_NAME as TWITTER_AGENT_NAME
+
 SUPERVISOR_NAME = "trip_planner_supervisor"
 SUPERVISOR_PROMPT_NAME = "tras/supervisor_agent"
 
 GUARD_VIOLATION_SYSTEM_MESSAGE = "이 응답은 불법 약물, 성적인 내용 등 위험성이 높은 금지된 내용이 포함되어 있습니다. 이를 제거하여 다시 응답해주세요"
 
-MAX_SUMMARY_TOKENS = 10000
\ No newline at end of file
+MAX_SUMMARY_TOKENS = 10000
+
+# Compiled chatbots (one per model configuration) kept by the process-wide registry
+CHATBOT_REGISTRY_SIZE = 8
+
+# Intent router: node dispatching clear-cut requests to an agent without a supervisor LLM call
+INTENT_ROUTER_NAME = "intent_router"
+# (agent name, pattern) rules; a request is routed only when exactly one agent matches
+INTENT_ROUTER_RULES = [
+    (
+        CALENDAR_AGENT_NAME,
+        r"(캘린더|달력|calendar).{0,20}"
+        r"(등록|추가|저장|넣어|올려|취소|삭제|지워|빼|수정|변경|옮겨|확인|보여|조회)",
+    ),
+    (CALENDAR_AGENT_NAME, r"(일정|계획|플랜).{0,20}(캘린더|달력|calendar)"),
+    (
+        TWITTER_AGENT_NAME,
+        r"(트윗|트위터|tweet|twitter).{0,20}"
+        r"(올려|게시|작성|공유|해\s*줘|써|취소|삭제|지워|확인|보여|조회)",
+    ),
+    (TWITTER_AGENT_NAME, r"(일정|계획|플랜|내용).{0,20}(트윗|트위터|tweet|twitter)"),
+]
+# Requests that also ask for planning or searching need the supervisor to sequence the agents
+INTENT_ROUTER_FALLTHROUGH_PATTERN = r"(짜\s*줘|계획\s*(을|해)|추천|검색|찾아|알려|어때|\?)"
+# Threads whose fall-through start time is kept until the supervisor hands them off
+INTENT_ROUTER_PENDING_SIZE = 1024
+
+# Direct return: agents whose final answer ends the turn instead of being restated by the supervisor
+DIRECT_RETURN_AGENTS = (PLANNER_AGENT_NAME, RESEARCH_AGENT_NAME)
+# Node running the LLM in the prebuilt sub-agents (the custom ones name it after the agent)
+SUBAGENT_MODEL_NODE = "agent"
+
+# Progress streaming: graph stream modes consumed and the progress events built from them
+PROGRESS_STREAM_MODES = ["messages", "updates"]
+PROGRESS_AGENT_EVENT = "agent"
+PROGRESS_TOOL_START_EVENT = "tool_start"
+PROGRESS_TOOL_END_EVENT = "tool_end"
+PROGRESS_TOKEN_EVENT = "token"
+PROGRESS_ANSWER_EVENT = "answer"
+
+# Background summarization: history is summarized after a turn; a turn summarizes inline only when
+# its unsummarized history exceeds MAX_SUMMARY_TOKENS by this factor
+SUMMARY_INLINE_FACTOR = 2
+# Threads whose running summary is kept in memory
+SUMMARY_CACHE_SIZE = 1024
+
+# Scoped handoff: sub-agents get a task brief instead of the whole conversation
+HANDOFF_BRIEF_MAX_TOKENS = 6000
+HANDOFF_BRIEF_TASK_HEADER = "## 요청 작업"
+HANDOFF_BRIEF_REQUEST_HEADER = "## 사용자 요청"
+HANDOFF_BRIEF_PLAN_HEADER = "## 현재 계획"
+HANDOFF_BRIEF_EARLIER_REQUESTS_HEADER = "## 이전 사용자 요청 (최신순)"
@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.graph import CompiledGraph
+from langgraph.utils.runnable import RunnableCallable
+
+from app.supervisor.constants import (
+    HANDOFF_BRIEF_EARLIER_REQUESTS_HEADER,
+    HANDOFF_BRIEF_PLAN_HEADER,
+    HANDOFF_BRIEF_REQUEST_HEADER,
+    HANDOFF_BRIEF_TASK_HEADER,
+)
+from app.supervisor.router import get_handoff_tool_name
+from app.utils.token_counter import count_text_tokens
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """Keep the head of a text within a token budget"""
+    tokens = count_text_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    return text[: len(text) * max(max_tokens, 0) // tokens]
+
+
+def _find_task(messages: Sequence[AnyMessage], agent_name: str) -> str:
+    """Return the task the supervisor wrote in the last handoff to an agent"""
+    tool_name = get_handoff_tool_name(agent_name)
+    for message in reversed(messages):
+        if isinstance(message, AIMessage):
+            for tool_call in message.tool_calls:
+                if tool_call["name"] == tool_name:
+                    return tool_call["args"].get("task") or ""
+    return ""
+
+
+def _find_plan(messages: Sequence[AnyMessage]) -> Optional[str]:
+    """Return the latest answer of the conversation (the current plan)"""
+    for message in reversed(messages):
+        if isinstance(message, AIMessage) and not message.tool_calls and message.text():
+            return message.text()
+    return None
+
+
+def build_task_brief(messages: Sequence[AnyMessage], agent_name: str, max_tokens: int) -> str:
+    """Build the brief of a sub-agent task from the conversation
+
+    Sections are added by priority until the token budget is spent: the task
+    written by the supervisor, the latest user request, the current plan, then
+    the earlier user requests.
+
+    Args:
+        messages (Sequence[AnyMessage]): conversation so far
+        agent_name (str): agent the task is handed off to
+        max_tokens (int): token budget of the brief
+
+    Returns:
+        str: markdown task brief
+    """
+    requests = [
+        message.text() for message in reversed(messages) if isinstance(message, HumanMessage)
+    ]
+    task = _find_task(messages, agent_name)
+    plan = _find_plan(messages)
+
+    sections: List[str] = []
+    budget = max_tokens
+
+    def add(header: str, text: str):
+        nonlocal budget
+        text = _truncate(text, budget - count_text_tokens(header))
+        if text:
+            sections.append(f"{header}\n{text}")
+            budget -= count_text_tokens(sections[-1])
+
+    if task:
+        add(HANDOFF_BRIEF_TASK_HEADER, task)
+    if requests:
+        add(HANDOFF_BRIEF_REQUEST_HEADER, requests[0])
+    if plan:
+        add(HANDOFF_BRIEF_PLAN_HEADER, plan)
+    if len(requests) > 1:
+        add(HANDOFF_BRIEF_EARLIER_REQUESTS_HEADER, "\n".join(f"- {r}" for r in requests[1:]))
+    return "\n\n".join(sections)
+
+
+def create_scoped_agent(agent: CompiledGraph, agent_name: str, max_tokens: int) -> RunnableCallable:
+    """Wrap a sub-agent so it runs on a task brief and returns only its final answer
+
+    Args:
+        agent (CompiledGraph): sub-agent
+        agent_name (str): name of the sub-agent node
+        max_tokens (int): token budget of the task brief
+
+    Returns:
+        RunnableCallable: node running the sub-agent
+    """
+
+    def prepare(state: Dict[str, Any]) -> Dict[str, Any]:
+        brief = build_task_brief(state["messages"], agent_name, max_tokens)
+        return {"messages": [HumanMessage(brief)]}
+
+    def merge(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {"messages": result["messages"][-1:]}
+
+    def run(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        return merge(agent.invoke(prepare(state), config))
+
+    async def arun(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        return merge(await agent.ainvoke(prepare(state), config))
+
+    return RunnableCallable(run, arun, name=agent_name)
+
+
+if __name__ == "__main__":
+    # Test
+    from langchain_core.messages import ToolMessage
+
+    call = {"name": "transfer_to_calendar_agent", "args": {"task": "일정 등록"}, "id": "c1"}
+    conversation = [
+        HumanMessage("제주도 2박 3일 일정 짜줘. 예산은 50만원"),
+        AIMessage("", tool_calls=[{"name": "naver_blog_search", "args": {}, "id": "c0"}]),
+        ToolMessage("블로그 검색 결과 " * 2000, tool_call_id="c0"),
+        AIMessage("## 1일차\n- 성산일출봉\n## 2일차\n- 우도"),
+        HumanMessage("이 일정 캘린더에 등록해줘"),
+        AIMessage("", tool_calls=[call]),
+    ]
+    print(build_task_brief(conversation, "calendar_agent", 200))
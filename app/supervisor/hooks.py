@@ -28,7 +28,7 @@ _guard = Guard().use(
 def guard_using_google_checks(state):
     last_message = state["messages"][-1]
     if "tool_calls" in last_message.additional_kwargs:
-        return state
+        return {}
 
     request = _service.aisafety().classifyContent(
         body={
@@ -53,10 +53,19 @@ def guard_using_google_checks(state):
     return state
 
 
+def is_safe_answer(content: str) -> bool:
+    """Return whether an answer passes the LlamaGuard policies"""
+    try:
+        _guard.validate(content)
+    except Exception:
+        return False
+    return True
+
+
 def guard_using_llamaguard(state):
     last_message = state["messages"][-1]
     if "tool_calls" in last_message.additional_kwargs:
-        return state
+        return {}
 
     try:
         _guard.validate(last_message.content)
@@ -66,7 +75,7 @@ def guard_using_llamaguard(state):
             "content": GUARD_VIOLATION_SYSTEM_MESSAGE
         }
         
-        updated_state = {**state, "messages": state["messages"] + [system_message]}
+        updated_state = {"messages": [system_message]}
         if "name" in last_message.response_metadata:
             return Command(
                 goto=last_message.response_metadata["name"],
@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.graph import CompiledGraph
+
+from app.llms.config import AGENT_ROLES, get_role_model_version
+from app.llms.factory import get_llm_instance
+from app.supervisor.chatbot import get_supervisor_chatbot
+from app.supervisor.constants import CHATBOT_REGISTRY_SIZE
+from app.utils.checkpointer import create_checkpointer
+
+ChatbotKey = Tuple[str, str, float]
+
+
+class ChatbotRegistry:
+    """Process-wide LRU registry of compiled supervisor chatbots.
+
+    A compiled graph holds no conversation state, so one graph per model
+    configuration is shared by every session; conversations are kept apart by
+    the `thread_id` of the shared checkpointer.
+    """
+
+    def __init__(self, max_size: int, checkpointer: BaseCheckpointSaver):
+        self._max_size = max_size
+        self._checkpointer = checkpointer
+        self._chatbots: "OrderedDict[ChatbotKey, CompiledGraph]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[ChatbotKey, threading.Lock] = {}
+        self._stats = {"hits": 0, "builds": 0, "evictions": 0}
+
+    @property
+    def checkpointer(self) -> BaseCheckpointSaver:
+        return self._checkpointer
+
+    @staticmethod
+    def _make_key(provider: str, version: str, temperature: float) -> ChatbotKey:
+        return (provider, version, round(float(temperature), 2))
+
+    def _get_cached(self, key: ChatbotKey) -> Optional[CompiledGraph]:
+        with self._lock:
+            chatbot = self._chatbots.get(key)
+            if chatbot is not None:
+                self._chatbots.move_to_end(key)
+                self._stats["hits"] += 1
+            return chatbot
+
+    def contains(self, provider: str, version: str, temperature: float) -> bool:
+        """Return whether the chatbot of a model configuration is already built"""
+        with self._lock:
+            return self._make_key(provider, version, temperature) in self._chatbots
+
+    def get(
+        self, log, provider: str, version: str, temperature: float
+    ) -> Optional[CompiledGraph]:
+        """Get the chatbot of a model configuration, building it on first use
+
+        Args:
+            log: logger used to report model loading errors
+            provider (str): model provider
+            version (str): model version
+            temperature (float): model temperature
+
+        Returns:
+            Optional[CompiledGraph]: chatbot, or None if the model could not be loaded
+        """
+        key = self._make_key(provider, version, temperature)
+        chatbot = self._get_cached(key)
+        if chatbot is not None:
+            return chatbot
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        # Sessions asking for the same configuration wait for a single build
+        with build_lock:
+            chatbot = self._get_cached(key)
+            if chatbot is not None:
+                return chatbot
+
+            llm = get_llm_instance(
+                log=log, provider=provider, version=version, temperature=temperature
+            )
+            if not llm:
+                return None
+            role_llms = self._get_role_llms(log, provider, version, temperature)
+            chatbot = get_supervisor_chatbot(llm, self._checkpointer, role_llms)
+
+            with self._lock:
+                self._chatbots[key] = chatbot
+                self._build_locks.pop(key, None)
+                self._stats["builds"] += 1
+                while len(self._chatbots) > self._max_size:
+                    self._chatbots.popitem(last=False)
+                    self._stats["evictions"] += 1
+        return chatbot
+
+    @staticmethod
+    def _get_role_llms(
+        log, provider: str, version: str, temperature: float
+    ) -> Dict[str, BaseChatModel]:
+        """Get the models of the roles routed apart from the selected version
+
+        A role whose model fails to load falls back to the selected model.
+        """
+        role_llms = {}
+        for role in AGENT_ROLES:
+            role_version = get_role_model_version(provider, version, role)
+            if role_version == version:
+                continue
+            role_llm = get_llm_instance(
+                log=log, provider=provider, version=role_version, temperature=temperature
+            )
+            if role_llm:
+                role_llms[role] = role_llm
+        return role_llms
+
+    def get_stats(self) -> Dict:
+        """Get the stats of the registry"""
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._chatbots),
+                "keys": list(self._chatbots.keys()),
+            }
+
+
+# Global registry instance
+_registry = ChatbotRegistry(CHATBOT_REGISTRY_SIZE, create_checkpointer())
+
+
+def get_shared_chatbot(
+    log, provider: str, version: str, temperature: float
+) -> Optional[CompiledGraph]:
+    """Get the process-wide chatbot of a model configuration"""
+    return _registry.get(log, provider, version, temperature)
+
+
+def is_chatbot_built(provider: str, version: str, temperature: float) -> bool:
+    """Return whether the chatbot of a model configuration is already built"""
+    return _registry.contains(provider, version, temperature)
+
+
+def get_shared_checkpointer() -> BaseCheckpointSaver:
+    """Get the checkpointer shared by every chatbot of the process"""
+    return _registry.checkpointer
+
+
+def get_chatbot_registry_stats() -> Dict:
+    """Get the stats of the chatbot registry"""
+    return _registry.get_stats()
@@ -0,0 +1,181 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from app.supervisor.constants import (
+    DIRECT_RETURN_AGENTS,
+    PROGRESS_AGENT_EVENT,
+    PROGRESS_ANSWER_EVENT,
+    PROGRESS_TOKEN_EVENT,
+    PROGRESS_TOOL_END_EVENT,
+    PROGRESS_TOOL_START_EVENT,
+    SUBAGENT_MODEL_NODE,
+    SUPERVISOR_NAME,
+)
+from app.supervisor.router import get_handoff_tool_name
+from app.utils.env_constants import DIRECT_RETURN
+
+
+def is_subagent_model_node(metadata: Dict[str, Any], agent_name: Optional[str]) -> bool:
+    """Return whether a streamed chunk comes from the LLM node of a sub-agent
+
+    Prebuilt sub-agents run their LLM in the `agent` node, the ones built with
+    `app.utils.create_react_agent` in a node named after the agent.
+    """
+    return metadata["langgraph_node"] in (SUBAGENT_MODEL_NODE, agent_name)
+
+
+def get_answer_node(
+    metadata: Dict[str, Any], direct_return: bool = DIRECT_RETURN
+) -> Optional[str]:
+    """Return the chatbot node answering with a streamed chunk, None for internal chunks
+
+    Args:
+        metadata (Dict[str, Any]): metadata of a chunk streamed with `stream_mode="messages"`
+        direct_return (bool): whether the chatbot ends turns with planning/research agent answers
+
+    Returns:
+        Optional[str]: supervisor or direct-return agent name
+    """
+    if metadata["langgraph_node"] == SUPERVISOR_NAME:
+        return SUPERVISOR_NAME
+    if not direct_return:
+        return None
+    # Sub-agent chunks are namespaced by the chatbot node running the agent
+    agent_name = metadata.get("langgraph_checkpoint_ns", "").split("|")[0].split(":")[0]
+    if agent_name in DIRECT_RETURN_AGENTS and is_subagent_model_node(metadata, agent_name):
+        return agent_name
+    return None
+
+
+class AnswerStream:
+    """Answer of a turn assembled from streamed message chunks.
+
+    The answer is the last message streamed by an answering node: when a new
+    message starts (e.g. the supervisor takes over from a sub-agent whose
+    answer did not end the turn), the text streamed so far is replaced.
+
+    Args:
+        direct_return (bool): `direct_return` setting of the streamed chatbot
+    """
+
+    def __init__(self, direct_return: bool = DIRECT_RETURN):
+        self._direct_return = direct_return
+        self._parts: List[str] = []
+        self._message_id = None
+
+    @property
+    def text(self) -> str:
+        """Answer streamed so far"""
+        return "".join(self._parts)
+
+    def add(self, chunk, metadata: Dict[str, Any]) -> Optional[bool]:
+        """Add a streamed chunk
+
+        Args:
+            chunk: streamed message chunk
+            metadata (Dict[str, Any]): metadata of the chunk
+
+        Returns:
+            Optional[bool]: None if the chunk is not part of the answer,
+                True if it starts a new answer replacing the text so far, False otherwise
+        """
+        if chunk.type not in ("AIMessageChunk", "ai") or not chunk.content:
+            return None
+        if get_answer_node(metadata, self._direct_return) is None:
+            return None
+        reset = self._message_id is not None and chunk.id != self._message_id
+        if reset:
+            self._parts = []
+        self._message_id = chunk.id
+        self._parts.append(chunk.content)
+        return reset
+
+
+@dataclass
+class ProgressEvent:
+    """Progress of a turn: active agent, tool runs, sub-agent tokens and answer tokens"""
+    type: str
+    agent: Optional[str] = None
+    tool: Optional[str] = None
+    content: str = ""
+    elapsed: Optional[float] = None
+    reset: bool = False
+
+
+class ProgressStream:
+    """Progress events built from a chatbot stream.
+
+    Feed the items of `stream(..., stream_mode=PROGRESS_STREAM_MODES, subgraphs=True)`.
+    Tool runs are timed from the model message requesting them to the tool
+    messages answering them, so tools run in parallel share their batch time.
+
+    Args:
+        direct_return (bool): `direct_return` setting of the streamed chatbot
+    """
+
+    def __init__(self, direct_return: bool = DIRECT_RETURN):
+        self.answer = AnswerStream(direct_return)
+        self._agent = None
+        self._tool_starts: Dict[str, Tuple[str, float]] = {}
+
+    def feed(self, item: Tuple[Tuple[str, ...], str, Any]) -> List[ProgressEvent]:
+        """Translate a streamed item into progress events
+
+        Args:
+            item (Tuple[Tuple[str, ...], str, Any]): namespace, stream mode and data
+
+        Returns:
+            List[ProgressEvent]: progress events, in order
+        """
+        namespace, mode, data = item
+        # Items of the chatbot graph itself (e.g. the intent router) have no agent
+        agent = namespace[0].split(":")[0] if namespace else None
+
+        events = []
+        if agent is not None and agent != self._agent:
+            self._agent = agent
+            events.append(ProgressEvent(PROGRESS_AGENT_EVENT, agent=agent))
+
+        if mode == "messages":
+            events.extend(self._feed_message(agent, *data))
+        elif mode == "updates" and agent is not None:
+            # Updates of the chatbot graph repeat the messages of the agent updates
+            for update in data.values():
+                events.extend(self._feed_update(agent, update))
+        return events
+
+    def _feed_message(self, agent: Optional[str], chunk, metadata: Dict[str, Any]):
+        reset = self.answer.add(chunk, metadata)
+        if reset is not None:
+            yield ProgressEvent(
+                PROGRESS_ANSWER_EVENT, agent=agent, content=chunk.content, reset=reset
+            )
+        elif (
+            chunk.type == "AIMessageChunk"
+            and chunk.content
+            and agent != SUPERVISOR_NAME
+            and is_subagent_model_node(metadata, agent)
+        ):
+            yield ProgressEvent(PROGRESS_TOKEN_EVENT, agent=agent, content=chunk.content)
+
+    def _feed_update(self, agent: Optional[str], update: Any):
+        if not isinstance(update, dict):
+            return
+        now = time.perf_counter()
+        for message in update.get("messages") or []:
+            if isinstance(message, AIMessage):
+                for tool_call in message.tool_calls:
+                    if tool_call["name"].startswith(get_handoff_tool_name("")):
+                        continue
+                    self._tool_starts[tool_call["id"]] = (tool_call["name"], now)
+                    yield ProgressEvent(
+                        PROGRESS_TOOL_START_EVENT, agent=agent, tool=tool_call["name"]
+                    )
+            elif isinstance(message, ToolMessage) and message.tool_call_id in self._tool_starts:
+                name, started = self._tool_starts.pop(message.tool_call_id)
+                yield ProgressEvent(
+                    PROGRESS_TOOL_END_EVENT, agent=agent, tool=name, elapsed=now - started
+                )
@@ -0,0 +1,235 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AnyMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.graph import CompiledGraph
+from langgraph.utils.runnable import RunnableCallable
+from langmem.short_term import RunningSummary, asummarize_messages, summarize_messages
+
+from app.supervisor.constants import MAX_SUMMARY_TOKENS, SUMMARY_CACHE_SIZE, SUMMARY_INLINE_FACTOR
+from app.utils.async_runner import get_background_loop
+from app.utils.logger import get_logger
+from app.utils.token_counter import MESSAGE_TOKEN_CACHE_SIZE, MessageTokenCounter
+
+_logger = get_logger("summarizer")
+
+
+class ConversationSummarizer:
+    """Running summaries of the conversations, computed off the critical path.
+
+    The supervisor `pre_model_hook` replaces the summarized part of the
+    history by the running summary of the thread. With background
+    summarization, the summary is refreshed after a turn (`schedule`) while
+    the user reads the answer, and the hook only summarizes inline when the
+    unsummarized history exceeds `inline_max_tokens`.
+
+    Summaries are kept in memory, by thread: after a restart, the first turn
+    of a long thread summarizes inline. Each thread also has its own message
+    token counter, so the cached counts of one long thread are not evicted by
+    the messages of the other threads.
+    """
+
+    def __init__(self, max_tokens: int, inline_max_tokens: int, cache_size: int):
+        self._max_tokens = max_tokens
+        self._inline_max_tokens = inline_max_tokens
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._summaries: "OrderedDict[str, RunningSummary]" = OrderedDict()
+        # Model and token counter of the last turn of a thread, used to summarize it after the turn
+        self._models: "OrderedDict[str, Tuple[BaseChatModel, MessageTokenCounter]]" = (
+            OrderedDict()
+        )
+        self._running = set()
+        self._stats = {"inline": 0, "background": 0, "background_errors": 0}
+
+    def _get_summary(self, thread_id: Optional[str]) -> Optional[RunningSummary]:
+        with self._lock:
+            summary = self._summaries.get(thread_id)
+            if summary is not None:
+                self._summaries.move_to_end(thread_id)
+            return summary
+
+    def _set_summary(self, thread_id: Optional[str], summary: Optional[RunningSummary]):
+        if thread_id is None or summary is None:
+            return
+        with self._lock:
+            current = self._summaries.get(thread_id)
+            # A summary computed from an older history never replaces a newer one
+            if current is not None and len(current.summarized_message_ids) >= len(
+                summary.summarized_message_ids
+            ):
+                return
+            self._summaries[thread_id] = summary
+            self._summaries.move_to_end(thread_id)
+            while len(self._summaries) > self._cache_size:
+                evicted, _ = self._summaries.popitem(last=False)
+                self._models.pop(evicted, None)
+
+    def _summarize_kwargs(self, model, token_counter, inline: bool) -> Dict[str, Any]:
+        return {
+            "model": model,
+            "max_tokens": self._max_tokens,
+            "max_tokens_before_summary": self._inline_max_tokens if inline else None,
+            "token_counter": token_counter,
+        }
+
+    def _get_token_counter(self, thread_id: str, encoding_name: str) -> MessageTokenCounter:
+        # Called with the lock held
+        entry = self._models.get(thread_id)
+        if entry is not None and entry[1].encoding_name == encoding_name:
+            return entry[1]
+        return MessageTokenCounter(encoding_name, MESSAGE_TOKEN_CACHE_SIZE)
+
+    def create_hook(self, model: BaseChatModel, encoding_name: str) -> RunnableCallable:
+        """Create the supervisor `pre_model_hook` applying the running summary of the thread
+
+        Args:
+            model (BaseChatModel): model summarizing the history
+            encoding_name (str): tiktoken encoding of the token counters of the threads
+
+        Returns:
+            RunnableCallable: hook returning the model input as `llm_input_messages`
+        """
+        shared_token_counter = MessageTokenCounter(encoding_name, MESSAGE_TOKEN_CACHE_SIZE)
+
+        def prepare(state: Dict[str, Any], config: RunnableConfig):
+            thread_id = config.get("configurable", {}).get("thread_id")
+            token_counter = shared_token_counter
+            if thread_id is not None:
+                with self._lock:
+                    token_counter = self._get_token_counter(thread_id, encoding_name)
+                    self._models[thread_id] = (model, token_counter)
+                    self._models.move_to_end(thread_id)
+                    # Threads which never reach a summary are bounded like the summaries
+                    while len(self._models) > self._cache_size:
+                        self._models.popitem(last=False)
+            return thread_id, state["messages"], self._get_summary(thread_id), token_counter
+
+        def finish(thread_id, previous, result) -> Dict[str, List[AnyMessage]]:
+            if result.running_summary is not previous:
+                with self._lock:
+                    self._stats["inline"] += 1
+                self._set_summary(thread_id, result.running_summary)
+            return {"llm_input_messages": result.messages}
+
+        def summarize(state: Dict[str, Any], config: RunnableConfig):
+            thread_id, messages, summary, token_counter = prepare(state, config)
+            result = summarize_messages(
+                messages,
+                running_summary=summary,
+                **self._summarize_kwargs(model, token_counter, inline=True),
+            )
+            return finish(thread_id, summary, result)
+
+        async def asummarize(state: Dict[str, Any], config: RunnableConfig):
+            thread_id, messages, summary, token_counter = prepare(state, config)
+            result = await asummarize_messages(
+                messages,
+                running_summary=summary,
+                **self._summarize_kwargs(model, token_counter, inline=True),
+            )
+            return finish(thread_id, summary, result)
+
+        return RunnableCallable(summarize, asummarize, name="summarization", trace=False)
+
+    async def _summarize_thread(self, chatbot: CompiledGraph, config: RunnableConfig):
+        thread_id = config["configurable"]["thread_id"]
+        try:
+            with self._lock:
+                entry = self._models.get(thread_id)
+            if entry is None:
+                return  # Evicted since the turn
+            model, token_counter = entry
+            state = await chatbot.aget_state(config)
+            summary = self._get_summary(thread_id)
+            result = await asummarize_messages(
+                state.values.get("messages", []),
+                running_summary=summary,
+                **self._summarize_kwargs(model, token_counter, inline=False),
+            )
+            if result.running_summary is not summary:
+                with self._lock:
+                    self._stats["background"] += 1
+                self._set_summary(thread_id, result.running_summary)
+        except Exception as e:
+            with self._lock:
+                self._stats["background_errors"] += 1
+            _logger.exception(f"Background summarization error on thread {thread_id}: {e}")
+        finally:
+            with self._lock:
+                self._running.discard(thread_id)
+
+    def schedule(self, chatbot: CompiledGraph, config: RunnableConfig):
+        """Refresh the running summary of a thread after a turn, on the background loop"""
+        thread_id = config.get("configurable", {}).get("thread_id")
+        with self._lock:
+            if thread_id not in self._models or thread_id in self._running:
+                return
+            self._running.add(thread_id)
+        get_background_loop().submit(self._summarize_thread(chatbot, config))
+
+    def get_stats(self) -> Dict:
+        """Get the stats of the summarizer"""
+        with self._lock:
+            return {**self._stats, "threads": len(self._summaries), "running": len(self._running)}
+
+
+# Global summarizer instances: inline only, and with background summarization
+_inline_summarizer = ConversationSummarizer(
+    MAX_SUMMARY_TOKENS, MAX_SUMMARY_TOKENS, SUMMARY_CACHE_SIZE
+)
+_background_summarizer = ConversationSummarizer(
+    MAX_SUMMARY_TOKENS, MAX_SUMMARY_TOKENS * SUMMARY_INLINE_FACTOR, SUMMARY_CACHE_SIZE
+)
+
+
+def get_summarizer(background: bool) -> ConversationSummarizer:
+    """Get the process-wide conversation summarizer"""
+    return _background_summarizer if background else _inline_summarizer
+
+
+def schedule_summary(chatbot: CompiledGraph, config: RunnableConfig):
+    """Refresh the running summary of a thread after a turn (background summarization only)"""
+    _background_summarizer.schedule(chatbot, config)
+
+
+def get_summarizer_stats() -> Dict:
+    """Get the stats of the conversation summarizers"""
+    return {
+        "inline": _inline_summarizer.get_stats(),
+        "background": _background_summarizer.get_stats(),
+    }
+
+
+if __name__ == "__main__":
+    # Test: each thread keeps its token counts while other long threads take turns
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    from app.utils.token_counter import DEFAULT_ENCODING
+
+    summarizer = ConversationSummarizer(10**9, 10**9, SUMMARY_CACHE_SIZE)
+    hook = summarizer.create_hook(FakeListChatModel(responses=["요약"]), DEFAULT_ENCODING)
+    histories = {
+        f"thread-{thread}": [
+            message
+            for turn in range(500)
+            for message in (
+                HumanMessage(f"{turn}번째 질문", id=f"{thread}-h{turn}"),
+                AIMessage(f"{turn}번째 답변", id=f"{thread}-a{turn}"),
+            )
+        ]
+        for thread in range(6)
+    }
+    # 6000 messages in all, more than one counter cache
+    for _ in range(2):
+        for thread_id, messages in histories.items():
+            hook.invoke({"messages": messages}, {"configurable": {"thread_id": thread_id}})
+    for thread_id in histories:
+        stats = summarizer._models[thread_id][1].get_stats()
+        # Every message was tokenized once, the second turn only hit the cache
+        assert stats["misses"] == len(histories[thread_id]), stats
+    print("per-thread token counters:", summarizer._models["thread-0"][1].get_stats())
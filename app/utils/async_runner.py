@@ -0,0 +1,115 @@
+import asyncio
+import concurrent.futures
+import queue
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _StreamEnd:
+    """Marks the end of a bridged async iterator, with the error that ended it if any"""
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+
+
+class BackgroundLoop:
+    """Event loop running forever in a daemon thread.
+
+    Long-lived async resources (browsers, pooled sessions) are bound to the loop that
+    created them, so they are kept on this loop and driven from any thread or loop.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background loop (lazy initialization)"""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(target=loop.run_forever, name=self._name, daemon=True)
+                    thread.start()
+                    self._thread = thread
+                    self._loop = loop
+        return self._loop
+
+    def is_current(self) -> bool:
+        """Return whether the caller is running on the background loop thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background loop and block until it finishes"""
+        if self.is_current():
+            coro.close()
+            raise RuntimeError(f"{self._name}: blocking run() called from the loop thread itself")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> "concurrent.futures.Future":
+        """Schedule a coroutine on the background loop without waiting for it"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def arun(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Await a coroutine on the background loop from any running loop"""
+        if self.is_current():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    def iterate(self, aiterator: AsyncIterator[T], timeout: Optional[float] = None) -> Iterator[T]:
+        """Drive an async iterator on the background loop and yield its items synchronously
+
+        The iterator runs on the background loop while the caller consumes the
+        items from its own thread. Closing the returned iterator early (e.g. a
+        Streamlit rerun) cancels the async side.
+
+        Args:
+            aiterator (AsyncIterator[T]): async iterator to drive, e.g. `graph.astream(...)`
+            timeout (Optional[float]): maximum seconds to wait for each item
+
+        Returns:
+            Iterator[T]: items of the async iterator
+        """
+        if self.is_current():
+            raise RuntimeError(
+                f"{self._name}: blocking iterate() called from the loop thread itself"
+            )
+        items: queue.Queue = queue.Queue()
+
+        async def pump():
+            error = None
+            try:
+                async for item in aiterator:
+                    items.put(item)
+            except Exception as e:
+                error = e
+            finally:
+                if hasattr(aiterator, "aclose"):
+                    await aiterator.aclose()
+                items.put(_StreamEnd(error))
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self.loop)
+        try:
+            while True:
+                item = items.get(timeout=timeout)
+                if isinstance(item, _StreamEnd):
+                    if item.error is not None:
+                        raise item.error
+                    return
+                yield item
+        finally:
+            future.cancel()
+
+
+# Global background loop instance
+_background_loop = BackgroundLoop("tras-background-loop")
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Get the process-wide background loop"""
+    return _background_loop
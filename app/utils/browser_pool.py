@@ -0,0 +1,264 @@
+import asyncio
+import atexit
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from app.utils.async_runner import get_background_loop
+from app.utils.logger import get_logger
+
+_logger = get_logger("browser_pool")
+
+
+def _html_to_text(html: str) -> str:
+    """Extract text from a rendered page the same way PlaywrightURLLoader does"""
+    from unstructured.partition.html import partition_html
+
+    elements = partition_html(text=html)
+    return "\n\n".join([str(el) for el in elements])
+
+
+@dataclass
+class LoadedPage:
+    """Text of a rendered page with the validators of its HTTP response"""
+
+    url: str
+    content: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class _PooledContext:
+    """Browser context with the bookkeeping needed for recycling"""
+
+    context: BrowserContext
+    generation: int
+    pages_served: int = 0
+    active_pages: int = 0
+    retired: bool = False
+
+
+@dataclass
+class _ContextSlot:
+    """Slot of the pool holding the current context of a round-robin position"""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    current: Optional[_PooledContext] = None
+
+
+class BrowserPool:
+    """Long-lived Chromium browser serving pages from a pool of warm contexts.
+
+    Every Playwright object lives on the background loop, so synchronous and
+    asynchronous callers share the same browser. Contexts are recycled after
+    `recycle_after_pages` pages and the browser is relaunched when it crashes.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_concurrent_pages: int,
+        recycle_after_pages: int,
+        page_timeout_ms: int,
+        headless: bool = True,
+    ):
+        self._size = size
+        self._max_concurrent_pages = max_concurrent_pages
+        self._recycle_after_pages = recycle_after_pages
+        self._page_timeout_ms = page_timeout_ms
+        self._headless = headless
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._generation = 0
+        self._next_slot = 0
+        self._slots: List[_ContextSlot] = []
+        self._page_semaphore: Optional[asyncio.Semaphore] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            "pages": 0,
+            "failed_pages": 0,
+            "recycled_contexts": 0,
+            "browser_launches": 0,
+        }
+
+    def _init_primitives(self):
+        """Create the asyncio primitives on the background loop"""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+            self._page_semaphore = asyncio.Semaphore(self._max_concurrent_pages)
+            self._slots = [_ContextSlot() for _ in range(self._size)]
+
+    async def _ensure_browser(self) -> Browser:
+        """Return a connected browser, relaunching it after a crash"""
+        self._init_primitives()
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self._headless)
+                # Contexts of a previous browser are unusable from now on
+                self._generation += 1
+                self._stats["browser_launches"] += 1
+        return self._browser
+
+    async def _close_context(self, pooled: _PooledContext):
+        """Close a context, ignoring errors from an already crashed browser"""
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def _checkout(self) -> _PooledContext:
+        """Check out a context of the next slot, recycling it if needed"""
+        browser = await self._ensure_browser()
+        slot = self._slots[self._next_slot % self._size]
+        self._next_slot += 1
+
+        async with slot.lock:
+            pooled = slot.current
+            if (
+                pooled is None
+                or pooled.retired
+                or pooled.generation != self._generation
+                or pooled.pages_served >= self._recycle_after_pages
+            ):
+                if pooled is not None:
+                    pooled.retired = True
+                    self._stats["recycled_contexts"] += 1
+                    if pooled.active_pages == 0:
+                        await self._close_context(pooled)
+                pooled = _PooledContext(await browser.new_context(), self._generation)
+                slot.current = pooled
+
+            pooled.pages_served += 1
+            pooled.active_pages += 1
+            return pooled
+
+    async def _checkin(self, pooled: _PooledContext):
+        """Return a context to the pool, closing it once retired and idle"""
+        pooled.active_pages -= 1
+        if pooled.retired and pooled.active_pages == 0:
+            await self._close_context(pooled)
+
+    async def _fetch_html(self, url: str) -> Tuple[str, Dict[str, str]]:
+        """Render a URL on a pooled context and return the page source and headers"""
+        pooled = await self._checkout()
+        try:
+            page = await pooled.context.new_page()
+            try:
+                response = await page.goto(url, timeout=self._page_timeout_ms)
+                headers = response.headers if response is not None else {}
+                return await page.content(), headers
+            finally:
+                await page.close()
+        except Exception:
+            # The context may be broken (or the browser gone); never hand it out again
+            pooled.retired = True
+            raise
+        finally:
+            await self._checkin(pooled)
+
+    async def _load_one(self, url: str) -> Optional[LoadedPage]:
+        """Load a URL, retrying once after a browser crash"""
+        async with self._page_semaphore:
+            for attempt in range(2):
+                try:
+                    html, headers = await self._fetch_html(url)
+                    self._stats["pages"] += 1
+                    return LoadedPage(
+                        url=url,
+                        content=await asyncio.to_thread(_html_to_text, html),
+                        etag=headers.get("etag"),
+                        last_modified=headers.get("last-modified"),
+                    )
+                except Exception as e:
+                    crashed = self._browser is not None and not self._browser.is_connected()
+                    if attempt == 0 and crashed:
+                        continue
+                    self._stats["failed_pages"] += 1
+                    _logger.error(f"Error fetching or processing {url}, exception: {e}")
+                    return None
+
+    async def _load(self, urls: List[str]) -> List[Optional[LoadedPage]]:
+        """Load URLs concurrently, keeping None in place of the failed ones"""
+        await self._ensure_browser()
+        return await asyncio.gather(*[self._load_one(url) for url in urls])
+
+    async def _warm_up(self):
+        """Launch the browser and open every context ahead of the first request"""
+        browser = await self._ensure_browser()
+        for slot in self._slots:
+            async with slot.lock:
+                if slot.current is None:
+                    slot.current = _PooledContext(await browser.new_context(), self._generation)
+
+    async def _close(self):
+        """Close every context, the browser and Playwright"""
+        for slot in self._slots:
+            if slot.current is not None:
+                await self._close_context(slot.current)
+                slot.current = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def load(self, urls: List[str]) -> List[Optional[LoadedPage]]:
+        """Load pages of URLs (synchronous)"""
+        return get_background_loop().run(self._load(urls))
+
+    async def aload(self, urls: List[str]) -> List[Optional[LoadedPage]]:
+        """Load pages of URLs (asynchronous)"""
+        return await get_background_loop().arun(self._load(urls))
+
+    def warm_up(self):
+        """Launch the browser with warm contexts"""
+        get_background_loop().run(self._warm_up())
+
+    def close(self):
+        """Shut the pool down"""
+        if self._browser is not None or self._playwright is not None:
+            get_background_loop().run(self._close())
+
+    def get_stats(self) -> Dict:
+        """Get the usage stats of the pool"""
+        return {
+            **self._stats,
+            "contexts": sum(1 for slot in self._slots if slot.current is not None),
+            "active_pages": sum(
+                slot.current.active_pages for slot in self._slots if slot.current is not None
+            ),
+        }
+
+
+def create_browser_pool(
+    size: int,
+    max_concurrent_pages: int,
+    recycle_after_pages: int,
+    page_timeout_ms: int,
+) -> BrowserPool:
+    """Create a browser pool which is shut down at interpreter exit"""
+    pool = BrowserPool(
+        size=size,
+        max_concurrent_pages=max_concurrent_pages,
+        recycle_after_pages=recycle_after_pages,
+        page_timeout_ms=page_timeout_ms,
+    )
+    atexit.register(pool.close)
+    return pool
+
+
+if __name__ == "__main__":
+    # Test
+    pool = create_browser_pool(
+        size=2, max_concurrent_pages=3, recycle_after_pages=2, page_timeout_ms=30000
+    )
+    for _ in range(3):
+        pages = pool.load(["https://m.blog.naver.com/mjkwon7471/223904255047"])
+        print([page and len(page.content) for page in pages])
+    print(pool.get_stats())
@@ -0,0 +1,4 @@
+TOOL_CACHE_FILE = "tool_results.sqlite3"
+TOOL_CACHE_MEMORY_SIZE = 512
+# Seconds a call waits for the identical in-flight call before computing the result itself
+TOOL_CACHE_WAIT_TIMEOUT = 60
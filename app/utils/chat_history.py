@@ -0,0 +1,124 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from app.utils.env_constants import DATA_DIR
+from app.utils.ui_constants import CHAT_HISTORY_DB_FILE, CHAT_HISTORY_IDLE_TTL
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_messages (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+"""
+
+
+class ChatHistoryStore:
+    """Chat history of the UI sessions, kept out of the Streamlit session state.
+
+    Messages are appended to a per-session log and read back one page at a
+    time, so a rerun only loads and renders the messages on screen however
+    long the conversation is. Sessions idle for longer than `idle_ttl` are
+    deleted when the store is opened.
+    """
+
+    def __init__(self, path: Path, idle_ttl: int):
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            """
+            DELETE FROM chat_messages WHERE session_id IN (
+                SELECT session_id FROM chat_messages
+                GROUP BY session_id HAVING MAX(created_at) < ?
+            )
+            """,
+            (time.time() - idle_ttl,),
+        )
+
+    def _count(self, session_id: str) -> int:
+        # Called with the lock held; sequence numbers are contiguous from 0, and the primary key
+        # index answers MAX(seq) without scanning the session
+        (max_seq,) = self._conn.execute(
+            "SELECT MAX(seq) FROM chat_messages WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return 0 if max_seq is None else max_seq + 1
+
+    def count(self, session_id: str) -> int:
+        """Return the number of messages of a session"""
+        with self._lock:
+            return self._count(session_id)
+
+    def append(self, session_id: str, role: str, content: str):
+        """Append a message to a session"""
+        # The sequence number is taken and used under one lock so concurrent appends don't collide
+        with self._lock:
+            seq = self._count(session_id)
+            self._conn.execute(
+                "INSERT INTO chat_messages VALUES (?, ?, ?, ?, ?)",
+                (session_id, seq, role, content, time.time()),
+            )
+
+    def get_last(self, session_id: str, limit: int) -> List[Tuple[str, str]]:
+        """Return the last messages of a session as (role, content), oldest first
+
+        Args:
+            session_id (str): session id
+            limit (int): number of messages
+
+        Returns:
+            List[Tuple[str, str]]: messages as (role, content)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT role, content FROM chat_messages
+                WHERE session_id = ? ORDER BY seq DESC LIMIT ?
+                """,
+                (session_id, limit),
+            ).fetchall()
+        return rows[::-1]
+
+    def delete_session(self, session_id: str):
+        """Delete the messages of a session"""
+        with self._lock:
+            self._conn.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
+
+
+# Global store instance
+_store = ChatHistoryStore(Path(DATA_DIR) / CHAT_HISTORY_DB_FILE, CHAT_HISTORY_IDLE_TTL)
+
+
+def get_chat_history_store() -> ChatHistoryStore:
+    """Get the process-wide chat history store"""
+    return _store
+
+
+if __name__ == "__main__":
+    # Benchmark: time to load the rendered page of a session, by conversation length
+    import tempfile
+
+    from app.utils.ui_constants import CHAT_HISTORY_PAGE_SIZE
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ChatHistoryStore(Path(tmp) / CHAT_HISTORY_DB_FILE, CHAT_HISTORY_IDLE_TTL)
+        itinerary = "## 1일차\n- 성산일출봉\n- 흑돼지 맛집\n" * 100
+        for n_messages in (20, 200, 2000):
+            session_id = f"session-{n_messages}"
+            for i in range(n_messages):
+                store.append(session_id, "user" if i % 2 == 0 else "assistant", itinerary)
+            start = time.perf_counter()
+            for _ in range(100):
+                page = store.get_last(session_id, CHAT_HISTORY_PAGE_SIZE)
+            elapsed = (time.perf_counter() - start) / 100
+            print(f"{n_messages:>5} messages: {len(page)} loaded in {elapsed * 1000:.2f} ms")
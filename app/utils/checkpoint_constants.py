@@ -0,0 +1,18 @@
+CHECKPOINT_DB_FILE = "checkpoints.sqlite3"
+
+# Retention: last checkpoints kept per thread (and namespace), and how long an idle thread lives
+CHECKPOINT_KEEP_LAST = 20
+CHECKPOINT_THREAD_IDLE_TTL = 60 * 60 * 24 * 7
+CHECKPOINT_EVICTION_INTERVAL = 60 * 10
+
+# Write batching: buffered writes are flushed when the batch is full, on reads and periodically
+CHECKPOINT_WRITE_BATCH_SIZE = 64
+CHECKPOINT_FLUSH_INTERVAL = 1.0
+
+# Serialized checkpoint payloads of at least this size are zlib-compressed
+CHECKPOINT_COMPRESSION_MIN_BYTES = 1024
+CHECKPOINT_COMPRESSION_LEVEL = 3
+
+# Message channels stored once in a per-thread log instead of being snapshotted by every checkpoint
+CHECKPOINT_DELTA_CHANNELS = ("messages",)
+CHECKPOINT_MESSAGE_LOG_CACHE_SIZE = 256
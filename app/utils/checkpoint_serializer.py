@@ -0,0 +1,133 @@
+import zlib
+from typing import Any, Optional, Tuple
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+COMPRESSION_SUFFIX = "+zlib"
+
+
+class CompressedSerializer(SerializerProtocol):
+    """Checkpoint serializer compressing large payloads.
+
+    Values are encoded by the wrapped serializer (msgpack for the default
+    `JsonPlusSerializer`). Payloads of at least `min_size` bytes, typically
+    message lists carrying blog pages and search results in ToolMessages, are
+    zlib-compressed and tagged with a `+zlib` type suffix. Untagged payloads
+    written before compression was enabled are still read as is.
+    """
+
+    def __init__(
+        self,
+        min_size: int,
+        level: int,
+        serde: Optional[SerializerProtocol] = None,
+    ):
+        self._min_size = min_size
+        self._level = level
+        self._serde = serde or JsonPlusSerializer()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        type_, data = self._serde.dumps_typed(obj)
+        if len(data) < self._min_size:
+            return type_, data
+        compressed = zlib.compress(data, self._level)
+        if len(compressed) >= len(data):
+            return type_, data
+        return f"{type_}{COMPRESSION_SUFFIX}", compressed
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(COMPRESSION_SUFFIX):
+            return self._serde.loads_typed(
+                (type_[: -len(COMPRESSION_SUFFIX)], zlib.decompress(payload))
+            )
+        return self._serde.loads_typed(data)
+
+
+if __name__ == "__main__":
+    # Benchmark: bytes and (de)serialization time of the checkpoints of a trip planning session
+    import random
+    import time
+
+    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+    from langgraph.checkpoint.base import empty_checkpoint
+
+    from app.utils.checkpoint_constants import (
+        CHECKPOINT_COMPRESSION_LEVEL,
+        CHECKPOINT_COMPRESSION_MIN_BYTES,
+    )
+
+    rng = random.Random(0)
+    places = ["성산일출봉", "우도", "한라산", "협재 해수욕장", "동문시장", "섭지코지", "오설록"]
+    foods = ["흑돼지", "고기국수", "갈치조림", "해물뚝배기", "전복죽", "몸국"]
+
+    def make_blog_page() -> str:
+        """A blog page of about 5KB, varied enough not to compress unrealistically well"""
+        lines = []
+        for day in range(1, 25):
+            place, food = rng.choice(places), rng.choice(foods)
+            hour, fee = rng.randint(7, 11), rng.randint(1, 9)
+            price, wait = rng.randint(8, 25), rng.randint(0, 90)
+            lines.append(
+                f"{day}일차 {hour}시에 {place}에 도착했어요. 입장료 {fee}천원, "
+                f"점심은 {food} 맛집에서 {price}천원에 먹었고 웨이팅 {wait}분."
+            )
+        return "\n".join(lines)
+
+    def make_search_results() -> str:
+        return str(
+            [
+                {
+                    "title": f"{rng.choice(places)} {rng.choice(foods)} 후기",
+                    "link": f"https://blog.naver.com/{rng.randint(0, 9999)}/{rng.getrandbits(40)}",
+                    "description": f"{rng.choice(places)} 근처 {rng.choice(foods)} 맛집 정보",
+                }
+                for _ in range(10)
+            ]
+        )
+
+    def make_turn(turn: int):
+        tool_call = {"name": "naver_blog_search", "args": {"query": "제주 맛집"}, "id": f"c{turn}"}
+        return [
+            HumanMessage(f"{turn}번째 질문: 제주도 여행 일정을 짜줘", id=f"h{turn}"),
+            AIMessage("", id=f"a{turn}", tool_calls=[tool_call]),
+            ToolMessage(make_search_results(), tool_call_id=f"c{turn}", id=f"t{turn}"),
+            ToolMessage(make_blog_page(), tool_call_id=f"c{turn}", id=f"w{turn}"),
+            AIMessage(f"{turn}번째 답변:\n{make_blog_page()[:800]}", id=f"r{turn}"),
+        ]
+
+    checkpoints, messages = [], []
+    for turn in range(50):
+        messages = messages + make_turn(turn)
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": messages}
+        checkpoints.append(checkpoint)
+
+    serializers = {
+        "default (msgpack)": JsonPlusSerializer(),
+        "compressed": CompressedSerializer(
+            CHECKPOINT_COMPRESSION_MIN_BYTES, CHECKPOINT_COMPRESSION_LEVEL
+        ),
+    }
+    for name, serde in serializers.items():
+        start = time.perf_counter()
+        dumped = [serde.dumps_typed(checkpoint) for checkpoint in checkpoints]
+        dumps_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for data in dumped:
+            serde.loads_typed(data)
+        loads_time = time.perf_counter() - start
+
+        total = sum(len(data) for _, data in dumped)
+        print(
+            f"{name:>18}: {total / len(dumped) / 1024:8.1f} KiB/checkpoint, "
+            f"dumps {dumps_time / len(dumped) * 1000:6.2f} ms, "
+            f"loads {loads_time / len(dumped) * 1000:6.2f} ms"
+        )
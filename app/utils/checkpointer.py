@@ -0,0 +1,769 @@
+import asyncio
+import atexit
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from app.utils.checkpoint_constants import (
+    CHECKPOINT_COMPRESSION_LEVEL,
+    CHECKPOINT_COMPRESSION_MIN_BYTES,
+    CHECKPOINT_DB_FILE,
+    CHECKPOINT_DELTA_CHANNELS,
+    CHECKPOINT_EVICTION_INTERVAL,
+    CHECKPOINT_FLUSH_INTERVAL,
+    CHECKPOINT_KEEP_LAST,
+    CHECKPOINT_MESSAGE_LOG_CACHE_SIZE,
+    CHECKPOINT_THREAD_IDLE_TTL,
+    CHECKPOINT_WRITE_BATCH_SIZE,
+)
+from app.utils.checkpoint_serializer import CompressedSerializer
+from app.utils.env_constants import DATA_DIR
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    min_seq INTEGER,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    thread_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    message_id TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    PRIMARY KEY (thread_id, seq)
+);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS threads_updated_at ON threads (updated_at);
+"""
+
+_Operation = Tuple[str, Tuple]
+
+# Stored in place of a delta channel: [start, end) ranges of the thread message log
+MESSAGE_RANGES_KEY = "__message_log_ranges__"
+
+
+@dataclass
+class _LoggedMessage:
+    seq: int
+    digest: str
+    message: Optional[BaseMessage] = None
+
+
+class _MessageLog:
+    """In-memory index of the message log of a thread: latest logged version of each id"""
+
+    def __init__(self, next_seq: int = 0):
+        self.next_seq = next_seq
+        self.by_id: Dict[str, _LoggedMessage] = {}
+
+
+def _is_message_list(value: Any) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(message, BaseMessage) and message.id for message in value
+    )
+
+
+def _to_ranges(seqs: List[int]) -> List[List[int]]:
+    """Compress a list of log positions into ordered [start, end) ranges"""
+    ranges: List[List[int]] = []
+    for seq in seqs:
+        if ranges and ranges[-1][1] == seq:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([seq, seq + 1])
+    return ranges
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[int]):
+    """Durable, bounded checkpointer on a single SQLite file.
+
+    - Retention: only the last `keep_last` checkpoints of each thread (and
+      namespace) are kept. Checkpoints of finished sub-agent runs (non-root
+      namespaces) are dropped as soon as the parent graph checkpoints again.
+    - Threads idle for longer than `thread_idle_ttl` seconds are evicted.
+    - Writes are buffered and flushed in one transaction when the batch is
+      full, before any read, periodically by a daemon thread and at exit.
+    - Message channels listed in `delta_channels` are not snapshotted: each
+      message is written once to an append-only per-thread log and a
+      checkpoint only records ranges of that log, so a step appending one
+      message writes one message instead of the whole history. Messages are
+      read back from the log when a checkpoint is loaded.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        keep_last: int,
+        thread_idle_ttl: int,
+        eviction_interval: int,
+        write_batch_size: int,
+        flush_interval: float,
+        delta_channels: Sequence[str],
+        message_log_cache_size: int,
+        serde: Optional[SerializerProtocol] = None,
+    ):
+        super().__init__(serde=serde)
+        self._keep_last = keep_last
+        self._thread_idle_ttl = thread_idle_ttl
+        self._eviction_interval = eviction_interval
+        self._write_batch_size = write_batch_size
+        self._delta_channels = tuple(delta_channels)
+        self._message_log_cache_size = message_log_cache_size
+        self._message_logs: "OrderedDict[str, _MessageLog]" = OrderedDict()
+
+        self._lock = threading.RLock()
+        self._buffer: List[_Operation] = []
+        self._touched: Dict[Tuple[str, str], str] = {}
+        self._last_eviction = 0.0
+        self._stats = {
+            "flushes": 0,
+            "buffered_writes": 0,
+            "bytes_written": 0,
+            "logged_messages": 0,
+            "reused_messages": 0,
+            "pruned": 0,
+            "evicted_threads": 0,
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(checkpoints)")]
+        if "min_seq" not in columns:
+            self._conn.execute("ALTER TABLE checkpoints ADD COLUMN min_seq INTEGER")
+
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="checkpoint-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    # Write buffer
+
+    def _enqueue(self, operations: List[_Operation], touched: Optional[Tuple[str, str, str]]):
+        with self._lock:
+            self._buffer.extend(operations)
+            self._stats["buffered_writes"] += len(operations)
+            self._stats["bytes_written"] += sum(
+                len(param)
+                for _, params in operations
+                for param in params
+                if isinstance(param, bytes)
+            )
+            if touched is not None:
+                thread_id, checkpoint_ns, checkpoint_id = touched
+                self._touched[(thread_id, checkpoint_ns)] = checkpoint_id
+            if len(self._buffer) >= self._write_batch_size:
+                self.flush()
+
+    def _flush_periodically(self, interval: float):
+        while not self._closed.wait(interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass
+
+    def flush(self):
+        """Write the buffered operations and apply the retention policy"""
+        with self._lock:
+            if not self._buffer and not self._touched:
+                return
+            operations, self._buffer = self._buffer, []
+            touched, self._touched = self._touched, {}
+
+            self._conn.execute("BEGIN")
+            try:
+                for sql, params in operations:
+                    self._conn.execute(sql, params)
+                for (thread_id, checkpoint_ns), checkpoint_id in touched.items():
+                    self._prune(thread_id, checkpoint_ns, checkpoint_id)
+                for thread_id in {thread_id for thread_id, _ in touched}:
+                    self._collect_messages(thread_id)
+                self._evict_idle_threads()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                # The indexes may refer to rolled back log rows: rebuild them from the database
+                for thread_id in {params[0] for _, params in operations} | {
+                    thread_id for thread_id, _ in touched
+                }:
+                    self._message_logs.pop(thread_id, None)
+                raise
+            self._stats["flushes"] += 1
+
+    # Retention
+
+    def _delete_checkpoints(self, where: str, params: Tuple):
+        for table in ("writes", "checkpoints"):
+            cursor = self._conn.execute(
+                f"""
+                DELETE FROM {table} WHERE (thread_id, checkpoint_ns, checkpoint_id) IN (
+                    SELECT thread_id, checkpoint_ns, checkpoint_id FROM checkpoints WHERE {where}
+                )
+                """,
+                params,
+            )
+        self._stats["pruned"] += cursor.rowcount
+
+    def _prune(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str):
+        """Keep the last checkpoints of a namespace and drop finished sub-agent runs"""
+        self._delete_checkpoints(
+            """
+            thread_id = ? AND checkpoint_ns = ? AND checkpoint_id NOT IN (
+                SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?
+                ORDER BY checkpoint_id DESC LIMIT ?
+            )
+            """,
+            (thread_id, checkpoint_ns, thread_id, checkpoint_ns, self._keep_last),
+        )
+        if checkpoint_ns == "":
+            # Sub-agent tasks of previous supersteps are over once the root checkpoints
+            self._delete_checkpoints(
+                "thread_id = ? AND checkpoint_ns != '' AND checkpoint_id < ?",
+                (thread_id, checkpoint_id),
+            )
+
+    def _collect_messages(self, thread_id: str):
+        """Drop the head of the message log no retained checkpoint refers to anymore"""
+        min_seq = self._conn.execute(
+            "SELECT MIN(min_seq) FROM checkpoints WHERE thread_id = ?", (thread_id,)
+        ).fetchone()[0]
+        if min_seq is None:
+            return
+        self._conn.execute(
+            "DELETE FROM messages WHERE thread_id = ? AND seq < ?", (thread_id, min_seq)
+        )
+        if (log := self._message_logs.get(thread_id)) is not None:
+            log.by_id = {
+                message_id: logged
+                for message_id, logged in log.by_id.items()
+                if logged.seq >= min_seq
+            }
+
+    def _evict_idle_threads(self):
+        now = time.time()
+        if now - self._last_eviction < self._eviction_interval:
+            return
+        self._last_eviction = now
+        idle_threads = [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT thread_id FROM threads WHERE updated_at < ?",
+                (now - self._thread_idle_ttl,),
+            )
+        ]
+        for thread_id in idle_threads:
+            self._delete_thread_rows(thread_id)
+        self._stats["evicted_threads"] += len(idle_threads)
+
+    def _delete_thread_rows(self, thread_id: str):
+        for table in ("writes", "checkpoints", "messages", "threads"):
+            self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+        self._message_logs.pop(thread_id, None)
+
+    # Message log
+
+    def _get_message_log(self, thread_id: str) -> _MessageLog:
+        """Get the message log index of a thread, rebuilding it from the database on a miss"""
+        log = self._message_logs.get(thread_id)
+        if log is not None:
+            self._message_logs.move_to_end(thread_id)
+            return log
+
+        self.flush()
+        log = _MessageLog()
+        for seq, message_id, digest in self._conn.execute(
+            "SELECT seq, message_id, digest FROM messages WHERE thread_id = ? ORDER BY seq",
+            (thread_id,),
+        ):
+            log.by_id[message_id] = _LoggedMessage(seq, digest)
+            log.next_seq = seq + 1
+
+        self._message_logs[thread_id] = log
+        while len(self._message_logs) > self._message_log_cache_size:
+            self._message_logs.popitem(last=False)
+        return log
+
+    def _log_messages(
+        self, thread_id: str, messages: List[BaseMessage]
+    ) -> Tuple[List[int], List[_Operation]]:
+        """Append the new or changed messages to the thread log and return the positions of all"""
+        log = self._get_message_log(thread_id)
+        seqs, operations = [], []
+        for message in messages:
+            logged = log.by_id.get(message.id)
+            if logged is not None and logged.message is not None and logged.message == message:
+                seqs.append(logged.seq)
+                self._stats["reused_messages"] += 1
+                continue
+
+            type_, value = self.serde.dumps_typed(message)
+            digest = hashlib.sha1(type_.encode() + value).hexdigest()
+            if logged is not None and logged.digest == digest:
+                logged.message = message
+                seqs.append(logged.seq)
+                self._stats["reused_messages"] += 1
+                continue
+
+            seq = log.next_seq
+            log.next_seq += 1
+            log.by_id[message.id] = _LoggedMessage(seq, digest, message)
+            operations.append(
+                (
+                    "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)",
+                    (thread_id, seq, message.id, digest, type_, value),
+                )
+            )
+            seqs.append(seq)
+            self._stats["logged_messages"] += 1
+        return seqs, operations
+
+    def _load_messages(self, thread_id: str, ranges: List[List[int]]) -> List[BaseMessage]:
+        messages = []
+        for start, end in ranges:
+            rows = self._conn.execute(
+                "SELECT type, value FROM messages WHERE thread_id = ? AND seq >= ? AND seq < ? "
+                "ORDER BY seq",
+                (thread_id, start, end),
+            )
+            messages.extend(self.serde.loads_typed(row) for row in rows)
+        return messages
+
+    # Reads
+
+    def _make_tuple(
+        self, thread_id: str, checkpoint_ns: str, row: Tuple, writes: List[Tuple]
+    ) -> CheckpointTuple:
+        checkpoint_id, parent_checkpoint_id, type_, checkpoint, metadata_type, metadata = row
+        checkpoint = self.serde.loads_typed((type_, checkpoint))
+        channel_values = checkpoint["channel_values"]
+        for channel, value in channel_values.items():
+            if isinstance(value, dict) and MESSAGE_RANGES_KEY in value:
+                channel_values[channel] = self._load_messages(thread_id, value[MESSAGE_RANGES_KEY])
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=checkpoint,
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ],
+        )
+
+    def _select_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List:
+        return self._conn.execute(
+            """
+            SELECT task_id, channel, type, value FROM writes
+            WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+            ORDER BY task_id, idx
+            """,
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get the requested checkpoint of a thread, or its latest one"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = "checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata"
+        with self._lock:
+            self.flush()
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            if row is None:
+                return None
+            writes = self._select_writes(thread_id, checkpoint_ns, row[0])
+            return self._make_tuple(thread_id, checkpoint_ns, row, writes)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints from the newest to the oldest"""
+        conditions, params = [], []
+        if config is not None:
+            conditions.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                conditions.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                conditions.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            conditions.append("checkpoint_id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, "
+                f"checkpoint, metadata_type, metadata FROM checkpoints {where} "
+                "ORDER BY checkpoint_id DESC",
+                params,
+            ).fetchall()
+
+        for thread_id, checkpoint_ns, *row in rows:
+            if limit is not None and limit <= 0:
+                break
+            metadata = self.serde.loads_typed((row[4], row[5]))
+            if filter and not all(metadata.get(key) == value for key, value in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            with self._lock:
+                writes = self._select_writes(thread_id, checkpoint_ns, row[0])
+                checkpoint_tuple = self._make_tuple(thread_id, checkpoint_ns, tuple(row), writes)
+            yield checkpoint_tuple
+
+    # Writes
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Buffer a checkpoint of a thread"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+
+        operations, min_seq = [], None
+        channel_values = dict(checkpoint["channel_values"])
+        with self._lock:
+            for channel in self._delta_channels:
+                messages = channel_values.get(channel)
+                if not messages or not _is_message_list(messages):
+                    continue
+                seqs, message_operations = self._log_messages(thread_id, messages)
+                operations.extend(message_operations)
+                channel_values[channel] = {MESSAGE_RANGES_KEY: _to_ranges(seqs)}
+                min_seq = min(seqs) if min_seq is None else min(min_seq, *seqs)
+
+        type_, serialized_checkpoint = self.serde.dumps_typed(
+            {**checkpoint, "channel_values": channel_values}
+        )
+        metadata_type, serialized_metadata = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        self._enqueue(
+            [
+                *operations,
+                (
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint["id"],
+                        config["configurable"].get("checkpoint_id"),
+                        type_,
+                        serialized_checkpoint,
+                        metadata_type,
+                        serialized_metadata,
+                        min_seq,
+                    ),
+                ),
+                (
+                    "INSERT OR REPLACE INTO threads VALUES (?, ?)",
+                    (thread_id, time.time()),
+                ),
+            ],
+            touched=(thread_id, checkpoint_ns, checkpoint["id"]),
+        )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Buffer the pending writes of a task"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        # Special writes (errors, interrupts, ...) replace each other, regular ones are kept once
+        verb = "REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "IGNORE"
+        operations = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized_value = self.serde.dumps_typed(value)
+            operations.append(
+                (
+                    f"INSERT OR {verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                        task_id,
+                        WRITES_IDX_MAP.get(channel, idx),
+                        channel,
+                        type_,
+                        serialized_value,
+                        task_path,
+                    ),
+                )
+            )
+        self._enqueue(operations, touched=None)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint and write of a thread"""
+        with self._lock:
+            self.flush()
+            self._conn.execute("BEGIN")
+            self._delete_thread_rows(thread_id)
+            self._conn.execute("COMMIT")
+
+    # Async versions, SQLite calls run in a worker thread
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        checkpoint_tuples = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint_tuple in checkpoint_tuples:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def get_stats(self) -> Dict:
+        """Get the flush, retention and size stats of the checkpointer"""
+        with self._lock:
+            self.flush()
+            checkpoints = self._conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+            threads = self._conn.execute("SELECT COUNT(*) FROM threads").fetchone()[0]
+            return {**self._stats, "checkpoints": checkpoints, "threads": threads}
+
+    def close(self):
+        """Flush the buffered writes and close the database"""
+        self._closed.set()
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+def create_checkpointer() -> SqliteCheckpointSaver:
+    """Create the process checkpointer and flush it at exit"""
+    checkpointer = SqliteCheckpointSaver(
+        Path(DATA_DIR) / CHECKPOINT_DB_FILE,
+        keep_last=CHECKPOINT_KEEP_LAST,
+        thread_idle_ttl=CHECKPOINT_THREAD_IDLE_TTL,
+        eviction_interval=CHECKPOINT_EVICTION_INTERVAL,
+        write_batch_size=CHECKPOINT_WRITE_BATCH_SIZE,
+        flush_interval=CHECKPOINT_FLUSH_INTERVAL,
+        delta_channels=CHECKPOINT_DELTA_CHANNELS,
+        message_log_cache_size=CHECKPOINT_MESSAGE_LOG_CACHE_SIZE,
+        serde=CompressedSerializer(CHECKPOINT_COMPRESSION_MIN_BYTES, CHECKPOINT_COMPRESSION_LEVEL),
+    )
+    atexit.register(checkpointer.close)
+    return checkpointer
+
+
+if __name__ == "__main__":
+    # Benchmark: bytes written by the checkpoints of a 50-turn session, snapshots vs message log
+    import random
+    import tempfile
+
+    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+    from langgraph.checkpoint.base import empty_checkpoint
+
+    from app.utils.checkpoint_serializer import CompressedSerializer
+
+    rng = random.Random(0)
+
+    def make_text(size: int) -> str:
+        return "".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(size))
+
+    def run_session(delta_channels: Sequence[str]) -> Dict:
+        with tempfile.TemporaryDirectory() as directory:
+            saver = SqliteCheckpointSaver(
+                Path(directory) / CHECKPOINT_DB_FILE,
+                keep_last=CHECKPOINT_KEEP_LAST,
+                thread_idle_ttl=CHECKPOINT_THREAD_IDLE_TTL,
+                eviction_interval=CHECKPOINT_EVICTION_INTERVAL,
+                write_batch_size=CHECKPOINT_WRITE_BATCH_SIZE,
+                flush_interval=CHECKPOINT_FLUSH_INTERVAL,
+                delta_channels=delta_channels,
+                message_log_cache_size=CHECKPOINT_MESSAGE_LOG_CACHE_SIZE,
+                serde=CompressedSerializer(
+                    CHECKPOINT_COMPRESSION_MIN_BYTES, CHECKPOINT_COMPRESSION_LEVEL
+                ),
+            )
+            config = {"configurable": {"thread_id": "bench", "checkpoint_ns": ""}}
+            messages = []
+            start = time.perf_counter()
+            for turn in range(50):
+                for message in [
+                    HumanMessage(make_text(50), id=f"h{turn}"),
+                    ToolMessage(make_text(1500), tool_call_id=f"c{turn}", id=f"t{turn}"),
+                    AIMessage(make_text(300), id=f"a{turn}"),
+                ]:
+                    messages = messages + [message]
+                    checkpoint = empty_checkpoint()
+                    checkpoint["channel_values"] = {"messages": messages}
+                    config = saver.put(config, checkpoint, {}, {})
+            elapsed = time.perf_counter() - start
+            restored = saver.get_tuple(config).checkpoint["channel_values"]["messages"]
+            assert [message.id for message in restored] == [message.id for message in messages]
+            stats = saver.get_stats()
+            saver.close()
+        return {"bytes_written": stats["bytes_written"], "seconds": elapsed}
+
+    def test_failed_flush():
+        """A checkpoint written after a failed flush still restores every message"""
+        with tempfile.TemporaryDirectory() as directory:
+            saver = SqliteCheckpointSaver(
+                Path(directory) / CHECKPOINT_DB_FILE,
+                keep_last=CHECKPOINT_KEEP_LAST,
+                thread_idle_ttl=CHECKPOINT_THREAD_IDLE_TTL,
+                eviction_interval=CHECKPOINT_EVICTION_INTERVAL,
+                write_batch_size=CHECKPOINT_WRITE_BATCH_SIZE,
+                flush_interval=CHECKPOINT_FLUSH_INTERVAL,
+                delta_channels=CHECKPOINT_DELTA_CHANNELS,
+                message_log_cache_size=CHECKPOINT_MESSAGE_LOG_CACHE_SIZE,
+            )
+            config = {"configurable": {"thread_id": "failure", "checkpoint_ns": ""}}
+            messages = [HumanMessage("제주도 일정을 짜줘", id="h0")]
+            checkpoint = empty_checkpoint()
+            checkpoint["channel_values"] = {"messages": messages}
+            saver.put(config, checkpoint, {}, {})
+
+            prune = saver._prune
+            saver._prune = lambda *args: (_ for _ in ()).throw(sqlite3.OperationalError("disk I/O"))
+            try:
+                saver.flush()
+            except sqlite3.OperationalError:
+                pass
+            saver._prune = prune
+
+            messages = messages + [AIMessage("1일차: 성산일출봉", id="a0")]
+            checkpoint = empty_checkpoint()
+            checkpoint["channel_values"] = {"messages": messages}
+            config = saver.put(config, checkpoint, {}, {})
+            restored = saver.get_tuple(config).checkpoint["channel_values"]["messages"]
+            assert [message.id for message in restored] == ["h0", "a0"], restored
+            saver.close()
+
+    test_failed_flush()
+
+    for name, delta_channels in [("snapshots", ()), ("message log", CHECKPOINT_DELTA_CHANNELS)]:
+        result = run_session(delta_channels)
+        print(
+            f"{name:>12}: {result['bytes_written'] / 1024 / 1024:7.2f} MiB written, "
+            f"{result['seconds']:.2f}s"
+        )
@@ -0,0 +1,201 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.utils.token_counter import count_text_tokens
+
+_WORD_PATTERN = re.compile(r"\w+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lexical terms.
+
+    Korean words also yield their character bigrams so that particles attached
+    to a noun (e.g. "제주도에서") still match the bare noun ("제주도").
+    """
+    terms = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        terms.append(word)
+        if len(word) > 2 and _HANGUL_PATTERN.search(word):
+            terms.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+class BM25:
+    """Okapi BM25 scorer over a small in-memory corpus"""
+
+    def __init__(self, documents: Sequence[List[str]], k1: float = 1.5, b: float = 0.75):
+        self._k1 = k1
+        self._b = b
+        self._term_freqs = [Counter(document) for document in documents]
+        self._lengths = [len(document) for document in documents]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if documents else 0.0
+
+        doc_freqs: Counter = Counter()
+        for term_freq in self._term_freqs:
+            doc_freqs.update(term_freq.keys())
+        n = len(documents)
+        self._idf = {
+            term: math.log(1 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in doc_freqs.items()
+        }
+
+    def score(self, query_terms: List[str]) -> List[float]:
+        """Score every document of the corpus against the query terms"""
+        scores = []
+        for term_freq, length in zip(self._term_freqs, self._lengths, strict=True):
+            norm = self._k1 * (1 - self._b + self._b * length / (self._avg_length or 1))
+            score = 0.0
+            for term in query_terms:
+                freq = term_freq.get(term)
+                if freq:
+                    score += self._idf[term] * freq * (self._k1 + 1) / (freq + norm)
+            scores.append(score)
+        return scores
+
+
+class RelevantChunkExtractor:
+    """Shrinks loaded pages to the chunks most relevant to a query.
+
+    Pages are stripped of boilerplate lines, packed into chunks of about
+    `chunk_chars` characters and ranked with BM25 against the query. The best
+    `top_k` chunks fitting in `token_budget` are kept in their original order.
+    Without a query the leading chunks of each page are kept instead.
+    """
+
+    def __init__(
+        self,
+        chunk_chars: int,
+        top_k: int,
+        token_budget: int,
+        boilerplate_patterns: Sequence[str],
+    ):
+        self._chunk_chars = chunk_chars
+        self._top_k = top_k
+        self._token_budget = token_budget
+        self._boilerplate = re.compile("|".join(f"(?:{p})" for p in boilerplate_patterns))
+        self._stats = {"pages": 0, "tokens_before": 0, "tokens_after": 0}
+
+    def _split_line(self, line: str) -> List[str]:
+        """Cut a line longer than a chunk (e.g. a post written as one paragraph) into pieces
+
+        Pieces end at the last sentence end or space of their second half, or are
+        cut at `chunk_chars` when there is none.
+        """
+        pieces = []
+        while len(line) > self._chunk_chars:
+            window = line[: self._chunk_chars]
+            cut = max(window.rfind(". "), window.rfind("다 "), window.rfind("요 "))
+            if cut < self._chunk_chars // 2:
+                cut = window.rfind(" ")
+            end = cut + 1 if cut >= self._chunk_chars // 2 else self._chunk_chars
+            pieces.append(line[:end].strip())
+            line = line[end:].strip()
+        if line:
+            pieces.append(line)
+        return pieces
+
+    def _split(self, text: str) -> List[str]:
+        """Split a page into chunks of whole lines, dropping boilerplate lines"""
+        chunks, current, size = [], [], 0
+        lines = (
+            piece
+            for line in text.splitlines()
+            for piece in self._split_line(line.strip())
+        )
+        for line in lines:
+            if not line or self._boilerplate.fullmatch(line):
+                continue
+            if current and size + len(line) > self._chunk_chars:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(line)
+            size += len(line)
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    def _rank(
+        self, chunks: List[Tuple[int, int, str]], query: Optional[str]
+    ) -> List[Tuple[int, int, str]]:
+        """Order (page, position, chunk) entries by relevance to the query"""
+        if not query:
+            return sorted(chunks, key=lambda chunk: (chunk[1], chunk[0]))
+        scores = BM25([tokenize(chunk[2]) for chunk in chunks]).score(tokenize(query))
+        ranked = sorted(zip(scores, chunks, strict=True), key=lambda item: -item[0])
+        return [chunk for _, chunk in ranked]
+
+    def extract(self, pages: List[str], query: Optional[str] = None) -> List[str]:
+        """Keep only the relevant chunks of each page
+
+        Args:
+            pages (List[str]): page contents
+            query (Optional[str]): what the caller is looking for
+
+        Returns:
+            List[str]: shrunk page contents, pages without a kept chunk are dropped
+        """
+        chunks = [
+            (page_index, position, chunk)
+            for page_index, page in enumerate(pages)
+            for position, chunk in enumerate(self._split(page))
+        ]
+
+        selected, used_tokens = [], 0
+        for chunk in self._rank(chunks, query):
+            if len(selected) >= self._top_k:
+                break
+            tokens = count_text_tokens(chunk[2])
+            if used_tokens + tokens > self._token_budget:
+                continue
+            selected.append(chunk)
+            used_tokens += tokens
+
+        kept: Dict[int, List[Tuple[int, str]]] = {}
+        for page_index, position, chunk in selected:
+            kept.setdefault(page_index, []).append((position, chunk))
+        results = [
+            "\n...\n".join(chunk for _, chunk in sorted(kept[page_index]))
+            for page_index in sorted(kept)
+        ]
+
+        self._stats["pages"] += len(pages)
+        self._stats["tokens_before"] += sum(count_text_tokens(page) for page in pages)
+        self._stats["tokens_after"] += sum(count_text_tokens(result) for result in results)
+        return results
+
+    def get_stats(self) -> Dict:
+        """Get the token counts of the pages before and after extraction"""
+        before = self._stats["tokens_before"]
+        return {
+            **self._stats,
+            "saved_ratio": 1 - self._stats["tokens_after"] / before if before else 0.0,
+        }
+
+
+if __name__ == "__main__":
+    # Test
+    extractor = RelevantChunkExtractor(
+        chunk_chars=40, top_k=2, token_budget=200, boilerplate_patterns=["공감", "댓글 \\d+"]
+    )
+    page = "\n".join(
+        [
+            "공감",
+            "1일차는 성산일출봉에서 일출을 봤어요",
+            "점심은 제주도 흑돼지 맛집에서 먹었습니다",
+            "댓글 3",
+            "2일차에는 우도에 가서 자전거를 탔어요",
+            "저녁은 해산물 맛집에서 해결했어요",
+        ]
+    )
+    print(extractor.extract([page], query="제주도 맛집"))
+    print(extractor.get_stats())
+
+    # A post written as one long paragraph is split instead of dropped
+    long_line = " ".join(page.splitlines()) * 20
+    extracted = extractor.extract([long_line], query="제주도 맛집")
+    assert extracted and all(
+        len(chunk.replace("\n", "")) <= 40 for chunk in extracted[0].split("\n...\n")
+    )
+    print(extracted)
@@ -22,6 +22,7 @@ from langchain_core.messages import (
     AnyMessage,
     BaseMessage,
     SystemMessage,
+    ToolCall,
     ToolMessage,
 )
 from langchain_core.runnables import (
@@ -43,6 +44,8 @@ from langgraph.utils.runnable import RunnableCallable, RunnableLike
 from pydantic import BaseModel
 from typing_extensions import Annotated, TypedDict
 
+from app.utils.tool_history import ToolHistoryPolicy, create_recall_tool
+
 StructuredResponse = Union[dict, BaseModel]
 StructuredResponseSchema = Union[dict, type[BaseModel]]
 F = TypeVar("F", bound=Callable[..., Any])
@@ -61,6 +64,9 @@ class AgentState(TypedDict):
 
     remaining_steps: RemainingSteps
 
+    # Last message of the model input validated by `_validate_chat_history`
+    validated_message_id: Optional[str]
+
 
 class AgentStatePydantic(BaseModel):
     """The state of the agent."""
@@ -69,6 +75,8 @@ class AgentStatePydantic(BaseModel):
 
     remaining_steps: RemainingSteps = 25
 
+    validated_message_id: Optional[str] = None
+
 
 class AgentStateWithStructuredResponse(AgentState):
     """The state of the agent with a structured response."""
@@ -206,10 +214,48 @@ def _get_model(model: LanguageModelLike) -> BaseChatModel:
     return model
 
 
+def _get_unvalidated_start(
+    messages: Sequence[BaseMessage], validated_message_id: Optional[str]
+) -> int:
+    """Return the index of the first message after the last validated one.
+
+    Every tool call up to a validated message has its ToolMessage, so only the
+    suffix after it needs validating. The message is looked up from the end, and
+    the whole history is validated when it is gone (e.g. removed or summarized).
+    """
+    if validated_message_id is not None:
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].id == validated_message_id:
+                return index + 1
+    return 0
+
+
+def _get_pending_tool_calls(messages: Sequence[BaseMessage]) -> list[ToolCall]:
+    """Return the tool calls of the last AIMessage that have no ToolMessage yet.
+
+    The ToolMessages of a model step follow its AIMessage, so only the messages
+    after the last AIMessage are scanned.
+    """
+    tool_call_ids_with_results = set()
+    for message in reversed(messages):
+        if isinstance(message, ToolMessage):
+            tool_call_ids_with_results.add(message.tool_call_id)
+        elif isinstance(message, AIMessage):
+            return [
+                c for c in message.tool_calls if c["id"] not in tool_call_ids_with_results
+            ]
+    return []
+
+
 def _validate_chat_history(
     messages: Sequence[BaseMessage],
+    start: int = 0,
 ) -> None:
-    """Validate that all tool calls in AIMessages have a corresponding ToolMessage."""
+    """Validate that all tool calls in AIMessages have a corresponding ToolMessage.
+
+    Messages before `start` are known to be valid and are skipped.
+    """
+    messages = messages[start:]
     all_tool_calls = [
         tool_call
         for message in messages
@@ -247,6 +293,7 @@ def create_react_agent(
     ] = None,
     pre_model_hook: Optional[RunnableLike] = None,
     post_model_hook: Optional[RunnableLike] = None,
+    tool_history_policy: Optional[ToolHistoryPolicy] = None,
     state_schema: Optional[StateSchemaType] = None,
     config_schema: Optional[Type[Any]] = None,
     checkpointer: Optional[Checkpointer] = None,
@@ -327,6 +374,9 @@ def create_react_agent(
 
             !!! Note
                 Only available with `version="v2"`.
+        tool_history_policy: An optional policy replacing, in the model input only, the tool results
+            the model already read by digests. The state keeps the original tool messages, and the
+            recall tool returning a full result is added to `tools` (a `ToolNode` must include it).
         state_schema: An optional state schema that defines graph state.
             Must have `messages` and `remaining_steps` keys.
             Defaults to `AgentState` that defines those two keys.
@@ -419,6 +469,12 @@ def create_react_agent(
             else AgentState
         )
 
+    # States without the key (custom state schemas) validate the whole history at every step
+    track_validated_messages = "validated_message_id" in get_type_hints(state_schema)
+
+    if tool_history_policy is not None and not isinstance(tools, ToolNode):
+        tools = [*tools, create_recall_tool()]
+
     llm_builtin_tools: list[dict] = []
     if isinstance(tools, ToolNode):
         tool_classes = list(tools.tools_by_name.values())
@@ -489,7 +545,14 @@ def create_react_agent(
         if messages is None:
             raise ValueError(error_msg)
 
-        _validate_chat_history(messages)
+        _validate_chat_history(
+            messages,
+            _get_unvalidated_start(
+                messages, _get_state_value(state, "validated_message_id")
+            ),
+        )
+        if tool_history_policy is not None:
+            messages = tool_history_policy.apply(messages)
         # we're passing messages under `messages` key, as this is expected by the prompt
         if isinstance(state_schema, type) and issubclass(state_schema, BaseModel):
             state.messages = messages  # type: ignore
@@ -498,6 +561,13 @@ def create_react_agent(
 
         return state
 
+    def _make_update(state: StateSchema, message: BaseMessage) -> StateSchema:
+        # We return a list, because this will get added to the existing list
+        update = {"messages": [message]}
+        if track_validated_messages:
+            update["validated_message_id"] = _get_state_value(state, "messages")[-1].id
+        return update  # type: ignore[return-value]
+
     # Define the function that calls the model
     def call_model(state: StateSchema, config: RunnableConfig) -> StateSchema:
         state = _get_model_input_state(state)
@@ -506,16 +576,14 @@ def create_react_agent(
         response.name = name
 
         if _are_more_steps_needed(state, response):
-            return {
-                "messages": [
-                    AIMessage(
-                        id=response.id,
-                        content="Sorry, need more steps to process this request.",
-                    )
-                ]
-            }
-        # We return a list, because this will get added to the existing list
-        return {"messages": [response]}
+            return _make_update(
+                state,
+                AIMessage(
+                    id=response.id,
+                    content="Sorry, need more steps to process this request.",
+                ),
+            )
+        return _make_update(state, response)
 
     async def acall_model(state: StateSchema, config: RunnableConfig) -> StateSchema:
         state = _get_model_input_state(state)
@@ -523,16 +591,14 @@ def create_react_agent(
         # add agent name to the AIMessage
         response.name = name
         if _are_more_steps_needed(state, response):
-            return {
-                "messages": [
-                    AIMessage(
-                        id=response.id,
-                        content="Sorry, need more steps to process this request.",
-                    )
-                ]
-            }
-        # We return a list, because this will get added to the existing list
-        return {"messages": [response]}
+            return _make_update(
+                state,
+                AIMessage(
+                    id=response.id,
+                    content="Sorry, need more steps to process this request.",
+                ),
+            )
+        return _make_update(state, response)
 
     input_schema: StateSchemaType
     if pre_model_hook is not None:
@@ -713,15 +779,7 @@ def create_react_agent(
             """
 
             messages = _get_state_value(state, "messages")
-            tool_messages = [
-                m.tool_call_id for m in messages if isinstance(m, ToolMessage)
-            ]
-            last_ai_message = next(
-                m for m in reversed(messages) if isinstance(m, AIMessage)
-            )
-            pending_tool_calls = [
-                c for c in last_ai_message.tool_calls if c["id"] not in tool_messages
-            ]
+            pending_tool_calls = _get_pending_tool_calls(messages)
 
             if pending_tool_calls:
                 pending_tool_calls = [
@@ -794,3 +852,51 @@ __all__ = [
     "AgentStateWithStructuredResponse",
     "AgentStateWithStructuredResponsePydantic",
 ]
+
+
+if __name__ == "__main__":
+    # Benchmark: history validation and pending tool calls of one step over long histories
+    import time
+
+    from langchain_core.messages import HumanMessage
+
+    def make_history(size: int) -> list[BaseMessage]:
+        messages: list[BaseMessage] = []
+        while len(messages) < size:
+            step = len(messages)
+            tool_call = {"name": "web_loader", "args": {"query": "제주"}, "id": f"c{step}"}
+            messages += [
+                HumanMessage("제주도 일정을 짜줘", id=f"h{step}"),
+                AIMessage("", id=f"a{step}", tool_calls=[tool_call]),
+                ToolMessage("결과", tool_call_id=f"c{step}", id=f"t{step}"),
+                AIMessage("일정입니다", id=f"r{step}"),
+            ]
+        return messages[:size]
+
+    def full_scan(messages: list[BaseMessage]) -> list[ToolCall]:
+        _validate_chat_history(messages)
+        tool_messages = [m.tool_call_id for m in messages if isinstance(m, ToolMessage)]
+        last_ai_message = next(m for m in reversed(messages) if isinstance(m, AIMessage))
+        return [c for c in last_ai_message.tool_calls if c["id"] not in tool_messages]
+
+    def suffix_scan(messages: list[BaseMessage], validated_message_id: str) -> list[ToolCall]:
+        _validate_chat_history(messages, _get_unvalidated_start(messages, validated_message_id))
+        return _get_pending_tool_calls(messages)
+
+    repeat = 50
+    for size in (1_000, 2_000, 5_000, 10_000):
+        history = make_history(size)
+        # The previous step validated all but the last model step
+        validated_message_id = history[-4].id
+        start = time.perf_counter()
+        for _ in range(repeat):
+            full_scan(history)
+        full_time = (time.perf_counter() - start) / repeat
+        start = time.perf_counter()
+        for _ in range(repeat):
+            suffix_scan(history, validated_message_id)
+        suffix_time = (time.perf_counter() - start) / repeat
+        print(
+            f"{size:>6} messages: full scan {full_time * 1000:7.3f} ms, "
+            f"suffix {suffix_time * 1000:7.3f} ms ({full_time / suffix_time:6.0f}x)"
+        )
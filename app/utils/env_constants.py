@@ -20,4 +20,27 @@ TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN", "")
 
 LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY", "")
 
-LOGS_DIR = os.getenv("LOGS_DIR")
\ No newline at end of file
+LOGS_DIR = os.getenv("LOGS_DIR")
+CACHE_DIR = os.getenv("CACHE_DIR") or ".cache"
+DATA_DIR = os.getenv("DATA_DIR") or ".data"
+
+# Run graph turns with astream on the background loop so async tools can overlap
+ASYNC_EXECUTION = (os.getenv("ASYNC_EXECUTION") or "true").lower() == "true"
+
+# Open the connections of the model providers when the server starts
+LLM_WARM_UP = (os.getenv("LLM_WARM_UP") or "false").lower() == "true"
+
+# Dispatch clear-cut requests (e.g. registering a plan) without a supervisor LLM call
+INTENT_ROUTER = (os.getenv("INTENT_ROUTER") or "true").lower() == "true"
+
+# End the turn with the answer of a planning/research agent instead of a supervisor restatement
+DIRECT_RETURN = (os.getenv("DIRECT_RETURN") or "false").lower() == "true"
+
+# Summarize the conversation after each turn instead of before the supervisor answers
+BACKGROUND_SUMMARY = (os.getenv("BACKGROUND_SUMMARY") or "true").lower() == "true"
+
+# Hand sub-agents a token-bounded task brief instead of the whole conversation
+SCOPED_HANDOFF = (os.getenv("SCOPED_HANDOFF") or "true").lower() == "true"
+
+# Replace tool results the agents already read with digests in their model input
+TOOL_HISTORY_DIGEST = (os.getenv("TOOL_HISTORY_DIGEST") or "true").lower() == "true"
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.utils.http_constants import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+    HTTP_POOL_HOSTS,
+    HTTP_READ_TIMEOUT,
+    HTTP_TOTAL_TIMEOUT,
+)
+
+
+class _PooledSession(requests.Session):
+    """requests.Session applying the shared timeouts when none are given."""
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+        return super().request(*args, **kwargs)
+
+
+class HTTPClientManager:
+    """Singleton class to manage process-wide pooled HTTP clients.
+
+    The synchronous `requests.Session` is shared by every thread, while one
+    `aiohttp.ClientSession` is kept per running event loop since aiohttp sessions
+    cannot be shared across loops.
+    """
+
+    _instance: Optional["HTTPClientManager"] = None
+
+    def __init__(self):
+        if not hasattr(self, "_initialized"):
+            self._initialized = True
+            self._lock = threading.Lock()
+            self._session: Optional[requests.Session] = None
+            self._async_sessions: WeakKeyDictionary = WeakKeyDictionary()
+            self._async_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared synchronous session (lazy initialization)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = _PooledSession()
+                    adapter = HTTPAdapter(
+                        pool_connections=HTTP_POOL_HOSTS,
+                        pool_maxsize=HTTP_LIMIT_PER_HOST,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def get_async_session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_LIMIT_PER_HOST,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=HTTP_TOTAL_TIMEOUT, sock_connect=HTTP_CONNECT_TIMEOUT
+                ),
+                trace_configs=[self._create_trace_config()],
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create a trace config counting requests and new connections per host"""
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+            self._async_stats[ctx.host]["requests"] += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self._async_stats[getattr(ctx, "host", "unknown")]["new_connections"] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._async_stats[getattr(ctx, "host", "unknown")]["reused_connections"] += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self._async_stats[params.host]["dns_cache_hits"] += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self._async_stats[params.host]["dns_cache_misses"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def get_stats(self) -> Dict:
+        """Return per-host request and connection counters of both pools"""
+        sync_stats = {}
+        if self._session is not None:
+            for adapter in set(self._session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools[key]
+                    if pool is None:
+                        continue
+                    sync_stats[pool.host] = {
+                        "requests": pool.num_requests,
+                        "new_connections": pool.num_connections,
+                    }
+
+        return {
+            "sync": sync_stats,
+            "async": {host: dict(counters) for host, counters in self._async_stats.items()},
+        }
+
+    async def aclose(self):
+        """Close the aiohttp session bound to the running event loop"""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close(self):
+        """Close the shared synchronous session"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Global manager instance
+_manager = HTTPClientManager()
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide pooled requests session"""
+    return _manager.session
+
+
+def get_async_http_session() -> aiohttp.ClientSession:
+    """Get the pooled aiohttp session of the running event loop"""
+    return _manager.get_async_session()
+
+
+def get_http_pool_stats() -> Dict:
+    """Get the pool stats of the HTTP clients"""
+    return _manager.get_stats()
+
+
+if __name__ == "__main__":
+    # Test
+    session = get_http_session()
+    for _ in range(3):
+        session.get("https://openapi.naver.com")
+    print(get_http_pool_stats())
@@ -0,0 +1,10 @@
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 10
+HTTP_TOTAL_TIMEOUT = 15
+
+HTTP_CONNECTION_LIMIT = 100
+HTTP_LIMIT_PER_HOST = 20
+HTTP_POOL_HOSTS = 10
+
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.utils.browser_pool import LoadedPage
+
+
+@dataclass
+class CachedPage:
+    """Page content stored in the cache"""
+
+    url: str
+    content: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+# Send a conditional request for a URL, returning the response status and the new page
+Revalidator = Callable[[str, Dict[str, str]], Tuple[int, Optional[LoadedPage]]]
+AsyncRevalidator = Callable[[str, Dict[str, str]], Awaitable[Tuple[int, Optional[LoadedPage]]]]
+
+
+class PageCache:
+    """Disk-backed cache of loaded page contents.
+
+    Entries are stored zlib-compressed in SQLite under the SHA-256 of their URL.
+    Fresh entries are served as is; expired entries with an ETag or Last-Modified
+    validator are revalidated with a conditional request sent by the page loader
+    (so it carries its User-Agent and goes through the rate limiter): a 304 keeps
+    the entry, a 200 with a readable page replaces it. The total compressed size
+    is capped by evicting least recently used entries.
+
+    Args:
+        path (Path): SQLite file of the cache
+        ttl_seconds (int): seconds an entry is served without revalidation
+        max_bytes (int): cap of the total compressed size
+        revalidate (Optional[Revalidator]): conditional request sender (synchronous)
+        arevalidate (Optional[AsyncRevalidator]): conditional request sender (asynchronous)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: int,
+        max_bytes: int,
+        revalidate: Optional[Revalidator] = None,
+        arevalidate: Optional[AsyncRevalidator] = None,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._revalidate = revalidate
+        self._arevalidate = arevalidate
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at)")
+        self._conn.commit()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "refreshed": 0, "evictions": 0}
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _lookup(self, url: str) -> Optional[CachedPage]:
+        """Return the stored entry of a URL regardless of its freshness"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, etag, last_modified, fetched_at FROM pages WHERE key = ?",
+                (self._key(url),),
+            ).fetchone()
+        if row is None:
+            return None
+        content, etag, last_modified, fetched_at = row
+        return CachedPage(
+            url=url,
+            content=zlib.decompress(content).decode("utf-8"),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def _touch(self, url: str, revalidated: bool = False):
+        """Mark an entry as recently used (and fetched, if it was revalidated)"""
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._conn.execute(
+                    "UPDATE pages SET accessed_at = ?, fetched_at = ? WHERE key = ?",
+                    (now, now, self._key(url)),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE pages SET accessed_at = ? WHERE key = ?", (now, self._key(url))
+                )
+            self._conn.commit()
+
+    def _is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self._ttl_seconds
+
+    @staticmethod
+    def _conditional_headers(page: CachedPage) -> Dict[str, str]:
+        headers = {}
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def _resolve(
+        self, page: Optional[CachedPage], status: int = 0, fetched: Optional[LoadedPage] = None
+    ) -> Optional[str]:
+        """Update the entry, counters and timestamps for a lookup outcome
+
+        Args:
+            page (Optional[CachedPage]): stored entry
+            status (int): status of the revalidation response, 0 if none was sent
+            fetched (Optional[LoadedPage]): page carried by the revalidation response
+        """
+        if page is None:
+            self._stats["misses"] += 1
+            return None
+        if self._is_fresh(page) or status == 304:
+            self._stats["hits"] += 1
+            if status == 304:
+                self._stats["revalidated"] += 1
+            self._touch(page.url, revalidated=status == 304)
+            return page.content
+        if status == 200 and fetched is not None:
+            self._stats["hits"] += 1
+            self._stats["refreshed"] += 1
+            self.put(page.url, fetched.content, fetched.etag, fetched.last_modified)
+            return fetched.content
+        self._stats["misses"] += 1
+        return None
+
+    def get(self, url: str) -> Optional[str]:
+        """Get the cached content of a URL, revalidating it once expired (synchronous)"""
+        page = self._lookup(url)
+        status, fetched = 0, None
+        if page is not None and not self._is_fresh(page) and self._revalidate is not None:
+            headers = self._conditional_headers(page)
+            if headers:
+                status, fetched = self._revalidate(url, headers)
+        return self._resolve(page, status, fetched)
+
+    async def aget(self, url: str) -> Optional[str]:
+        """Get the cached content of a URL, revalidating it once expired (asynchronous)"""
+        page = await asyncio.to_thread(self._lookup, url)
+        status, fetched = 0, None
+        if page is not None and not self._is_fresh(page) and self._arevalidate is not None:
+            headers = self._conditional_headers(page)
+            if headers:
+                status, fetched = await self._arevalidate(url, headers)
+        return await asyncio.to_thread(self._resolve, page, status, fetched)
+
+    def put(
+        self,
+        url: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store the content of a URL and evict old entries over the size cap"""
+        blob = zlib.compress(content.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._key(url), url, blob, len(blob), etag, last_modified, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    async def aput(
+        self,
+        url: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store the content of a URL (asynchronous)"""
+        await asyncio.to_thread(self.put, url, content, etag, last_modified)
+
+    def _evict(self):
+        """Delete least recently used entries until the size cap is met"""
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+        if total <= self._max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM pages ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self._max_bytes:
+                break
+            self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+            total -= size
+            self._stats["evictions"] += 1
+
+    def get_stats(self) -> Dict:
+        """Get the hit/miss counters and the size of the cache"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+if __name__ == "__main__":
+    # Test
+    import tempfile
+
+    cache = PageCache(Path(tempfile.mkdtemp()) / "pages.sqlite3", ttl_seconds=60, max_bytes=1024)
+    cache.put("https://m.blog.naver.com/user/1", "제주도 여행 후기 " * 100)
+    print(cache.get("https://m.blog.naver.com/user/1")[:20])
+    print(cache.get("https://m.blog.naver.com/user/2"))
+    print(cache.get_stats())
+
+    # Revalidation of expired entries: 304 keeps the entry, 200 replaces it
+    responses = {
+        "https://m.blog.naver.com/user/3": (304, None),
+        "https://m.blog.naver.com/user/4": (
+            200,
+            LoadedPage("https://m.blog.naver.com/user/4", "새 글", etag='"v2"'),
+        ),
+    }
+    stale = PageCache(
+        Path(tempfile.mkdtemp()) / "pages.sqlite3",
+        ttl_seconds=0,
+        max_bytes=1024,
+        revalidate=lambda url, headers: responses[url],
+    )
+    for url in responses:
+        stale.put(url, "옛 글", etag='"v1"')
+    print([stale.get(url) for url in responses])
+    print(stale._lookup("https://m.blog.naver.com/user/4").etag, stale.get_stats())
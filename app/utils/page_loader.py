@@ -0,0 +1,177 @@
+import asyncio
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from app.utils.browser_pool import BrowserPool, LoadedPage
+from app.utils.http_client import get_async_http_session, get_http_session
+
+STATIC_TIER = "static"
+BROWSER_TIER = "browser"
+
+_NON_CONTENT_TAGS = ["script", "style", "noscript", "iframe", "svg", "header", "footer", "nav"]
+
+
+def extract_static_text(html: str, content_selectors: Sequence[str]) -> str:
+    """Extract readable text from server-rendered HTML
+
+    Args:
+        html (str): page source
+        content_selectors (Sequence[str]): CSS selectors of the main content, tried in order
+
+    Returns:
+        str: extracted text, one block per line
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    root = next(
+        (node for selector in content_selectors if (node := soup.select_one(selector))),
+        soup.body or soup,
+    )
+    for tag in root.find_all(_NON_CONTENT_TAGS):
+        tag.decompose()
+
+    lines = (line.strip() for line in root.get_text(separator="\n").splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+class TieredPageLoader:
+    """Page loader trying a plain HTTP fetch before rendering with a browser.
+
+    Pages whose static text is too short or looks script-gated are sent to the
+    browser pool. The tier which served each URL is recorded.
+    """
+
+    def __init__(
+        self,
+        browser_pool: BrowserPool,
+        content_selectors: Sequence[str],
+        min_static_chars: int,
+        script_gate_markers: Sequence[str],
+        user_agent: str,
+        max_recorded_urls: int = 1000,
+    ):
+        self._browser_pool = browser_pool
+        self._content_selectors = content_selectors
+        self._min_static_chars = min_static_chars
+        self._script_gate_markers = script_gate_markers
+        self._headers = {"User-Agent": user_agent}
+        self._max_recorded_urls = max_recorded_urls
+        self._tiers: "OrderedDict[str, str]" = OrderedDict()
+        self._tier_counts: Counter = Counter()
+
+    def _to_static_page(
+        self, url: str, status: int, html: str, headers: Dict[str, str]
+    ) -> Optional[LoadedPage]:
+        """Build a page from a static response, or None if a browser is needed"""
+        if status != 200:
+            return None
+
+        text = extract_static_text(html, self._content_selectors)
+        if len(text) < self._min_static_chars:
+            return None
+        if any(marker in text for marker in self._script_gate_markers):
+            return None
+
+        return LoadedPage(
+            url=url,
+            content=text,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+    def _fetch_static(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Optional[LoadedPage]]:
+        """Fetch a page over plain HTTP and return the response status with the page
+
+        The status is 0 if the request failed.
+        """
+        try:
+            response = get_http_session().get(url, headers={**self._headers, **(headers or {})})
+            page = self._to_static_page(url, response.status_code, response.text, response.headers)
+            return response.status_code, page
+        except Exception:
+            return 0, None
+
+    async def _afetch_static(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Optional[LoadedPage]]:
+        try:
+            session = get_async_http_session()
+            async with session.get(url, headers={**self._headers, **(headers or {})}) as response:
+                html = await response.text()
+                page = self._to_static_page(url, response.status, html, response.headers)
+                return response.status, page
+        except Exception:
+            return 0, None
+
+    def _record(self, pages: List[Optional[LoadedPage]], tier: str):
+        for page in pages:
+            if page is None:
+                continue
+            self._tiers[page.url] = tier
+            self._tiers.move_to_end(page.url)
+            self._tier_counts[tier] += 1
+        while len(self._tiers) > self._max_recorded_urls:
+            self._tiers.popitem(last=False)
+
+    def _merge(
+        self,
+        static_pages: List[Optional[LoadedPage]],
+        browser_pages: List[Optional[LoadedPage]],
+    ) -> List[Optional[LoadedPage]]:
+        """Fill the static misses with the browser results, keeping the URL order"""
+        self._record(static_pages, STATIC_TIER)
+        self._record(browser_pages, BROWSER_TIER)
+        rendered = iter(browser_pages)
+        return [page if page is not None else next(rendered) for page in static_pages]
+
+    def load(self, urls: List[str]) -> List[Optional[LoadedPage]]:
+        """Load pages of URLs, None for the failed ones (synchronous)"""
+        static_pages = [self._fetch_static(url)[1] for url in urls]
+        fallback_urls = [url for url, page in zip(urls, static_pages, strict=True) if page is None]
+        browser_pages = self._browser_pool.load(fallback_urls) if fallback_urls else []
+        return self._merge(static_pages, browser_pages)
+
+    async def aload(self, urls: List[str]) -> List[Optional[LoadedPage]]:
+        """Load pages of URLs, None for the failed ones (asynchronous)"""
+        responses = await asyncio.gather(*[self._afetch_static(url) for url in urls])
+        static_pages = [page for _, page in responses]
+        fallback_urls = [url for url, page in zip(urls, static_pages, strict=True) if page is None]
+        browser_pages = await self._browser_pool.aload(fallback_urls) if fallback_urls else []
+        return self._merge(static_pages, browser_pages)
+
+    def revalidate(self, url: str, headers: Dict[str, str]) -> Tuple[int, Optional[LoadedPage]]:
+        """Send a conditional request for a cached page (synchronous)
+
+        Args:
+            url (str): URL of the cached page
+            headers (Dict[str, str]): conditional request headers
+
+        Returns:
+            Tuple[int, Optional[LoadedPage]]: response status (0 if the request failed)
+                and the new page if the response carried readable static text
+        """
+        status, page = self._fetch_static(url, headers)
+        self._record([page], STATIC_TIER)
+        return status, page
+
+    async def arevalidate(
+        self, url: str, headers: Dict[str, str]
+    ) -> Tuple[int, Optional[LoadedPage]]:
+        """Send a conditional request for a cached page (asynchronous)"""
+        status, page = await self._afetch_static(url, headers)
+        self._record([page], STATIC_TIER)
+        return status, page
+
+    def get_tier(self, url: str) -> Optional[str]:
+        """Return the tier which last served a URL"""
+        return self._tiers.get(url)
+
+    def get_stats(self) -> Dict:
+        """Get the number of pages served by each tier"""
+        return {
+            STATIC_TIER: self._tier_counts[STATIC_TIER],
+            BROWSER_TIER: self._tier_counts[BROWSER_TIER],
+        }
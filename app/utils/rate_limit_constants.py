@@ -0,0 +1,20 @@
+NAVER_PROVIDER = "naver"
+NAVER_WEB_PROVIDER = "naver_web"
+KAKAO_PROVIDER = "kakao"
+WIKIPEDIA_PROVIDER = "wikipedia"
+TAVILY_PROVIDER = "tavily"
+GOOGLE_PLACES_PROVIDER = "google_places"
+GOOGLE_CALENDAR_PROVIDER = "google_calendar"
+TWITTER_PROVIDER = "twitter"
+
+# (requests per second, burst size) of each provider, shared by every session of the process
+RATE_LIMITS = {
+    NAVER_PROVIDER: (10, 10),
+    NAVER_WEB_PROVIDER: (5, 5),
+    KAKAO_PROVIDER: (10, 10),
+    WIKIPEDIA_PROVIDER: (5, 5),
+    TAVILY_PROVIDER: (100 / 60, 5),
+    GOOGLE_PLACES_PROVIDER: (10, 10),
+    GOOGLE_CALENDAR_PROVIDER: (5, 5),
+    TWITTER_PROVIDER: (50 / (15 * 60), 5),
+}
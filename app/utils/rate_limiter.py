@@ -0,0 +1,185 @@
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+from langchain_core.tools import BaseTool
+
+from app.utils.rate_limit_constants import RATE_LIMITS
+from app.utils.tool_wrappers import wrap_tool
+
+
+class TokenBucket:
+    """Token bucket where callers reserve tokens ahead of time.
+
+    A caller that finds the bucket empty still takes its tokens (driving the
+    balance negative) and is told how long to wait for them to be refilled, so
+    waiting callers are served in arrival order without polling.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._stats = {"acquired": 0, "queued": 0, "total_wait": 0.0, "max_wait": 0.0}
+
+    def _reserve(self, tokens: int) -> float:
+        """Take tokens from the bucket and return how long the caller must wait for them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+
+            wait = max(0.0, -self._tokens / self._rate)
+            self._stats["acquired"] += 1
+            if wait > 0:
+                self._waiting += 1
+                self._stats["queued"] += 1
+                self._stats["total_wait"] += wait
+                self._stats["max_wait"] = max(self._stats["max_wait"], wait)
+            return wait
+
+    def _leave_queue(self):
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self, tokens: int = 1):
+        """Wait until tokens are available (synchronous)"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._leave_queue()
+
+    async def aacquire(self, tokens: int = 1):
+        """Wait until tokens are available without blocking the event loop (asynchronous)"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._leave_queue()
+
+    def get_stats(self) -> Dict:
+        """Get the queue depth and wait times of the bucket"""
+        with self._lock:
+            acquired = self._stats["acquired"]
+            return {
+                **self._stats,
+                "queue_depth": self._waiting,
+                "avg_wait": self._stats["total_wait"] / acquired if acquired else 0.0,
+            }
+
+
+class RateLimiter:
+    """Process-wide registry of per-provider token buckets"""
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]]):
+        self._buckets = {
+            provider: TokenBucket(rate, capacity) for provider, (rate, capacity) in limits.items()
+        }
+
+    def configure(self, provider: str, rate: float, capacity: int):
+        """Set (or replace) the bucket of a provider"""
+        self._buckets[provider] = TokenBucket(rate, capacity)
+
+    def _get_bucket(self, provider: str) -> TokenBucket:
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            raise ValueError(f"Unknown rate limit provider: {provider}")
+        return bucket
+
+    def acquire(self, provider: str, tokens: int = 1):
+        """Wait for the quota of a provider (synchronous)"""
+        self._get_bucket(provider).acquire(tokens)
+
+    async def aacquire(self, provider: str, tokens: int = 1):
+        """Wait for the quota of a provider (asynchronous)"""
+        await self._get_bucket(provider).aacquire(tokens)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get the stats of every provider"""
+        return {provider: bucket.get_stats() for provider, bucket in self._buckets.items()}
+
+
+# Global rate limiter instance
+_rate_limiter = RateLimiter(RATE_LIMITS)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter"""
+    return _rate_limiter
+
+
+def rate_limited(provider: str) -> Callable:
+    """Decorator making a sync or async tool function wait for the quota of a provider
+
+    Args:
+        provider (str): provider name, one of the keys of `RATE_LIMITS`
+
+    Returns:
+        Callable: decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await _rate_limiter.aacquire(provider)
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _rate_limiter.acquire(provider)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def rate_limit_tool(tool: BaseTool, provider: str) -> BaseTool:
+    """Return a copy of a tool whose calls wait for the quota of a provider
+
+    Args:
+        tool (BaseTool): tool to limit, e.g. a third-party `BaseTool`
+        provider (str): provider name, one of the keys of `RATE_LIMITS`
+
+    Returns:
+        BaseTool: rate limited tool
+    """
+    decorator = rate_limited(provider)
+    return wrap_tool(tool, decorator, decorator)
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict]:
+    """Get the per-provider stats of the rate limiter"""
+    return _rate_limiter.get_stats()
+
+
+if __name__ == "__main__":
+    # Test
+    limiter = RateLimiter({"test": (5, 2)})
+
+    async def call(index: int):
+        await limiter.aacquire("test")
+        print(index, round(time.monotonic() - start, 2))
+
+    async def main():
+        await asyncio.gather(*(call(index) for index in range(6)))
+
+    start = time.monotonic()
+    asyncio.run(main())
+    print(limiter.get_stats())
@@ -0,0 +1,156 @@
+import time
+from typing import Callable, List
+
+MARKDOWN_BLOCK_SEPARATOR = "\n\n"
+MARKDOWN_CODE_FENCE = "```"
+
+
+class RenderBuffer:
+    """Coalesce streamed tokens into throttled, incremental markdown renders.
+
+    Rendering the whole response per token re-sends the growing text to the
+    browser each time, which is quadratic in the response length. Tokens are
+    accumulated in a list and rendered at most every `interval` seconds, or as
+    soon as `max_pending_chars` characters are waiting. Completed markdown
+    blocks (up to the last blank line outside a code fence) are rendered once
+    into their own element, so a render only re-sends the block being written.
+
+    Args:
+        render_block (Callable[[int, str], None]): renders the text of the i-th block element
+        interval (float): minimum time between two renders in seconds
+        max_pending_chars (int): pending characters forcing a render
+    """
+
+    def __init__(
+        self,
+        render_block: Callable[[int, str], None],
+        interval: float,
+        max_pending_chars: int,
+    ):
+        self._render_block = render_block
+        self._interval = interval
+        self._max_pending_chars = max_pending_chars
+        self._blocks: List[str] = []
+        self._parts: List[str] = []
+        self._pending_chars = 0
+        self._rendered_blocks = 0
+        self._last_render = 0.0
+        self._stats = {"appends": 0, "renders": 0, "rendered_chars": 0}
+
+    @property
+    def text(self) -> str:
+        """Text accumulated so far"""
+        return "".join(self._blocks) + "".join(self._parts)
+
+    def append(self, content: str):
+        """Append a token, rendering when the time or size budget is spent"""
+        if not content:
+            return
+        self._parts.append(content)
+        self._pending_chars += len(content)
+        self._stats["appends"] += 1
+        if (
+            self._pending_chars >= self._max_pending_chars
+            or time.monotonic() - self._last_render >= self._interval
+        ):
+            self.flush()
+
+    def reset(self):
+        """Clear the rendered text (e.g. another node took over the answer)"""
+        for index in range(self._rendered_blocks):
+            self._render(index, "")
+        self._blocks, self._parts = [], []
+        self._pending_chars = 0
+        self._rendered_blocks = 0
+
+    def flush(self):
+        """Render the pending tokens, if any"""
+        if not self._pending_chars:
+            return
+        tail = "".join(self._parts)
+        self._parts = []
+
+        # Freeze the completed blocks into the element that showed them while being written
+        boundary = self._find_block_boundary(tail)
+        if boundary:
+            self._render(len(self._blocks), tail[:boundary])
+            self._blocks.append(tail[:boundary])
+            tail = tail[boundary:]
+        if tail:
+            self._parts.append(tail)
+            self._render(len(self._blocks), tail)
+
+        self._pending_chars = 0
+        self._last_render = time.monotonic()
+
+    @staticmethod
+    def _find_block_boundary(text: str) -> int:
+        """Return the end of the last complete markdown block of a text, 0 if there is none"""
+        index = text.rfind(MARKDOWN_BLOCK_SEPARATOR)
+        while index > 0:
+            # Blocks are never split inside a code fence
+            if text.count(MARKDOWN_CODE_FENCE, 0, index) % 2 == 0:
+                return index + len(MARKDOWN_BLOCK_SEPARATOR)
+            index = text.rfind(MARKDOWN_BLOCK_SEPARATOR, 0, index)
+        return 0
+
+    def _render(self, index: int, text: str):
+        self._render_block(index, text)
+        self._rendered_blocks = max(self._rendered_blocks, index + 1)
+        self._stats["renders"] += 1
+        self._stats["rendered_chars"] += len(text)
+
+    def get_stats(self):
+        """Get the stats of the buffer"""
+        return dict(self._stats)
+
+
+if __name__ == "__main__":
+    # Benchmark: frontend messages and bytes per response, rendering per token vs buffered
+    import random
+
+    from app.utils.ui_constants import RENDER_INTERVAL, RENDER_MAX_PENDING_CHARS
+
+    rng = random.Random(0)
+    words = [
+        "제주", "일정", "**1일차**", "성산일출봉", "\n- ", "흑돼지", "맛집", "이동", "30분", "카페"
+    ]
+    tokens_per_second = 60
+    clock = 0.0
+    time.monotonic = lambda: clock
+
+    def render_per_token(tokens: List[str]):
+        response, sizes = "", []
+        for token in tokens:
+            response += token
+            sizes.append(len(response.encode()))
+        return response, sizes
+
+    def render_buffered(tokens: List[str]):
+        global clock
+        sizes = []
+        buffer = RenderBuffer(
+            lambda index, text: sizes.append(len(text.encode())),
+            RENDER_INTERVAL,
+            RENDER_MAX_PENDING_CHARS,
+        )
+        for token in tokens:
+            clock += 1 / tokens_per_second
+            buffer.append(token)
+        buffer.flush()
+        return buffer.text, sizes
+
+    for n_tokens in (500, 2000, 6000):
+        # An itinerary: list items with a blank line every 40 tokens or so
+        tokens = [
+            MARKDOWN_BLOCK_SEPARATOR if rng.random() < 0.025 else rng.choice(words) + " "
+            for _ in range(n_tokens)
+        ]
+        before_text, before = render_per_token(tokens)
+        after_text, after = render_buffered(tokens)
+        assert before_text == after_text
+
+        print(
+            f"{n_tokens:>5} tokens: per token {len(before):>5} msgs {sum(before) / 2**20:8.2f} MiB"
+            f" | buffered {len(after):>4} msgs {sum(after) / 2**20:6.2f} MiB"
+        )
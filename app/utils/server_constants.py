@@ -0,0 +1,13 @@
+SERVER_HOST = "0.0.0.0"
+SERVER_PORT = 8000
+
+# Turns streamed at the same time by one server process, further requests get a 503
+SERVER_MAX_CONCURRENT_RUNS = 32
+SERVER_RETRY_AFTER_SECONDS = 5
+
+SSE_TOKEN_EVENT = "token"
+SSE_END_EVENT = "end"
+SSE_ERROR_EVENT = "error"
+# The answer streamed so far is replaced by the one that follows (e.g. the supervisor took over)
+SSE_RESET_EVENT = "reset"
+SSE_PROGRESS_EVENT = "progress"
@@ -1,16 +1,19 @@
 import uuid
 
 import streamlit as st
-from langgraph.checkpoint.base import Checkpoint
-from langgraph.checkpoint.memory import InMemorySaver
 
-from app.llms.factory import get_llm_instance
-from app.supervisor.chatbot import get_supervisor_chatbot
+from app.supervisor.registry import get_shared_chatbot, is_chatbot_built
+from app.utils.chat_history import get_chat_history_store
+from app.utils.render_buffer import RenderBuffer
 from app.utils.ui_constants import (
+    CHAT_HISTORY_PAGE_SIZE,
     GREETING_MESSAGE,
+    LOAD_OLDER_MESSAGES_LABEL,
     MODEL_INITIALIZING_MESSAGE,
     MODEL_LOADING_ERROR_MESSAGE,
     MODEL_SETTING_MESSAGE,
+    RENDER_INTERVAL,
+    RENDER_MAX_PENDING_CHARS,
 )
 
 # Session Helpers
@@ -22,39 +25,29 @@ def get_session_id() -> str:
     return st.session_state["session_id"]
 
 
-def get_session_checkpointer() -> Checkpoint:
-    """Get the session checkpointer"""
-    if "checkpointer" not in st.session_state:
-        st.session_state["checkpointer"] = InMemorySaver()
-    return st.session_state["checkpointer"]
-
-
 def get_chatbot(model_provider: str, model_version: str, temperature: float, logger):
+    """Get the process-wide chatbot of the selected model configuration"""
     current_config = {
         "model_provider": model_provider,
         "model_version": model_version,
         "temperature": temperature,
     }
 
-    if "chatbot" not in st.session_state or st.session_state.model_config != current_config:
+    if is_chatbot_built(model_provider, model_version, temperature):
+        chatbot = get_shared_chatbot(logger, model_provider, model_version, temperature)
+    else:
         with st.spinner(MODEL_INITIALIZING_MESSAGE):
-            llm = get_llm_instance(
-                log=logger,
-                provider=model_provider,
-                version=model_version,
-                temperature=temperature,
-            )
-
-            if not llm:
-                st.error(MODEL_LOADING_ERROR_MESSAGE)
-                st.stop()
+            chatbot = get_shared_chatbot(logger, model_provider, model_version, temperature)
 
-            st.session_state.chatbot = get_supervisor_chatbot(llm, get_session_checkpointer())
-            st.session_state.model_config = current_config
+    if not chatbot:
+        st.error(MODEL_LOADING_ERROR_MESSAGE)
+        st.stop()
 
+    if st.session_state.get("model_config") != current_config:
+        st.session_state.model_config = current_config
         st.success(MODEL_SETTING_MESSAGE)
 
-    return st.session_state.chatbot
+    return chatbot
 
 ### UI Helpers
 
@@ -64,18 +57,53 @@ def print_message(message, role, save=True):
     with st.chat_message(role):
         st.markdown(message, unsafe_allow_html=True)
     if save:
-        st.session_state.messages.append({"content": message, "role": role})
+        save_message(message, role)
+
+
+def create_render_buffer(container, method: str = "markdown") -> RenderBuffer:
+    """Create a buffer streaming markdown into a container, one element per block
+
+    Args:
+        container: Streamlit container to render into
+        method (str): element method rendering a block (e.g. "markdown", "caption")
+
+    Returns:
+        RenderBuffer: buffer to append the streamed tokens to
+    """
+    blocks = []
+
+    def render_block(index: int, text: str):
+        while len(blocks) <= index:
+            blocks.append(container.empty())
+        getattr(blocks[index], method)(text)
+
+    return RenderBuffer(render_block, RENDER_INTERVAL, RENDER_MAX_PENDING_CHARS)
 
 
 def save_message(message, role):
-    """Save a message to the session state"""
-    st.session_state.messages.append({"content": message, "role": role})
+    """Save a message to the chat history of the session"""
+    get_chat_history_store().append(get_session_id(), role, message)
+
+
+def _load_older_messages():
+    st.session_state.history_window += CHAT_HISTORY_PAGE_SIZE
 
 
 def print_messages():
-    """Print all messages in the session state"""
-    for message in st.session_state.messages:
-        print_message(message["content"], message["role"], save=False)
+    """Print the last page(s) of the chat history of the session
+
+    Only `history_window` messages are loaded and rendered; older ones are
+    shown on demand, so a rerun costs the same however long the chat is.
+    """
+    if "history_window" not in st.session_state:
+        st.session_state.history_window = CHAT_HISTORY_PAGE_SIZE
+
+    store = get_chat_history_store()
+    session_id = get_session_id()
+    if store.count(session_id) > st.session_state.history_window:
+        st.button(LOAD_OLDER_MESSAGES_LABEL, on_click=_load_older_messages)
+    for role, content in store.get_last(session_id, st.session_state.history_window):
+        print_message(content, role, save=False)
 
 
 def print_greeting_message():
@@ -0,0 +1,218 @@
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+DEFAULT_ENCODING = "cl100k_base"
+APPROX_CHARS_PER_TOKEN = 4
+
+# Encodings of the model families tokenized locally, by model name prefix (others use the default)
+MODEL_ENCODINGS = (
+    ("gpt-4o", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+)
+
+# Chat format overheads, as counted for OpenAI chat models
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+TOKENS_PER_TOOL_CALL_ID = 3
+REPLY_PRIMING_TOKENS = 3
+
+# Messages whose token counts are kept by a message token counter (the summarizer keeps one
+# counter per conversation thread, evicted with the thread)
+MESSAGE_TOKEN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str) -> Optional[Any]:
+    """Load a tiktoken encoding once, or None if it is unavailable (e.g. offline)"""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(encoding_name)
+    except Exception:
+        return None
+
+
+def count_text_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """Count the tokens of a text locally
+
+    Args:
+        text (str): text to count
+        encoding_name (str): tiktoken encoding name
+
+    Returns:
+        int: number of tokens, approximated from the length if the encoding is unavailable
+    """
+    encoding = _get_encoding(encoding_name)
+    if encoding is None:
+        return -(-len(text) // APPROX_CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def get_model_encoding(model_name: str) -> str:
+    """Return the tiktoken encoding of a model family"""
+    for prefix, encoding_name in MODEL_ENCODINGS:
+        if model_name.startswith(prefix):
+            return encoding_name
+    return DEFAULT_ENCODING
+
+
+def _get_message_text(message: BaseMessage) -> str:
+    """Return the text of a message as tokenized: content, then tool calls"""
+    if isinstance(message.content, str):
+        parts = [message.content]
+    else:
+        parts = [
+            block if isinstance(block, str) else block.get("text", "")
+            for block in message.content
+        ]
+    if isinstance(message, AIMessage):
+        parts.extend(
+            json.dumps({"name": call["name"], "args": call["args"]}, ensure_ascii=False)
+            for call in message.tool_calls
+        )
+    return "".join(parts)
+
+
+class MessageTokenCounter:
+    """Local token counter of chat messages caching the count of each message.
+
+    Counting the history before every model call re-tokenizes every message
+    (and some providers count tokens through an API call). Counts are cached
+    by message id and content, so a step only tokenizes the messages it has
+    not seen. Counts follow the OpenAI chat format, an approximation for the
+    other providers.
+
+    Args:
+        encoding_name (str): tiktoken encoding name
+        cache_size (int): messages whose counts are kept
+    """
+
+    def __init__(self, encoding_name: str, cache_size: int):
+        self._encoding_name = encoding_name
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int, int], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    @property
+    def encoding_name(self) -> str:
+        return self._encoding_name
+
+    def _count_message(self, message: BaseMessage) -> int:
+        text = _get_message_text(message)
+        tokens = TOKENS_PER_MESSAGE + count_text_tokens(text, self._encoding_name)
+        if message.name:
+            tokens += TOKENS_PER_NAME
+        if isinstance(message, ToolMessage):
+            tokens += TOKENS_PER_TOOL_CALL_ID
+        return tokens
+
+    def count_message(self, message: BaseMessage) -> int:
+        """Count the tokens of a message, from the cache when it was counted before"""
+        if message.id is None:
+            return self._count_message(message)
+
+        # str hashes are cached by the string, so keying by the content is cheap
+        content = message.content
+        if not isinstance(content, str):
+            content = _get_message_text(message)
+        tool_calls = len(message.tool_calls) if isinstance(message, AIMessage) else 0
+        key = (message.id, hash(content), tool_calls)
+        with self._lock:
+            tokens = self._cache.get(key)
+            if tokens is not None:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                return tokens
+            self._stats["misses"] += 1
+
+        tokens = self._count_message(message)
+        with self._lock:
+            self._cache[key] = tokens
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def __call__(self, messages: Sequence[BaseMessage]) -> int:
+        """Count the tokens of messages (a `token_counter` of SummarizationNode)"""
+        return REPLY_PRIMING_TOKENS + sum(self.count_message(message) for message in messages)
+
+    def get_stats(self) -> Dict:
+        """Get the stats of the counter"""
+        with self._lock:
+            total = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / total if total else 0.0,
+                "cached_messages": len(self._cache),
+            }
+
+
+_message_token_counters: Dict[str, MessageTokenCounter] = {}
+_message_token_counters_lock = threading.Lock()
+
+
+def get_message_token_counter(model_name: str) -> MessageTokenCounter:
+    """Get the process-wide message token counter of a model family"""
+    encoding_name = get_model_encoding(model_name)
+    with _message_token_counters_lock:
+        if encoding_name not in _message_token_counters:
+            _message_token_counters[encoding_name] = MessageTokenCounter(
+                encoding_name, MESSAGE_TOKEN_CACHE_SIZE
+            )
+        return _message_token_counters[encoding_name]
+
+
+if __name__ == "__main__":
+    # Benchmark: counting the history before each of 150 supervisor steps
+    import random
+    import time
+
+    from langchain_core.messages import HumanMessage
+
+    rng = random.Random(0)
+    places = ["성산일출봉", "우도", "한라산", "협재 해수욕장", "동문시장", "섭지코지", "오설록"]
+
+    def make_text(size: int) -> str:
+        return " ".join(rng.choice(places) + str(rng.randint(0, 999)) for _ in range(size))
+
+    history = []
+    for turn in range(50):
+        call = {"name": "naver_blog_search", "args": {"query": make_text(3)}, "id": f"c{turn}"}
+        history += [
+            HumanMessage(make_text(30), id=f"h{turn}"),
+            AIMessage("", tool_calls=[call], id=f"a{turn}"),
+            ToolMessage(make_text(600), tool_call_id=f"c{turn}", id=f"t{turn}"),
+        ]
+
+    def run(counter) -> Tuple[float, int]:
+        start = time.perf_counter()
+        for step in range(1, len(history) + 1):
+            tokens = counter(history[:step])
+        return time.perf_counter() - start, tokens
+
+    baselines = {"full recount": lambda messages: REPLY_PRIMING_TOKENS + sum(
+        MessageTokenCounter(DEFAULT_ENCODING, 0)._count_message(m) for m in messages
+    )}
+    try:
+        from langchain_openai import ChatOpenAI
+
+        llm = ChatOpenAI(model="gpt-4o-mini", api_key="benchmark")
+        llm.get_num_tokens_from_messages(history[:1])
+        baselines["ChatOpenAI.get_num_tokens_from_messages"] = llm.get_num_tokens_from_messages
+    except Exception as e:
+        print(f"ChatOpenAI counter unavailable: {e.__class__.__name__}")
+
+    encoding = "tiktoken" if _get_encoding(DEFAULT_ENCODING) else "length approximation"
+    print(f"{len(history)} messages, {encoding}")
+    for name, counter in baselines.items():
+        elapsed, tokens = run(counter)
+        print(f"{name:>40}: {elapsed * 1000:8.1f} ms ({tokens} tokens at the last step)")
+    counter = MessageTokenCounter(DEFAULT_ENCODING, MESSAGE_TOKEN_CACHE_SIZE)
+    elapsed, tokens = run(counter)
+    print(f"{'cached':>40}: {elapsed * 1000:8.1f} ms ({tokens} tokens at the last step)")
@@ -0,0 +1,306 @@
+import asyncio
+import functools
+import json
+import pickle
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from langchain_core.tools import BaseTool
+
+from app.utils.cache_constants import (
+    TOOL_CACHE_FILE,
+    TOOL_CACHE_MEMORY_SIZE,
+    TOOL_CACHE_WAIT_TIMEOUT,
+)
+from app.utils.env_constants import CACHE_DIR
+from app.utils.tool_wrappers import wrap_tool
+
+MEMORY_TIER = "memory"
+DISK_TIER = "disk"
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize tool input so that trivially different queries share a key"""
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFC", value).casefold().split())
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def make_cache_key(tool_name: str, args: Tuple, kwargs: Dict) -> str:
+    """Build the cache key of a tool call from its normalized input"""
+    payload = json.dumps(
+        {"args": _normalize(list(args)), "kwargs": _normalize(kwargs)},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return f"{tool_name}:{payload}"
+
+
+def _is_error_result(result: Any) -> bool:
+    """Return whether a tool result is one of the error payloads of the tools"""
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list):
+        return any(isinstance(item, dict) and "error" in item for item in result)
+    return False
+
+
+class ToolResultCache:
+    """Two-tier cache of tool results: an in-memory LRU in front of SQLite.
+
+    Concurrent calls with the same key, sync or async, share a single in-flight
+    computation instead of all hitting the network.
+    """
+
+    def __init__(self, path: Path, memory_size: int):
+        self._memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tool_results (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _get_memory(self, key: str) -> Tuple[bool, Any]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._memory[key]
+            return False, None
+        self._memory.move_to_end(key)
+        return True, value
+
+    def _set_memory(self, key: str, value: Any, expires_at: float):
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Tuple[Optional[str], Any]:
+        """Return the tier holding a fresh value of the key and the value"""
+        with self._lock:
+            found, value = self._get_memory(key)
+            if found:
+                return MEMORY_TIER, value
+
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM tool_results WHERE key = ? AND expires_at >= ?",
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                return None, None
+            value = pickle.loads(zlib.decompress(row[0]))
+            self._set_memory(key, value, row[1])
+            return DISK_TIER, value
+
+    def _store(self, key: str, value: Any, ttl_seconds: int):
+        expires_at = time.time() + ttl_seconds
+        blob = zlib.compress(pickle.dumps(value))
+        with self._lock:
+            self._set_memory(key, value, expires_at)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?)", (key, blob, expires_at)
+            )
+            self._conn.execute("DELETE FROM tool_results WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+
+    def _claim(self, key: str) -> Tuple[Future, bool]:
+        """Return the in-flight future of a key and whether the caller must compute it"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def _settle(
+        self, key: str, future: Future, result: Any = None, error: BaseException = None
+    ):
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # The leader was cancelled (or interrupted): the waiting callers compute it again
+            future.cancel()
+
+    def _record(self, tool_name: str, event: str):
+        self._stats[tool_name][event] += 1
+
+    def call(self, tool_name: str, key: str, ttl_seconds: int, compute: Callable[[], Any]) -> Any:
+        """Return the cached result of a key, computing it at most once (synchronous)"""
+        tier, value = self._lookup(key)
+        if tier is not None:
+            self._record(tool_name, f"{tier}_hits")
+            return value
+
+        future, is_leader = self._claim(key)
+        if not is_leader:
+            self._record(tool_name, "coalesced")
+            try:
+                return future.result(timeout=TOOL_CACHE_WAIT_TIMEOUT)
+            except CancelledError:
+                return self.call(tool_name, key, ttl_seconds, compute)
+            except FutureTimeoutError:
+                # A stuck leader must not block this call: compute it without caching
+                return compute()
+
+        self._record(tool_name, "misses")
+        try:
+            result = compute()
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        try:
+            if not _is_error_result(result):
+                self._store(key, result, ttl_seconds)
+        finally:
+            self._settle(key, future, result=result)
+        return result
+
+    async def acall(self, tool_name: str, key: str, ttl_seconds: int, compute: Callable) -> Any:
+        """Return the cached result of a key, computing it at most once (asynchronous)"""
+        tier, value = await asyncio.to_thread(self._lookup, key)
+        if tier is not None:
+            self._record(tool_name, f"{tier}_hits")
+            return value
+
+        future, is_leader = self._claim(key)
+        if not is_leader:
+            self._record(tool_name, "coalesced")
+            try:
+                # Shielded so that cancelling this caller does not cancel the shared future
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.acall(tool_name, key, ttl_seconds, compute)
+
+        self._record(tool_name, "misses")
+        try:
+            result = await compute()
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        try:
+            if not _is_error_result(result):
+                await asyncio.to_thread(self._store, key, result, ttl_seconds)
+        finally:
+            self._settle(key, future, result=result)
+        return result
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get the hit/miss counters and hit rate of each tool"""
+        stats = {}
+        for tool_name, counters in self._stats.items():
+            hits = counters[f"{MEMORY_TIER}_hits"] + counters[f"{DISK_TIER}_hits"]
+            calls = hits + counters["misses"] + counters["coalesced"]
+            stats[tool_name] = {
+                **counters,
+                "hit_rate": (hits + counters["coalesced"]) / calls if calls else 0.0,
+            }
+        return stats
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM tool_results")
+            self._conn.commit()
+
+
+# Global cache instance
+_cache = ToolResultCache(Path(CACHE_DIR) / TOOL_CACHE_FILE, TOOL_CACHE_MEMORY_SIZE)
+
+
+def cache_tool(tool: BaseTool, ttl_seconds: int) -> BaseTool:
+    """Return a copy of a tool whose results are cached
+
+    Args:
+        tool (BaseTool): tool to cache, e.g. one built by `Tool.from_function`
+        ttl_seconds (int): how long results of this tool stay valid
+
+    Returns:
+        BaseTool: cached tool
+    """
+
+    def wrap_func(func):
+        @functools.wraps(func)
+        def cached_func(*args, **kwargs):
+            key = make_cache_key(tool.name, args, kwargs)
+            return _cache.call(tool.name, key, ttl_seconds, lambda: func(*args, **kwargs))
+
+        return cached_func
+
+    def wrap_coroutine(coroutine):
+        @functools.wraps(coroutine)
+        async def cached_coroutine(*args, **kwargs):
+            key = make_cache_key(tool.name, args, kwargs)
+            return await _cache.acall(
+                tool.name, key, ttl_seconds, lambda: coroutine(*args, **kwargs)
+            )
+
+        return cached_coroutine
+
+    return wrap_tool(tool, wrap_func, wrap_coroutine)
+
+
+def get_tool_cache_stats() -> Dict[str, Dict]:
+    """Get the per-tool stats of the tool cache"""
+    return _cache.get_stats()
+
+
+def clear_tool_cache():
+    """Clear the tool cache"""
+    _cache.clear()
+
+
+if __name__ == "__main__":
+    # Test
+    from langchain_core.tools import Tool
+
+    def slow_search(query: str):
+        time.sleep(0.5)
+        return [{"title": f"result of {query}"}]
+
+    tool = cache_tool(
+        Tool.from_function(name="slow_search", func=slow_search, description="test"),
+        ttl_seconds=60,
+    )
+    threads = [threading.Thread(target=tool.invoke, args=("제주  여행",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(tool.invoke("제주 여행"))
+    print(get_tool_cache_stats())
@@ -0,0 +1,159 @@
+import threading
+from typing import Dict, List, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.tools import BaseTool, tool
+from langgraph.prebuilt import InjectedState
+from typing_extensions import Annotated
+
+from app.utils.token_counter import get_message_token_counter
+from app.utils.tool_history_constants import (
+    RECALL_TOOL_DESCRIPTION,
+    RECALL_TOOL_NAME,
+    TOOL_DIGEST_CHARS,
+    TOOL_DIGEST_PREFIX,
+    TOOL_HISTORY_KEEP_LAST_STEPS,
+    TOOL_HISTORY_MAX_TOKENS,
+)
+
+
+class ToolHistoryPolicy:
+    """History policy of the tool results sent to the model of a ReAct agent.
+
+    Every model step of a ReAct loop resends all the earlier tool results
+    (search result lists, blog pages, documents) although the model already
+    read them, so the prompt grows with every step. The policy replaces, in
+    the model input only, the results read for `keep_last_steps` steps or over
+    `max_tokens` once read by a digest: the head of the result and the id to
+    get the full result back with the recall tool. The agent state keeps the
+    original messages, which the recall tool reads.
+
+    Args:
+        keep_last_steps (int): model steps a tool result is sent verbatim
+        max_tokens (int): tokens over which a tool result is digested after one step
+        digest_chars (int): characters of the result kept in a digest
+    """
+
+    def __init__(self, keep_last_steps: int, max_tokens: int, digest_chars: int):
+        self._keep_last_steps = keep_last_steps
+        self._max_tokens = max_tokens
+        self._digest_chars = digest_chars
+        self._token_counter = get_message_token_counter("")
+        self._lock = threading.Lock()
+        self._stats = {"digested": 0, "tokens_saved": 0}
+
+    def _is_aged_out(self, message: ToolMessage, steps: int) -> bool:
+        if steps == 0:
+            return False
+        return (
+            steps >= self._keep_last_steps
+            or self._token_counter.count_message(message) > self._max_tokens
+        )
+
+    def _make_digest(self, message: ToolMessage) -> ToolMessage:
+        text = " ".join(message.text().split())
+        if len(text) <= self._digest_chars:
+            return message
+        digest = (
+            f"{TOOL_DIGEST_PREFIX} {text[: self._digest_chars]}... "
+            f"({len(text) - self._digest_chars} more characters, call {RECALL_TOOL_NAME} "
+            f'with tool_call_id="{message.tool_call_id}" for the full result)'
+        )
+        return message.model_copy(update={"content": digest})
+
+    def apply(self, messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+        """Replace the aged-out tool results of a model input by their digests
+
+        Args:
+            messages (Sequence[BaseMessage]): model input messages
+
+        Returns:
+            List[BaseMessage]: messages with the aged-out tool results digested
+        """
+        digested = []
+        steps = 0  # Model steps which already read the message
+        tokens_saved = 0
+        for message in reversed(messages):
+            if isinstance(message, AIMessage):
+                steps += 1
+            elif isinstance(message, ToolMessage) and self._is_aged_out(message, steps):
+                digest = self._make_digest(message)
+                if digest is not message:
+                    tokens_saved += self._token_counter.count_message(
+                        message
+                    ) - self._token_counter.count_message(digest)
+                    message = digest
+            digested.append(message)
+        digested.reverse()
+
+        if tokens_saved:
+            with self._lock:
+                self._stats["digested"] += 1
+                self._stats["tokens_saved"] += tokens_saved
+        return digested
+
+    def get_stats(self) -> Dict:
+        """Get the stats of the policy (`digested` counts the model inputs with digests)"""
+        with self._lock:
+            return dict(self._stats)
+
+
+def create_recall_tool() -> BaseTool:
+    """Create the tool returning the full result of a digested tool call"""
+
+    @tool(RECALL_TOOL_NAME, description=RECALL_TOOL_DESCRIPTION)
+    def recall_tool_result(
+        tool_call_id: Annotated[str, "tool_call_id given in the digest"],
+        messages: Annotated[List[BaseMessage], InjectedState("messages")],
+    ) -> str:
+        for message in reversed(messages):
+            if isinstance(message, ToolMessage) and message.tool_call_id == tool_call_id:
+                return message.text()
+        return f"No tool result found for tool_call_id {tool_call_id}"
+
+    return recall_tool_result
+
+
+# Global policy instance
+_policy = ToolHistoryPolicy(
+    TOOL_HISTORY_KEEP_LAST_STEPS, TOOL_HISTORY_MAX_TOKENS, TOOL_DIGEST_CHARS
+)
+
+
+def get_tool_history_policy() -> ToolHistoryPolicy:
+    """Get the process-wide tool history policy"""
+    return _policy
+
+
+def get_tool_history_stats() -> Dict:
+    """Get the stats of the tool history policy"""
+    return _policy.get_stats()
+
+
+if __name__ == "__main__":
+    # Benchmark: prompt tokens of each step of a planner loop reading blog pages
+    import random
+
+    from langchain_core.messages import HumanMessage
+
+    rng = random.Random(0)
+    places = ["성산일출봉", "우도", "한라산", "협재 해수욕장", "동문시장", "섭지코지", "오설록"]
+
+    def make_blog_page() -> str:
+        return "\n".join(
+            f"{day}일차 {rng.randint(7, 11)}시에 {rng.choice(places)}에 도착했어요. "
+            f"입장료 {rng.randint(1, 9)}천원, 웨이팅 {rng.randint(0, 90)}분."
+            for day in range(1, 40)
+        )
+
+    messages: List[BaseMessage] = [HumanMessage("제주도 3박 4일 일정을 짜줘", id="h")]
+    counter = get_message_token_counter("")
+    print(f"{'step':>4} {'verbatim':>9} {'digested':>9}")
+    for step in range(1, 13):
+        print(f"{step:>4} {counter(messages):>9} {counter(_policy.apply(messages)):>9}")
+        tool_call = {"name": "web_loader", "args": {"query": "제주 일정"}, "id": f"c{step}"}
+        messages += [
+            AIMessage("", id=f"a{step}", tool_calls=[tool_call]),
+            ToolMessage(make_blog_page(), tool_call_id=f"c{step}", id=f"t{step}"),
+        ]
+    print(_policy.get_stats())
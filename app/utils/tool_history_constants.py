@@ -0,0 +1,12 @@
+# Tool results stay verbatim in the model input for this many model steps after they arrive
+TOOL_HISTORY_KEEP_LAST_STEPS = 2
+# Tool results over this many tokens are digested as soon as the model has read them once
+TOOL_HISTORY_MAX_TOKENS = 1500
+TOOL_DIGEST_CHARS = 300
+TOOL_DIGEST_PREFIX = "[digest]"
+
+RECALL_TOOL_NAME = "recall_tool_result"
+RECALL_TOOL_DESCRIPTION = """
+Get the full result of an earlier tool call whose result was shortened to a digest.
+Only use it when the digest lacks details you need.
+"""
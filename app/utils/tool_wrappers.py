@@ -0,0 +1,42 @@
+from typing import Any, Awaitable, Callable
+
+from langchain_core.tools import BaseTool, StructuredTool, Tool
+
+SyncWrapper = Callable[[Callable[..., Any]], Callable[..., Any]]
+AsyncWrapper = Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]
+
+
+def wrap_tool(tool: BaseTool, wrap_func: SyncWrapper, wrap_coroutine: AsyncWrapper) -> BaseTool:
+    """Return a copy of a tool whose sync and async entry points are wrapped.
+
+    `Tool` and `StructuredTool` instances keep their own functions (and their
+    class), any other `BaseTool` is exposed as a `StructuredTool` with the same
+    name, description and args schema which delegates to the original tool.
+
+    Args:
+        tool (BaseTool): tool to wrap
+        wrap_func (SyncWrapper): decorator applied to the synchronous function
+        wrap_coroutine (AsyncWrapper): decorator applied to the coroutine
+
+    Returns:
+        BaseTool: wrapped tool
+    """
+    if isinstance(tool, (Tool, StructuredTool)):
+        func, coroutine = tool.func, tool.coroutine
+    else:
+
+        def func(**kwargs):
+            return tool.invoke(kwargs)
+
+        async def coroutine(**kwargs):
+            return await tool.ainvoke(kwargs)
+
+    tool_class = Tool if isinstance(tool, Tool) else StructuredTool
+    return tool_class(
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+        return_direct=tool.return_direct,
+        func=wrap_func(func) if func is not None else None,
+        coroutine=wrap_coroutine(coroutine) if coroutine is not None else None,
+    )
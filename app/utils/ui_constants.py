@@ -61,3 +61,21 @@ MODEL_LOADING_ERROR_MESSAGE = """
 THINKING_MESSAGE = "🤔 생각 중..."
 MODEL_INITIALIZING_MESSAGE = "🤖 모델 초기화 중..."
 MODEL_SETTING_MESSAGE = "✅ 모델 설정 완료!"
+PROGRESS_DONE_MESSAGE = "✅ 완료"
+AGENT_LABELS = {
+    "trip_planner_supervisor": "🧭 여행 플래너",
+    "research_agent": "🔎 리서치 에이전트",
+    "planner_agent": "🗺️ 플래닝 에이전트",
+    "calendar_agent": "📅 캘린더 에이전트",
+    "twitter_agent": "🐦 트위터 에이전트",
+}
+
+# Streamed text is re-rendered at most every interval, or once this many characters are pending
+RENDER_INTERVAL = 0.1
+RENDER_MAX_PENDING_CHARS = 400
+
+# Chat history: messages rendered per page (older pages are loaded on demand) and retention
+CHAT_HISTORY_DB_FILE = "chat_history.sqlite3"
+CHAT_HISTORY_PAGE_SIZE = 20
+CHAT_HISTORY_IDLE_TTL = 60 * 60 * 24 * 7
+LOAD_OLDER_MESSAGES_LABEL = "⬆️ 이전 메시지 더 보기"